@@ -1,16 +1,65 @@
-from zeep.client import AsyncClient, CachingClient, Client
-from zeep.plugins import Plugin
-from zeep.settings import Settings
-from zeep.transports import Transport
-from zeep.xsd.valueobjects import AnyObject
+import importlib
+import typing
 
 __version__ = "4.3.2"
 __all__ = [
     "AsyncClient",
     "CachingClient",
     "Client",
+    "ClientPool",
     "Plugin",
     "Settings",
     "Transport",
     "AnyObject",
 ]
+
+if typing.TYPE_CHECKING:
+    from zeep.client import AsyncClient, CachingClient, Client
+    from zeep.plugins import Plugin
+    from zeep.pool import ClientPool
+    from zeep.settings import Settings
+    from zeep.transports import Transport
+    from zeep.xsd.valueobjects import AnyObject
+
+# The public objects are imported when they are first used, so that
+# `import zeep` doesn't import the wsdl and xsd modules and their dependencies
+_lazy_imports = {
+    "AsyncClient": "zeep.client",
+    "CachingClient": "zeep.client",
+    "Client": "zeep.client",
+    "ClientPool": "zeep.pool",
+    "Plugin": "zeep.plugins",
+    "Settings": "zeep.settings",
+    "Transport": "zeep.transports",
+    "AnyObject": "zeep.xsd.valueobjects",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _lazy_imports[name]
+    except KeyError:
+        return _import_submodule(name)
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name):
+    """Return the submodule with the given name. These were always available
+    after `import zeep` since the package imported the client.
+
+    """
+    module_name = "%s.%s" % (__name__, name)
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module(module_name)
+        except ModuleNotFoundError as exc:
+            if exc.name != module_name:
+                raise
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,18 @@
 import argparse
 import logging
 import logging.config
+import sys
 import time
 from urllib.parse import urlparse
 
 import requests
 
+from zeep import bundle, codegen
 from zeep.cache import SqliteCache
 from zeep.client import Client
 from zeep.settings import Settings
 from zeep.transports import Transport
+from zeep.wsdl import Document
 
 logger = logging.getLogger("zeep")
 
@@ -33,6 +36,81 @@ def parse_arguments(args=None):
     return parser.parse_args(args)
 
 
+def parse_bundle_arguments(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m zeep bundle",
+        description="Create an offline bundle of a WSDL and all its documents",
+    )
+    parser.add_argument("wsdl_file", type=str, help="Path or URL to the WSDL file")
+    parser.add_argument(
+        "-o", "--output", required=True, help="Path of the bundle to create"
+    )
+    parser.add_argument("--cache", action="store_true", help="Enable cache")
+    parser.add_argument(
+        "--no-verify", action="store_true", help="Disable SSL verification"
+    )
+    parser.add_argument(
+        "--no-strict", action="store_true", default=False, help="Disable strict mode"
+    )
+    return parser.parse_args(args)
+
+
+def parse_codegen_arguments(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m zeep codegen",
+        description="Generate a python module for the operations of a WSDL",
+    )
+    parser.add_argument("wsdl_file", type=str, help="Path or URL to the WSDL file")
+    parser.add_argument(
+        "-o", "--output", required=True, help="Path of the module to create"
+    )
+    parser.add_argument("--service", help="Name of the service (default: first)")
+    parser.add_argument("--port", help="Name of the port (default: first)")
+    parser.add_argument("--cache", action="store_true", help="Enable cache")
+    parser.add_argument(
+        "--no-verify", action="store_true", help="Disable SSL verification"
+    )
+    parser.add_argument(
+        "--no-strict", action="store_true", default=False, help="Disable strict mode"
+    )
+    return parser.parse_args(args)
+
+
+def create_transport(args):
+    cache = SqliteCache() if args.cache else None
+    session = requests.Session()
+
+    if args.no_verify:
+        session.verify = False
+
+    result = urlparse(args.wsdl_file)
+    if result.username or result.password:
+        session.auth = (result.username, result.password)
+
+    return Transport(cache=cache, session=session)
+
+
+def create_bundle(args):
+    transport = create_transport(args)
+    settings = Settings(strict=not args.no_strict)
+    urls = bundle.create(
+        args.wsdl_file, args.output, transport=transport, settings=settings
+    )
+    for url in urls:
+        print(url)
+    print("Created %s with %d documents" % (args.output, len(urls)))
+
+
+def create_module(args):
+    transport = create_transport(args)
+    settings = Settings(strict=not args.no_strict)
+    document = Document(args.wsdl_file, transport=transport, settings=settings)
+    source = codegen.generate(document, service=args.service, port=args.port)
+    with open(args.output, "w", encoding="utf-8") as fh:
+        fh.write(source)
+    print("Created %s" % args.output)
+
+
 def main(args):
     if args.verbose:
         logging.config.dictConfig(
@@ -62,17 +140,7 @@ def main(args):
         profile = cProfile.Profile()
         profile.enable()
 
-    cache = SqliteCache() if args.cache else None
-    session = requests.Session()
-
-    if args.no_verify:
-        session.verify = False
-
-    result = urlparse(args.wsdl_file)
-    if result.username or result.password:
-        session.auth = (result.username, result.password)
-
-    transport = Transport(cache=cache, session=session)
+    transport = create_transport(args)
     st = time.time()
 
     settings = Settings(strict=not args.no_strict)
@@ -86,5 +154,9 @@ def main(args):
 
 
 if __name__ == "__main__":
-    args = parse_arguments()
-    main(args)
+    if sys.argv[1:2] == ["bundle"]:
+        create_bundle(parse_bundle_arguments(sys.argv[2:]))
+    elif sys.argv[1:2] == ["codegen"]:
+        create_module(parse_codegen_arguments(sys.argv[2:]))
+    else:
+        main(parse_arguments())
@@ -0,0 +1,233 @@
+"""
+zeep.bundle
+~~~~~~~~~~~
+
+Offline bundles of a wsdl and all the documents it (transitively) imports or
+includes. A bundle is a zip archive with the unmodified documents and a
+manifest which maps the original locations of the documents to the files in
+the archive, together with the checksums of the documents.
+
+Create a bundle via the command line::
+
+    python -m zeep bundle http://example.com/?wsdl -o service.zip
+
+And pass the path of the bundle as wsdl to the client, the documents are
+then loaded from the bundle without any network access::
+
+    client = zeep.Client("service.zip")
+
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import zipfile
+
+from zeep.exceptions import BundleError, TransportError
+from zeep.loader import is_relative_path
+from zeep.settings import Settings
+from zeep.transports import Transport
+from zeep.utils import get_version
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BundleTransport", "create", "is_bundle"]
+
+#: The version of the bundle format, increment on incompatible changes
+BUNDLE_FORMAT = 1
+
+MANIFEST_NAME = "manifest.json"
+
+# The fixed size part of the local file header of a zip archive
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+
+
+class _RecordingTransport:
+    """Proxy for the transport which records all documents which are
+    loaded.
+
+    """
+
+    def __init__(self, transport):
+        self._transport = transport
+        self.documents = {}
+
+    def load(self, url):
+        content = self._transport.load(url)
+        self.documents[url] = content
+        return content
+
+    def __getattr__(self, key):
+        return getattr(self._transport, key)
+
+
+class BundleTransport:
+    """Transport which loads the wsdl and xsd documents from a bundle.
+
+    Documents are never retrieved over the network, all other requests (the
+    operations) are handled by the given transport. The archive is memory
+    mapped and the documents are stored uncompressed, so loading a document
+    is a single copy from the page cache.
+
+    :param path: The path of the bundle
+    :type path: str
+    :param transport: The transport for the operations
+    :type transport: zeep.transports.Transport
+    :param verify: Verify the checksum of the documents when they are loaded
+    :type verify: bool
+
+    """
+
+    def __init__(self, path, transport=None, verify=True):
+        self.path = path
+        self.transport = transport if transport is not None else Transport()
+        self._verify = verify
+
+        try:
+            with open(path, "rb") as fh:
+                self._data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            with zipfile.ZipFile(path) as archive:
+                manifest = json.loads(archive.read(MANIFEST_NAME))
+                members = {info.filename: info for info in archive.infolist()}
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+            raise BundleError("Unable to open bundle %s: %s" % (path, exc))
+
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise BundleError("Unsupported bundle format %r" % manifest.get("format"))
+
+        self.manifest = manifest
+        self._documents = {}
+        for document in manifest["documents"]:
+            info = members.get(document["path"])
+            if info is None or info.compress_type != zipfile.ZIP_STORED:
+                raise BundleError("Invalid entry %s in bundle" % document["path"])
+            self._documents[document["url"]] = (document, info)
+
+    @property
+    def location(self):
+        """The location of the wsdl the bundle is created from."""
+        return self.manifest["location"]
+
+    @property
+    def urls(self):
+        """The original locations of the documents in the bundle."""
+        return list(self._documents)
+
+    def load(self, url):
+        """Return the content of the document with the given location."""
+        try:
+            document, info = self._documents[url]
+        except KeyError:
+            raise TransportError(
+                "The document %s is not in the bundle %s" % (url, self.path)
+            )
+
+        offset = info.header_offset
+        header = _LOCAL_HEADER.unpack_from(self._data, offset)
+        start = offset + _LOCAL_HEADER.size + header[9] + header[10]
+        content = self._data[start : start + info.file_size]
+
+        if self._verify and hashlib.sha256(content).hexdigest() != document["sha256"]:
+            raise BundleError("The checksum of %s in the bundle is invalid" % url)
+        return content
+
+    async def load_async(self, url):
+        return self.load(url)
+
+    def close(self):
+        self._data.close()
+        if hasattr(self.transport, "close"):
+            self.transport.close()
+
+    def __getattr__(self, key):
+        return getattr(self.transport, key)
+
+
+def is_bundle(path):
+    """Return boolean indicating if the given location is a bundle.
+
+    :param path: The location of the wsdl
+    :type path: str
+    :rtype: bool
+
+    """
+    if not isinstance(path, str) or not os.path.isfile(path):
+        return False
+    with open(path, "rb") as fh:
+        if fh.read(4) != b"PK\x03\x04":
+            return False
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return MANIFEST_NAME in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def create(location, path, transport=None, settings=None):
+    """Create a bundle of the wsdl at the given location and all documents it
+    imports or includes.
+
+    The wsdl is fully processed to find all documents, the archive is written
+    atomically.
+
+    :param location: The location of the wsdl
+    :type location: str
+    :param path: The path of the bundle
+    :type path: str
+    :param transport: The transport to retrieve the documents
+    :type transport: zeep.transports.Transport
+    :param settings: The settings object
+    :type settings: zeep.settings.Settings
+    :returns: The original locations of the documents in the bundle
+    :rtype: list
+
+    """
+    from zeep.wsdl import Document
+
+    transport = transport if transport is not None else Transport()
+    settings = settings or Settings()
+    if is_relative_path(location):
+        location = os.path.abspath(location)
+
+    recorder = _RecordingTransport(transport)
+    Document(location, recorder, settings=settings)
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": get_version(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "location": location,
+        "documents": [],
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".zeep-bundle-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            with zipfile.ZipFile(fh, "w", compression=zipfile.ZIP_STORED) as archive:
+                for i, (url, content) in enumerate(recorder.documents.items()):
+                    if isinstance(content, str):
+                        content = content.encode("utf-8")
+                    name = "documents/%04d.xml" % i
+                    archive.writestr(name, content)
+                    manifest["documents"].append(
+                        {
+                            "url": url,
+                            "path": name,
+                            "sha256": hashlib.sha256(content).hexdigest(),
+                            "size": len(content),
+                        }
+                    )
+                archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.debug("Created bundle %s with %d documents", path, len(recorder.documents))
+    return list(recorder.documents)
@@ -1,28 +1,78 @@
 import base64
 import datetime
 import errno
+import hashlib
+import json
 import logging
 import os
+import socket
+import tempfile
 import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Dict, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
-import platformdirs
-import pytz
+logger = logging.getLogger(__name__)
 
-# The sqlite3 is not available on Google App Engine so we handle the
-# ImportError here and set the sqlite3 var to None.
-# See https://github.com/mvantellingen/python-zeep/issues/243
-try:
-    import sqlite3
-except ImportError:
-    sqlite3 = None  # type: ignore
 
-logger = logging.getLogger(__name__)
+class CacheEntry:
+    """A cached document together with the validators of the http response.
+
+    :param content: The content of the document
+    :type content: bytes
+    :param etag: The value of the ETag header of the response
+    :type etag: str
+    :param last_modified: The value of the Last-Modified header of the
+      response
+    :type last_modified: str
+    :param expired: Boolean indicating if the entry should be revalidated
+      before it is used.
+    :type expired: bool
+
+    """
+
+    def __init__(self, content, etag=None, last_modified=None, expired=False):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expired = expired
+
+    @classmethod
+    def from_response(cls, content, headers):
+        """Create a new entry with the validators of the response headers."""
+        return cls(content, headers.get("ETag"), headers.get("Last-Modified"))
+
+    @property
+    def has_validators(self):
+        return bool(self.etag or self.last_modified)
+
+    def get_conditional_headers(self):
+        """Return the headers for a conditional request for the document.
+
+        :rtype: dict
+
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
 
 
 class Base:
-    """Base class for caching backends."""
+    """Base class for caching backends.
+
+    Backends only need to implement :meth:`add` and :meth:`get`. Backends
+    which store the validators of the http responses (ETag and
+    Last-Modified) implement :meth:`get_entry`, :meth:`add_entry` and
+    :meth:`refresh` as well, so that expired documents are revalidated via a
+    conditional request instead of downloaded again.
+
+    """
 
     def add(self, url, content):
         raise NotImplementedError()
@@ -30,6 +80,63 @@ class Base:
     def get(self, url):
         raise NotImplementedError()
 
+    def get_entry(self, url):
+        """Return the entry for the given url, this includes expired entries
+        which can be revalidated.
+
+        :rtype: zeep.cache.CacheEntry
+
+        """
+        content = self.get(url)
+        if not content:
+            return None
+        return CacheEntry(content)
+
+    def add_entry(self, url, entry):
+        """Add the entry for the given url.
+
+        :type entry: zeep.cache.CacheEntry
+
+        """
+        self.add(url, entry.content)
+
+    def get_entries(self, urls):
+        """Return the entries of multiple urls, see :meth:`get_entry`.
+        Backends which can retrieve multiple entries in a single request
+        override this.
+
+        :param urls: The urls to retrieve
+        :type urls: list
+        :returns: dict with the url as key and the :class:`CacheEntry` as
+          value, urls which aren't cached are omitted.
+        :rtype: dict
+
+        """
+        result = {}
+        for url in urls:
+            entry = self.get_entry(url)
+            if entry is not None:
+                result[url] = entry
+        return result
+
+    def add_entries(self, entries):
+        """Add the entries of multiple urls, see :meth:`add_entry`.
+
+        :param entries: dict with the url as key and the
+          :class:`CacheEntry` as value
+        :type entries: dict
+
+        """
+        for url, entry in entries.items():
+            self.add_entry(url, entry)
+
+    def refresh(self, url):
+        """Mark the (expired) entry for the given url as valid again, used
+        when the server indicated that the document is not modified.
+
+        """
+        pass
+
 
 class VersionedCacheBase(Base):
     """Versioned base class for caching backends.
@@ -67,23 +174,53 @@ class VersionedCacheBase(Base):
 class InMemoryCache(Base):
     """Simple in-memory caching using dict lookup with support for timeouts"""
 
-    #: global cache, thread-safe by default
-    _cache: Dict[str, Tuple[datetime.datetime, Union[bytes, str]]] = {}
+    #: global cache, thread-safe by default. The values are the creation
+    #: time, the content and the ETag and Last-Modified validators.
+    _cache: Dict[
+        str,
+        Tuple[datetime.datetime, Union[bytes, str], Optional[str], Optional[str]],
+    ] = {}
 
     def __init__(self, timeout=3600):
         self._timeout = timeout
 
     def add(self, url, content):
+        self.add_entry(url, CacheEntry(content))
+
+    def add_entry(self, url, entry):
         logger.debug("Caching contents of %s", url)
-        if not isinstance(content, (str, bytes)):
+        if not isinstance(entry.content, (str, bytes)):
             raise TypeError(
-                "a bytes-like object is required, not {}".format(type(content).__name__)
+                "a bytes-like object is required, not {}".format(
+                    type(entry.content).__name__
+                )
             )
-        self._cache[url] = (datetime.datetime.now(datetime.timezone.utc), content)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self._cache[url] = (now, entry.content, entry.etag, entry.last_modified)
+
+    def get_entry(self, url):
+        try:
+            created, content, etag, last_modified = self._cache[url]
+        except KeyError:
+            return None
+
+        expired = _is_expired(created, self._timeout)
+        if expired and not (etag or last_modified):
+            # The entry can't be revalidated
+            self._cache.pop(url, None)
+            return None
+        return CacheEntry(content, etag, last_modified, expired=expired)
+
+    def refresh(self, url):
+        try:
+            created, *value = self._cache[url]
+        except KeyError:
+            return
+        self._cache[url] = (datetime.datetime.now(datetime.timezone.utc), *value)
 
     def get(self, url):
         try:
-            created, content = self._cache[url]
+            created, content, *_ = self._cache[url]
         except KeyError:
             pass
         else:
@@ -94,14 +231,175 @@ class InMemoryCache(Base):
         return None
 
 
-class SqliteCache(VersionedCacheBase):
-    """Cache contents via a sqlite database on the filesystem."""
+class LRUCache(Base):
+    """Bounded in-memory cache which evicts the least recently used entries.
+
+    Unlike the :class:`InMemoryCache` every instance has its own storage,
+    pass the same instance to multiple transports to share it.
+
+    :param maxsize: The maximum number of entries, None for no limit.
+    :type maxsize: int
+    :param max_bytes: The maximum total size of the cached content in bytes,
+      None for no limit.
+    :type max_bytes: int
+    :param timeout: The number of seconds an entry is valid, None for no
+      expiry. Expired entries are removed when the cache is accessed.
+    :type timeout: int
+
+    """
+
+    def __init__(self, maxsize=128, max_bytes=64 * 1024 * 1024, timeout=3600):
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._timeout = timeout
+        self._lock = threading.Lock()
+
+        # The (size, entry) of the entries ordered by last usage and the
+        # creation time of the entries ordered by creation time. Expired
+        # entries with validators are kept until they are evicted, since they
+        # can be revalidated.
+        self._entries: "OrderedDict[str, Tuple[int, CacheEntry]]"
+        self._entries = OrderedDict()
+        self._created: "OrderedDict[str, float]" = OrderedDict()
+
+        #: The total size of the cached content in bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """Return the counters of the cache.
+
+        :rtype: dict
+
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def add(self, url, content):
+        self.add_entry(url, CacheEntry(content))
+
+    def add_entry(self, url, entry):
+        logger.debug("Caching contents of %s", url)
+        content = entry.content
+        if not isinstance(content, (str, bytes)):
+            raise TypeError(
+                "a bytes-like object is required, not {}".format(type(content).__name__)
+            )
+
+        size = len(content.encode("utf-8") if isinstance(content, str) else content)
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug("Not caching %s, the content is too large", url)
+            return
+
+        entry_args = (content, entry.etag, entry.last_modified)
+        now = time.monotonic()
+        with self._lock:
+            self._remove(url)
+            self._entries[url] = (size, CacheEntry(*entry_args))
+            self._created[url] = now
+            self.size += size
+
+            self._expire(now)
+            while self._is_full():
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get(self, url):
+        entry = self.get_entry(url)
+        if entry is None or entry.expired:
+            return None
+        return entry.content
+
+    def get_entry(self, url):
+        with self._lock:
+            self._expire(time.monotonic())
+            value = self._entries.get(url)
+            if value is None or value[1].expired:
+                self.misses += 1
+                logger.debug("Cache MISS for %s", url)
+                return value[1] if value is not None else None
+
+            self._entries.move_to_end(url)
+            self.hits += 1
+        logger.debug("Cache HIT for %s", url)
+        return value[1]
+
+    def refresh(self, url):
+        with self._lock:
+            value = self._entries.get(url)
+            if value is not None:
+                value[1].expired = False
+                self._created[url] = time.monotonic()
+                self._created.move_to_end(url)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._created.clear()
+            self.size = 0
+
+    def _is_full(self):
+        if self._maxsize is not None and len(self._entries) > self._maxsize:
+            return True
+        return self._max_bytes is not None and self.size > self._max_bytes
+
+    def _expire(self, now):
+        if self._timeout is None:
+            return
+        while self._created:
+            url, created = next(iter(self._created.items()))
+            if created + self._timeout >= now:
+                break
+
+            entry = self._entries[url][1]
+            if entry.has_validators:
+                del self._created[url]
+                entry.expired = True
+            else:
+                self._remove(url)
+                self.expirations += 1
 
-    _version = "1"
+    def _remove(self, url):
+        value = self._entries.pop(url, None)
+        if value is not None:
+            self._created.pop(url, None)
+            self.size -= value[0]
+
+
+class SqliteCache(Base):
+    """Cache contents via a sqlite database on the filesystem.
+
+    The documents are stored as-is in a table indexed on the url. The
+    database uses the write-ahead log so that multiple processes can read
+    from the cache while another process writes to it. Every thread uses its
+    own connection, which is kept open until the thread ends or until
+    :meth:`close` is called.
+
+    Entries from the previous version of the cache are migrated when the
+    database is opened.
+
+    """
+
+    _table = "request_v2"
 
     def __init__(self, path=None, timeout=3600):
 
-        if sqlite3 is None:
+        if _import_sqlite3() is None:
             raise RuntimeError("sqlite3 module is required for the SqliteCache")
 
         # No way we can support this when we want to achieve thread safety
@@ -112,70 +410,603 @@ class SqliteCache(VersionedCacheBase):
             )
 
         self._lock = threading.RLock()
+        self._local = threading.local()
+        self._connections = []
         self._timeout = timeout
         self._db_path = path if path else _get_default_cache_path()
 
         # Initialize db
         with self.db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
                 """
-                    CREATE TABLE IF NOT EXISTS request
-                    (created timestamp, url text, content text)
+                    CREATE TABLE IF NOT EXISTS %s
+                    (
+                        url text PRIMARY KEY,
+                        created real,
+                        content blob,
+                        etag text,
+                        last_modified text
+                    )
                 """
+                % self._table
             )
             conn.commit()
+            self._migrate(conn)
 
     @contextmanager
     def db_connection(self):
+        """Return the connection of the current thread."""
+        sqlite3 = _import_sqlite3()
         assert sqlite3
 
-        with self._lock:
-            connection = sqlite3.connect(
-                self._db_path, detect_types=sqlite3.PARSE_DECLTYPES
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+            with self._lock:
+                self._connections.append(connection)
+
+            # Close the connection when the thread ends
+            weakref.finalize(
+                threading.current_thread(),
+                _close_connection,
+                self._lock,
+                self._connections,
+                connection,
             )
-            yield connection
+        yield connection
+
+    def close(self):
+        """Close the connections of all threads."""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for connection in connections:
             connection.close()
+        self._local = threading.local()
 
     def add(self, url, content):
+        self.add_entry(url, CacheEntry(content))
+
+    def add_entry(self, url, entry):
         logger.debug("Caching contents of %s", url)
-        data = self._encode_data(content)
 
         with self.db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM request WHERE url = ?", (url,))
-            cursor.execute(
-                "INSERT INTO request (created, url, content) VALUES (?, ?, ?)",
-                (datetime.datetime.now(datetime.timezone.utc), url, data),
+            conn.execute(
+                "INSERT OR REPLACE INTO %s (url, created, content, etag, last_modified)"
+                " VALUES (?, ?, ?, ?, ?)" % self._table,
+                (url, time.time(), entry.content, entry.etag, entry.last_modified),
             )
             conn.commit()
 
     def get(self, url):
+        entry = self.get_entry(url)
+        if entry is None or entry.expired:
+            return None
+        return entry.content
+
+    def get_entry(self, url):
         with self.db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT created, content FROM request WHERE url=?", (url,))
-            rows = cursor.fetchall()
+            row = conn.execute(
+                "SELECT created, content, etag, last_modified FROM %s WHERE url = ?"
+                % self._table,
+                (url,),
+            ).fetchone()
 
-        if rows:
-            created, data = rows[0]
-            if not _is_expired(created, self._timeout):
+        if row:
+            created, content, etag, last_modified = row
+            entry = CacheEntry(content, etag, last_modified)
+            if self._timeout is None or created + self._timeout >= time.time():
                 logger.debug("Cache HIT for %s", url)
-                return self._decode_data(data)
+                return entry
+            if entry.has_validators:
+                logger.debug("Cache entry for %s is expired", url)
+                entry.expired = True
+                return entry
         logger.debug("Cache MISS for %s", url)
 
+    def refresh(self, url):
+        with self.db_connection() as conn:
+            conn.execute(
+                "UPDATE %s SET created = ? WHERE url = ?" % self._table,
+                (time.time(), url),
+            )
+            conn.commit()
+
+    def _migrate(self, conn):
+        """Move the entries of the version 1 table to the current table."""
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+        if not conn.execute(query, ("request",)).fetchone():
+            return
+
+        # Lock the database since other processes might migrate it as well
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute(query, ("request",)).fetchone():
+                logger.debug("Migrating cache %s", self._db_path)
+                rows = conn.execute("SELECT created, url, content FROM request")
+                for url, created, content in _decode_v1_rows(rows.fetchall()):
+                    conn.execute(
+                        "INSERT OR IGNORE INTO %s (url, created, content) "
+                        "VALUES (?, ?, ?)" % self._table,
+                        (url, created, content),
+                    )
+                conn.execute("DROP TABLE request")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+
+class FileSystemCache(Base):
+    """Cache contents as files in a directory on the filesystem.
+
+    The content of every document is stored in a file named after the
+    checksum of the content, next to a small metadata file per url which
+    refers to it. All files are written to a temporary file first which is
+    then atomically renamed, so multiple processes can share the directory
+    without locking. This also makes it possible to populate the cache
+    directory in advance, for example when building a container image.
+
+    Content which is no longer referenced by an entry is removed by
+    :meth:`delete` and :meth:`clear`.
+
+    :param path: The directory of the cache
+    :type path: str
+    :param timeout: The number of seconds an entry is valid, None for no
+      expiry.
+    :type timeout: int
+
+    """
+
+    #: The number of seconds after which unreferenced content is removed,
+    #: another process might be about to write the entry which refers to it
+    SWEEP_GRACE_PERIOD = 300
+
+    def __init__(self, path=None, timeout=3600):
+        self._timeout = timeout
+        self._path = path if path else _get_default_cache_dir("documents")
+        os.makedirs(os.path.join(self._path, "objects"), exist_ok=True)
+
+    def add(self, url, content):
+        self.add_entry(url, CacheEntry(content))
+
+    def add_entry(self, url, entry):
+        logger.debug("Caching contents of %s", url)
+        content = entry.content
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if not isinstance(content, bytes):
+            raise TypeError(
+                "a bytes-like object is required, not {}".format(type(content).__name__)
+            )
+
+        checksum = hashlib.sha256(content).hexdigest()
+        object_path = self._get_object_path(checksum)
+        try:
+            # Mark existing content as recently used, see _sweep()
+            os.utime(object_path)
+        except OSError:
+            _write_atomic(object_path, content)
+
+        metadata = {
+            "url": url,
+            "created": time.time(),
+            "checksum": checksum,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        self._write_metadata(url, metadata)
+
+    def get(self, url):
+        entry = self.get_entry(url)
+        if entry is None or entry.expired:
+            return None
+        return entry.content
+
+    def get_entry(self, url):
+        metadata = self._read_metadata(url)
+        content = None
+        if metadata is not None:
+            content = self._read_object(metadata["checksum"])
+
+        if content is None:
+            logger.debug("Cache MISS for %s", url)
+            return None
+
+        entry = CacheEntry(content, metadata["etag"], metadata["last_modified"])
+        if self._timeout is not None:
+            entry.expired = metadata["created"] + self._timeout < time.time()
+
+        if entry.expired and not entry.has_validators:
+            logger.debug("Cache MISS for %s", url)
+            return None
+
+        logger.debug("Cache HIT for %s", url)
+        return entry
+
+    def refresh(self, url):
+        metadata = self._read_metadata(url)
+        if metadata is not None:
+            metadata["created"] = time.time()
+            self._write_metadata(url, metadata)
+
+    def delete(self, url):
+        """Remove the entry for the given url, and its content when it isn't
+        used by another entry.
+
+        """
+        if self._read_metadata(url) is None:
+            return
+        try:
+            os.unlink(self._get_metadata_path(url))
+        except OSError:
+            pass
+        self._sweep()
+
+    def clear(self):
+        """Remove all entries and their content."""
+        for name in os.listdir(self._path):
+            if name.endswith(".json"):
+                try:
+                    os.unlink(os.path.join(self._path, name))
+                except OSError:
+                    pass
+        self._sweep()
+
+    def _get_metadata_path(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._path, key + ".json")
+
+    def _get_object_path(self, checksum):
+        return os.path.join(self._path, "objects", checksum)
+
+    def _read_metadata(self, url):
+        try:
+            with open(self._get_metadata_path(url), "rb") as fh:
+                metadata = json.loads(fh.read())
+        except (OSError, ValueError):
+            return None
+
+        # Ignore entries for other urls with the same hash
+        if not isinstance(metadata, dict) or metadata.get("url") != url:
+            return None
+        return metadata
+
+    def _write_metadata(self, url, metadata):
+        data = json.dumps(metadata).encode("utf-8")
+        _write_atomic(self._get_metadata_path(url), data)
+
+    def _read_object(self, checksum):
+        try:
+            with open(self._get_object_path(checksum), "rb") as fh:
+                return fh.read()
+        except OSError:
+            return None
+
+    def _sweep(self):
+        """Remove the objects which are no longer referenced by an entry.
+
+        Objects which are written less than SWEEP_GRACE_PERIOD seconds ago
+        are kept, since another process might not have written the entry
+        which refers to it yet.
+
+        """
+        referenced = set()
+        for name in os.listdir(self._path):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self._path, name), "rb") as fh:
+                    metadata = json.loads(fh.read())
+                referenced.add(metadata["checksum"])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+
+        objects_path = os.path.join(self._path, "objects")
+        max_mtime = time.time() - self.SWEEP_GRACE_PERIOD
+        for name in os.listdir(objects_path):
+            if name in referenced or name.startswith(".tmp-"):
+                continue
+            path = os.path.join(objects_path, name)
+            try:
+                if os.path.getmtime(path) < max_mtime:
+                    os.unlink(path)
+            except OSError:
+                pass
+
+
+class MemcachedCache(Base):
+    """Cache contents on a memcached server, so that it can be shared by
+    multiple hosts.
+
+    This uses the memcached text protocol directly, without additional
+    dependencies. Content larger than ``compress_threshold`` bytes is
+    compressed with zlib. When the server can't be reached the cache behaves
+    as an empty cache and the server is retried after ``retry_interval``
+    seconds.
+
+    :param server: The address of the server as (host, port) tuple
+    :type server: tuple
+    :param timeout: The number of seconds an entry is valid, None for no
+      expiry.
+    :type timeout: int
+    :param key_prefix: The prefix of the keys on the server
+    :type key_prefix: str
+    :param socket_timeout: The timeout of the connection to the server
+    :type socket_timeout: float
+    :param retry_interval: The number of seconds to wait before connecting
+      to the server again after an error.
+    :type retry_interval: int
+    :param compress_threshold: The minimum size of the content in bytes which
+      is compressed.
+    :type compress_threshold: int
+
+    """
+
+    FLAG_COMPRESSED = 1
+
+    #: Memcached handles larger expiration times as an absolute unix timestamp
+    MAX_RELATIVE_EXPTIME = 60 * 60 * 24 * 30
+
+    def __init__(
+        self,
+        server=("127.0.0.1", 11211),
+        timeout=3600,
+        key_prefix="zeep:",
+        socket_timeout=1.0,
+        retry_interval=30,
+        compress_threshold=1024,
+    ):
+        self._server = server
+        self._timeout = timeout
+        self._key_prefix = key_prefix
+        self._socket_timeout = socket_timeout
+        self._retry_interval = retry_interval
+        self._compress_threshold = compress_threshold
+        self._local = threading.local()
+        self._down_until = 0.0
+
+    def add(self, url, content):
+        self.add_entry(url, CacheEntry(content))
+
+    def add_entry(self, url, entry):
+        logger.debug("Caching contents of %s", url)
+        self.add_entries({url: entry})
+
+    def add_entries(self, entries):
+        """Store multiple entries on the server in a single round trip. The
+        commands are sent with ``noreply``, so the replies are not awaited.
+
+        :param entries: dict with the url as key and the
+          :class:`CacheEntry` as value
+        :type entries: dict
+
+        """
+        commands = []
+        for url, entry in entries.items():
+            flags, value = self._encode(url, entry, time.time())
+
+            # Entries with validators are kept on the server after they
+            # expired since they can be revalidated.
+            exptime = 0
+            if self._timeout is not None and not entry.has_validators:
+                exptime = int(self._timeout)
+                if exptime > self.MAX_RELATIVE_EXPTIME:
+                    exptime = int(time.time() + self._timeout)
+
+            commands.append(
+                b"set %s %d %d %d noreply\r\n%s\r\n"
+                % (self._get_key(url), flags, exptime, len(value), value)
+            )
+
+        if commands:
+            self._execute(b"".join(commands), lambda fh: None)
+
+    def get(self, url):
+        entry = self.get_entry(url)
+        if entry is None or entry.expired:
+            return None
+        return entry.content
+
+    def get_entry(self, url):
+        return self.get_entries([url]).get(url)
+
+    def get_entries(self, urls):
+        """Retrieve the entries of multiple urls in a single round trip.
+
+        :param urls: The urls to retrieve
+        :type urls: list
+        :returns: dict with the url as key and the :class:`CacheEntry` as
+          value, urls which aren't cached are omitted.
+        :rtype: dict
+
+        """
+        keys = {self._get_key(url): url for url in urls}
+        if not keys:
+            return {}
+
+        values = self._execute(b"get %s\r\n" % b" ".join(keys), self._read_values)
+
+        result = {}
+        for key, url in keys.items():
+            entry = None
+            if values and key in values:
+                entry = self._decode(url, *values[key])
+            if entry is None:
+                logger.debug("Cache MISS for %s", url)
+            else:
+                logger.debug("Cache HIT for %s", url)
+                result[url] = entry
+        return result
+
+    def refresh(self, url):
+        entry = self.get_entry(url)
+        if entry is not None:
+            self.add_entry(url, entry)
+
+    def close(self):
+        """Close the connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            connection[0].close()
+
+    def _get_key(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return (self._key_prefix + key).encode("ascii")
+
+    def _encode(self, url, entry, created):
+        content = entry.content
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        metadata = {
+            "url": url,
+            "created": created,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        value = json.dumps(metadata).encode("utf-8") + b"\n" + content
+
+        flags = 0
+        if len(value) >= self._compress_threshold:
+            value = zlib.compress(value)
+            flags |= self.FLAG_COMPRESSED
+        return flags, value
+
+    def _decode(self, url, flags, value):
+        try:
+            if flags & self.FLAG_COMPRESSED:
+                value = zlib.decompress(value)
+            header, content = value.split(b"\n", 1)
+            metadata = json.loads(header)
+        except (zlib.error, ValueError):
+            return None
+
+        if metadata.get("url") != url:
+            return None
+
+        entry = CacheEntry(content, metadata["etag"], metadata["last_modified"])
+        if self._timeout is not None:
+            entry.expired = metadata["created"] + self._timeout < time.time()
+        if entry.expired and not entry.has_validators:
+            return None
+        return entry
+
+    def _execute(self, command, read_response):
+        """Send the command to the server and read the response, returns
+        None when the server is not available.
+
+        """
+        if self._down_until > time.monotonic():
+            return None
+
+        try:
+            sock, fh = self._get_connection()
+            sock.sendall(command)
+            return read_response(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning("Memcached server %s:%s error: %s", *self._server, exc)
+            self.close()
+            self._down_until = time.monotonic() + self._retry_interval
+        return None
+
+    def _get_connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            sock = socket.create_connection(self._server, self._socket_timeout)
+            connection = self._local.connection = (sock, sock.makefile("rb"))
+        return connection
+
+    def _read_values(self, fh):
+        values = {}
+        while True:
+            line = fh.readline()
+            if not line.endswith(b"\r\n"):
+                raise ValueError("Connection closed by the server")
+            if line == b"END\r\n":
+                return values
+
+            parts = line.split()
+            if parts[0] != b"VALUE" or len(parts) < 4:
+                raise ValueError("Unexpected response %r" % line)
+
+            size = int(parts[3])
+            data = fh.read(size + 2)
+            if len(data) != size + 2:
+                raise ValueError("Connection closed by the server")
+            values[parts[1]] = (int(parts[2]), data[:-2])
+
+
+def _write_atomic(path, data):
+    """Write the data to a temporary file and rename it to the given path."""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _close_connection(lock, connections, connection):
+    """Close the sqlite connection of a thread which ended."""
+    with lock:
+        if connection not in connections:
+            return
+        connections.remove(connection)
+    connection.close()
+
+
+def _decode_v1_rows(rows):
+    """Return the url, creation time and content of the rows in the version 1
+    format of the SqliteCache. Invalid rows are skipped.
+
+    """
+    prefix = b"$ZEEP:1$"
+    for created, url, data in rows:
+        if isinstance(data, str):
+            data = data.encode("ascii")
+        if not data.startswith(prefix):
+            continue
+        try:
+            created = datetime.datetime.fromisoformat(created)
+        except (TypeError, ValueError):
+            continue
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=datetime.timezone.utc)
+        yield url, created.timestamp(), base64.b64decode(data[len(prefix) :])
+
 
 def _is_expired(value, timeout):
     """Return boolean if the value is expired"""
     if timeout is None:
         return False
 
-    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=pytz.utc)
-    max_age = value.replace(tzinfo=pytz.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    max_age = value.replace(tzinfo=datetime.timezone.utc)
     max_age += datetime.timedelta(seconds=timeout)
     return now > max_age
 
 
+def _import_sqlite3():
+    # The sqlite3 is not available on Google App Engine so we handle the
+    # ImportError here and return None.
+    # See https://github.com/mvantellingen/python-zeep/issues/243
+    try:
+        import sqlite3
+    except ImportError:
+        return None
+    return sqlite3
+
+
 def _get_default_cache_path():
+    import platformdirs
+
     path = platformdirs.user_cache_dir("zeep", False)
     try:
         os.makedirs(path)
@@ -185,3 +1016,9 @@ def _get_default_cache_path():
         else:
             raise
     return os.path.join(path, "cache.db")
+
+
+def _get_default_cache_dir(name):
+    import platformdirs
+
+    return os.path.join(platformdirs.user_cache_dir("zeep", False), name)
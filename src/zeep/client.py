@@ -1,6 +1,9 @@
 import logging
+import os.path
 import typing
 
+from zeep.bundle import BundleTransport, is_bundle
+from zeep.loader import is_relative_path, load_documents_async
 from zeep.proxy import AsyncServiceProxy, ServiceProxy
 from zeep.settings import Settings
 from zeep.transports import AsyncTransport, Transport
@@ -38,7 +41,8 @@ class Factory:
 class Client:
     """The zeep Client.
 
-    :param wsdl: Url/local WSDL location or preparsed WSDL Document
+    :param wsdl: Url/local WSDL location, path of a bundle created via
+                 ``python -m zeep bundle`` or preparsed WSDL Document
     :param wsse:
     :param transport: Custom transport class.
     :param service_name: The service name for the service binding. Defaults to
@@ -48,6 +52,9 @@ class Client:
                       document.
     :param plugins: a list of Plugin instances
     :param settings: a zeep.Settings() object
+    :param operations: The names of the operations which are used, all other
+                       operations are removed when the wsdl is loaded. See
+                       the operations setting.
 
     """
 
@@ -62,6 +69,7 @@ class Client:
         port_name=None,
         plugins=None,
         settings=None,
+        operations=None,
     ):
         if not wsdl:
             raise ValueError("No URL given for the wsdl")
@@ -71,9 +79,18 @@ class Client:
             transport if transport is not None else self._default_transport()
         )
         if isinstance(wsdl, Document):
+            if operations is not None:
+                raise ValueError(
+                    "The operations can only be given when the wsdl is loaded"
+                )
             self.wsdl = wsdl
         else:
-            self.wsdl = Document(wsdl, self.transport, settings=self.settings)
+            if is_bundle(wsdl):
+                self.transport = BundleTransport(wsdl, self.transport)
+                wsdl = self.transport.location
+            self.wsdl = Document(
+                wsdl, self.transport, settings=self.settings, operations=operations
+            )
         self.wsse = wsse
         self.plugins = plugins if plugins is not None else []
 
@@ -82,6 +99,38 @@ class Client:
         self._default_port_name = port_name
         self._default_soapheaders = None
 
+    @classmethod
+    def shared(cls, wsdl, pool=None, **kwargs):
+        """Create a new client on top of a wsdl document which is shared
+        within the process.
+
+        The wsdl is only loaded once, concurrent calls for the same wsdl wait
+        for the first one to finish. Accepts the same keyword arguments as
+        the client.
+
+        The document is only shared by clients with the same transport and
+        settings objects (and the same operations). Pass the same transport
+        to every call, a client which is given a new transport on every
+        request never shares the document and loads the wsdl each time.
+        When no transport is given a transport shared by the pool is used.
+
+        Example::
+
+            client = Client.shared("http://example.com/?wsdl")
+
+        :param wsdl: Url or local path of the wsdl
+        :type wsdl: str
+        :param pool: The pool of the wsdl documents, defaults to the
+          process-wide pool.
+        :type pool: zeep.pool.ClientPool
+        :rtype: zeep.Client
+
+        """
+        if pool is None:
+            from zeep.pool import default_pool as pool
+
+        return pool.client(wsdl, client_class=cls, **kwargs)
+
     @property
     def namespaces(self):
         return self.wsdl.types.prefix_map
@@ -196,6 +245,48 @@ class Client:
         """
         self._default_soapheaders = headers
 
+    def warmup(self, operations=None, connect=False):
+        """Prepare the operations so that the first call isn't slower than
+        the calls which follow.
+
+        This computes all lazily computed properties of the messages of the
+        operations and of the types and elements used by them, and imports
+        the schemas which are otherwise imported when they are first
+        referenced. See :meth:`zeep.wsdl.Document.warmup`.
+
+        Example::
+
+            client.warmup(["GetItems", "ItemsPort/GetCount"], connect=True)
+
+        :param operations: The names of the operations, specified as
+          ``operation``, ``port/operation`` or ``service/port/operation``.
+          Defaults to all operations.
+        :type operations: list of str
+        :param connect: Open a connection to the addresses of the ports of the
+          operations (or of the default service when no operations are
+          given) which is kept in the connection pool of the transport.
+        :type connect: bool
+
+        """
+        self.wsdl.warmup(operations)
+        if connect:
+            for address in self._get_addresses(operations):
+                self.transport.connect(address)
+
+    def _get_addresses(self, operations):
+        """Return the addresses of the ports of the given operations, or the
+        address of the default service.
+
+        """
+        if operations is None:
+            addresses = [self.service._binding_options.get("address")]
+        else:
+            addresses = [
+                port.binding_options.get("address")
+                for port, operation in self.wsdl._find_operations(operations)
+            ]
+        return [address for address in dict.fromkeys(addresses) if address]
+
     def _get_port(self, service, name):
         if name:
             port = service.ports.get(name)
@@ -225,6 +316,64 @@ class Client:
 class AsyncClient(Client):
     _default_transport = AsyncTransport
 
+    @classmethod
+    async def create(
+        cls,
+        wsdl,
+        wsse=None,
+        transport=None,
+        service_name=None,
+        port_name=None,
+        plugins=None,
+        settings=None,
+        operations=None,
+    ):
+        """Create a new client while loading the wsdl without blocking the
+        event loop.
+
+        The wsdl document and all the documents it (transitively) imports or
+        includes are retrieved concurrently via the async transport before
+        the wsdl is processed. Accepts the same arguments as the client.
+
+        Example::
+
+            client = await AsyncClient.create("http://example.com/?wsdl")
+
+        :rtype: zeep.AsyncClient
+
+        """
+        settings = settings or Settings()
+        transport = transport if transport is not None else cls._default_transport()
+
+        if is_bundle(wsdl):
+            transport = BundleTransport(wsdl, transport)
+            wsdl = transport.location
+
+        if isinstance(wsdl, str):
+            location = wsdl
+            if is_relative_path(location):
+                location = os.path.abspath(location)
+            prefetched = await load_documents_async(location, transport, settings)
+            wsdl = Document(
+                location,
+                transport,
+                settings=settings,
+                prefetched=prefetched,
+                operations=operations,
+            )
+        elif operations is not None:
+            raise ValueError("The operations can only be given when the wsdl is loaded")
+
+        return cls(
+            wsdl,
+            wsse=wsse,
+            transport=transport,
+            service_name=service_name,
+            port_name=port_name,
+            plugins=plugins,
+            settings=settings,
+        )
+
     def bind(
         self,
         service_name: typing.Optional[str] = None,
@@ -244,6 +393,16 @@ class AsyncClient(Client):
         port = self._get_port(service, port_name)
         return AsyncServiceProxy(self, port.binding, **port.binding_options)
 
+    async def warmup(self, operations=None, connect=False):
+        """Prepare the operations so that the first call isn't slower than
+        the calls which follow. See :meth:`Client.warmup`.
+
+        """
+        self.wsdl.warmup(operations)
+        if connect:
+            for address in self._get_addresses(operations):
+                await self.transport.connect(address)
+
     async def __aenter__(self):
         return self
 
@@ -0,0 +1,873 @@
+"""
+zeep.codegen
+~~~~~~~~~~~~
+
+Generate a python module for the operations of a wsdl. The generated module
+contains a class with ``__slots__`` for every complexType which is used by the
+operations and a serialize and deserialize function per operation which
+create and read the lxml elements directly. The ``Client`` class in the module
+sends the messages via a :class:`zeep.transports.Transport`.
+
+Importing the generated module doesn't load or parse the wsdl and calling an
+operation doesn't go through the xsd elements and indicators of zeep, which
+makes it a lot faster than the generic client.
+
+Only a subset of the wsdl and xsd features is supported: document/literal
+soap operations without soap headers of which the messages consist of
+sequences (or xsd:all) of elements and attributes with builtin simple types or other
+supported complexTypes. Operations which use other features are left out of
+the generated module, they are listed in the docstring of the module.
+
+Note that the values are not validated, only missing required elements are
+reported. Elements are matched on their name when parsing, so the order of
+the elements in the received xml is not checked.
+
+"""
+
+import functools
+import json
+import keyword
+import logging
+import re
+
+from zeep import ns
+from zeep.exceptions import CodegenError
+from zeep.utils import get_version
+from zeep.wsdl.bindings.soap import Soap12Binding, SoapBinding
+from zeep.wsdl.messages import DocumentMessage
+from zeep.xsd.elements import All, Any, Attribute, Element, Sequence
+from zeep.xsd.types import builtins
+from zeep.xsd.types.complex import ComplexType
+from zeep.xsd.types.simple import AnySimpleType
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["generate"]
+
+#: The maximum length of the lines in the generated module
+_MAX_LINE_LENGTH = 88
+
+#: The names in the generated module which can't be used for classes
+_RESERVED_NAMES = [
+    "ADDRESS",
+    "Client",
+    "Decimal",
+    "Fault",
+    "TransportError",
+    "ValidationError",
+    "XMLParseError",
+    "XMLSyntaxError",
+]
+
+#: The simple types which are converted inline, see _KINDS for the conversion
+#: of the other builtin types
+_SIMPLE_KINDS = [
+    (builtins.Boolean, "boolean"),
+    (builtins.Integer, "integer"),
+    (builtins.Float, "float"),
+    (builtins.Double, "double"),
+    (builtins.Decimal, "decimal"),
+    (builtins.String, "string"),
+    (builtins.AnyURI, "string"),
+    (builtins.HexBinary, "string"),
+    (builtins.QName, "string"),
+    (builtins.Notation, "string"),
+]
+
+#: Templates to convert a value to and from xml and the python type per kind
+_KINDS = {
+    "string": ("_string(%s)", "%s", "str"),
+    "boolean": ("_boolean(%s)", "_parse_boolean(%s)", "bool"),
+    "integer": ("str(%s)", "int(%s)", "int"),
+    "float": ("str(%s).upper()", "float(%s)", "float"),
+    "double": ("str(%s)", "float(%s)", "float"),
+    "decimal": ("_decimal(%s)", "Decimal(%s.strip())", "Decimal"),
+}
+
+#: The python types of the builtin types which are converted via zeep
+_BUILTIN_ANNOTATIONS = {
+    "Base64Binary": "bytes",
+    "Date": "datetime.date",
+    "DateTime": "datetime.datetime",
+    "Duration": "datetime.timedelta",
+    "Time": "datetime.time",
+}
+
+_HEADER = '''\
+"""%(docstring)s"""
+
+from __future__ import annotations
+
+%(datetime)simport typing
+from decimal import Decimal
+
+from lxml import etree
+
+from zeep.exceptions import (
+    Fault,
+    TransportError,
+    ValidationError,
+    XMLParseError,
+    XMLSyntaxError,
+)
+%(imports)s
+ADDRESS = %(address)s
+%(builtins)s
+_SOAP_ENV = %(soap_env)s
+_ENVELOPE = "{%%s}Envelope" %% _SOAP_ENV
+_BODY = "{%%s}Body" %% _SOAP_ENV
+_FAULT = "{%%s}Fault" %% _SOAP_ENV
+_XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+
+_PARSER = etree.XMLParser(
+    remove_comments=True, remove_pis=True, resolve_entities=False, no_network=True
+)
+
+
+class _Value:
+    __slots__ = ()
+    _elements: typing.Tuple[str, ...] = ()
+    _attributes: typing.Tuple[str, ...] = ()
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __repr__(self):
+        values = ", ".join("%%s=%%r" %% (n, getattr(self, n)) for n in self.__slots__)
+        return "%%s(%%s)" %% (self.__class__.__name__, values)
+
+
+def _string(value):
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def _boolean(value):
+    return "true" if value and value not in ("false", "0") else "false"
+
+
+def _parse_boolean(value):
+    return value.strip() in ("true", "1")
+
+
+def _decimal(value):
+    if isinstance(value, Decimal):
+        return "{:f}".format(value)
+    return str(value)
+
+
+def _missing(name):
+    raise ValidationError("Missing element %%s" %% name, path=[name])
+
+
+def _unexpected(node):
+    raise XMLParseError("Unexpected element %%r" %% node.tag)
+
+
+def _unwrap(result):
+    # Return the value in the same way as zeep does, the response is
+    # replaced by its child when it only has one child.
+    if result is None or not result.__slots__:
+        return None
+    if len(result.__slots__) > 1:
+        return result
+    value = getattr(result, result.__slots__[0])
+    if isinstance(value, _Value) and len(value._elements) == 1:
+        if not value._attributes:
+            return getattr(value, value._elements[0])
+    return value
+
+
+def _raise_fault(envelope, fault_node):
+    if fault_node is None:
+        raise Fault(
+            message="Unknown fault occured",
+            detail=etree.tostring(envelope, encoding="unicode"),
+        )
+    if _SOAP_ENV == %(soap_env_11)s:
+        raise Fault(
+            message=fault_node.findtext("faultstring"),
+            code=fault_node.findtext("faultcode"),
+            actor=fault_node.findtext("faultactor"),
+            detail=fault_node.find("detail"),
+        )
+    raise Fault(
+        message=fault_node.findtext("{%%s}Reason/{%%s}Text" %% (_SOAP_ENV, _SOAP_ENV)),
+        code=fault_node.findtext("{%%s}Code/{%%s}Value" %% (_SOAP_ENV, _SOAP_ENV)),
+        detail=fault_node.find("{%%s}Detail" %% _SOAP_ENV),
+    )
+
+
+def _process_reply(response, deserialize):
+    if response.status_code in (201, 202) and not response.content:
+        return None
+    if response.status_code != 200 and not response.content:
+        raise TransportError(
+            "Server returned HTTP status %%d (no content available)"
+            %% response.status_code,
+            status_code=response.status_code,
+        )
+
+    try:
+        envelope = etree.fromstring(response.content, parser=_PARSER)
+    except etree.XMLSyntaxError as exc:
+        raise XMLSyntaxError(
+            "Invalid XML content received (%%s)" %% exc.msg, content=response.content
+        )
+
+    fault_node = envelope.find("%%s/%%s" %% (_BODY, _FAULT))
+    if response.status_code != 200 or fault_node is not None:
+        _raise_fault(envelope, fault_node)
+    if envelope.tag != _ENVELOPE:
+        raise XMLSyntaxError(
+            "The XML returned by the server does not contain a valid %%s root "
+            "element. The root element found is %%s" %% (_ENVELOPE, envelope.tag)
+        )
+    return deserialize(envelope)
+
+
+def _create_envelope():
+    envelope = etree.Element(_ENVELOPE, nsmap={"soap-env": _SOAP_ENV})
+    return envelope, etree.SubElement(envelope, _BODY)
+'''
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Field:
+    def __init__(self, name, element, kind, is_attribute=False):
+        self.name = name
+        self.tag = element.qname.text
+        self.kind = kind
+        self.is_attribute = is_attribute
+        self.many = not is_attribute and element.max_occurs != 1
+        self.min_occurs = 0 if is_attribute else element.min_occurs
+        self.nillable = not is_attribute and element.nillable
+
+
+class _Class:
+    def __init__(self, name):
+        self.name = name
+        self.fields = []
+
+    @property
+    def elements(self):
+        return [field for field in self.fields if not field.is_attribute]
+
+    @property
+    def attributes(self):
+        return [field for field in self.fields if field.is_attribute]
+
+
+class _Operation:
+    def __init__(self, name, operation, input_class, output_class, headers):
+        self.name = name
+        self.operation = operation
+        self.input_class = input_class
+        self.output_class = output_class
+        self.headers = headers
+
+
+class _Generator:
+    def __init__(self, document, service_name, port_name, binding, address):
+        self.document = document
+        self.service_name = service_name
+        self.port_name = port_name
+        self.binding = binding
+        self.address = address
+        self.classes = {}
+        self.names = set(_RESERVED_NAMES)
+        self.builtins = set()
+        self.operations = []
+        self.skipped = []
+
+    def add_operation(self, operation):
+        """Add the operation to the generated module or record the reason why
+        it isn't supported.
+
+        """
+        state = dict(self.classes), set(self.names), set(self.builtins)
+        try:
+            self.operations.append(self._get_operation(operation))
+        except _Unsupported as exc:
+            self.classes, self.names, self.builtins = state
+            self.skipped.append((operation.name, str(exc)))
+
+    def _get_operation(self, operation):
+        name = _identifier(operation.name)
+        if name is None or name in [op.name for op in self.operations]:
+            raise _Unsupported("the name is not a valid python identifier")
+
+        input_class = self._get_message_class(operation.input)
+        output_class = None
+        if operation.output is not None:
+            output_class = self._get_message_class(operation.output)
+
+        headers = {
+            "SOAPAction": (
+                '"%s"' % operation.soapaction if operation.soapaction else '""'
+            )
+        }
+        if isinstance(self.binding, Soap12Binding):
+            headers["Content-Type"] = "; ".join(
+                [
+                    "application/soap+xml",
+                    "charset=utf-8",
+                    'action="%s"' % operation.soapaction,
+                ]
+            )
+        else:
+            headers["Content-Type"] = "text/xml; charset=utf-8"
+        return _Operation(name, operation, input_class, output_class, headers)
+
+    def _get_message_class(self, message):
+        """Return the class of the element in the soap body of the message,
+        or None when the body is empty.
+
+        """
+        if not isinstance(message, DocumentMessage):
+            raise _Unsupported("only document/literal messages are supported")
+        if message.header is not None and message.header.type._element:
+            raise _Unsupported("soap headers are not supported")
+        if message.body is None:
+            return None
+        if message._is_body_wrapped:
+            raise _Unsupported("multiple body parts are not supported")
+        if not isinstance(message.body.type, ComplexType):
+            raise _Unsupported(
+                "the body element %s has a simple type" % message.body.qname
+            )
+        return message.body.qname.text, self._get_class(
+            message.body.type, message.body.name
+        )
+
+    def _get_class(self, xsd_type, name):
+        """Return the class for the given complexType. The class is registered
+        before the fields are processed to support recursive types.
+
+        """
+        if id(xsd_type) in self.classes:
+            return self.classes[id(xsd_type)]
+        if getattr(xsd_type, "_array_type", None):
+            raise _Unsupported("soap-enc arrays are not supported")
+
+        if xsd_type.qname is not None:
+            name = xsd_type.qname.localname
+        cls = _Class(self._get_name(name))
+        self.classes[id(xsd_type)] = cls
+
+        for element in _get_elements(xsd_type._element):
+            kind = self._get_kind(element.type, element.name)
+            cls.fields.append(_Field(element.attr_name, element, kind))
+        for attribute in xsd_type._attributes_unwrapped:
+            if not isinstance(attribute, Attribute):
+                raise _Unsupported("anyAttribute is not supported")
+            kind = self._get_kind(attribute.type, attribute.name)
+            if not isinstance(kind, str):
+                raise _Unsupported("attribute %s has no simple type" % attribute.name)
+            cls.fields.append(_Field(attribute.attr_name, attribute, kind, True))
+
+        names = [field.name for field in cls.fields]
+        for field_name in names:
+            if _identifier(field_name) != field_name or names.count(field_name) > 1:
+                raise _Unsupported("the name %r is not supported" % field_name)
+        return cls
+
+    def _get_kind(self, xsd_type, name):
+        """Return the kind of the simple type or the class of the complex
+        type. The name is used for the class of anonymous types.
+
+        """
+        if isinstance(xsd_type, ComplexType):
+            return self._get_class(xsd_type, name)
+        if not isinstance(xsd_type, AnySimpleType):
+            raise _Unsupported("the type %s is not supported" % xsd_type)
+
+        for base, kind in _SIMPLE_KINDS:
+            if isinstance(xsd_type, base):
+                return kind
+        for base in type(xsd_type).__mro__:
+            if base.__module__ == builtins.__name__ and base not in (
+                builtins.BuiltinType,
+                builtins.AnySimpleType,
+            ):
+                self.builtins.add(base.__name__)
+                return "builtin:%s" % base.__name__
+        raise _Unsupported("the type %s is not supported" % xsd_type)
+
+    def _get_name(self, name):
+        base = _identifier(name) or "Type"
+        base = base[0].upper() + base[1:]
+        name, counter = base, 1
+        while name in self.names:
+            counter += 1
+            name = "%s%d" % (base, counter)
+        self.names.add(name)
+        return name
+
+    def render(self):
+        lines = [self._render_header()]
+        classes = sorted(self.classes.values(), key=lambda cls: cls.name)
+        for cls in classes:
+            lines.append(_render_class(cls))
+        for cls in classes:
+            lines.append(_render_serializer(cls))
+            lines.append(_render_parser(cls))
+        for operation in self.operations:
+            lines.append(_render_operation(operation))
+        lines.append(self._render_client())
+        return "\n\n".join(lines)
+
+    def _render_header(self):
+        docstring = [
+            "",
+            "Generated by zeep %s, do not edit." % get_version(),
+            "",
+            "Source: %s" % self.document.location,
+            "Service: %s, port: %s" % (self.service_name, self.port_name),
+            "",
+        ]
+        if self.skipped:
+            docstring.append("The following operations are not supported:")
+            docstring.append("")
+            for name, reason in self.skipped:
+                docstring.append("- %s: %s" % (name, reason))
+            docstring.append("")
+
+        # Only import the modules which are used by the generated code
+        imports = builtin_types = datetime_import = ""
+        if self.builtins:
+            imports = "from zeep.xsd.types import builtins as _builtins\n"
+            builtin_types = "\n" + "".join(
+                "_%s = _builtins.%s()\n" % (name, name)
+                for name in sorted(self.builtins)
+            )
+        if any(
+            _BUILTIN_ANNOTATIONS.get(name, "").startswith("datetime.")
+            for name in self.builtins
+        ):
+            datetime_import = "import datetime\n"
+
+        return _HEADER % {
+            "docstring": "\n".join(docstring),
+            "datetime": datetime_import,
+            "imports": imports,
+            "builtins": builtin_types,
+            "address": _literal(self.address),
+            "soap_env": _literal(self.binding.nsmap["soap-env"]),
+            "soap_env_11": _literal(ns.SOAP_ENV_11),
+        }
+
+    def _render_client(self):
+        lines = [
+            "class Client:",
+            '    """Client for the %s port of the %s service."""'
+            % (self.port_name, self.service_name),
+            "",
+            "    def __init__(self, address: str = ADDRESS, transport=None):",
+            "        if transport is None:",
+            "            from zeep.transports import Transport",
+            "",
+            "            transport = Transport()",
+            "        self.address = address",
+            "        self.transport = transport",
+        ]
+        for operation in self.operations:
+            fields = operation.input_class[1].fields if operation.input_class else []
+            lines.append("")
+            lines.extend(
+                _render_def(
+                    operation.name, ["self"] + [_argument(f) for f in fields], "    "
+                )
+            )
+            lines.extend(
+                _render_call(
+                    "envelope = serialize_%s" % operation.name,
+                    [field.name for field in fields],
+                    "        ",
+                )
+            )
+            lines.append("        headers = {")
+            for key, value in operation.headers.items():
+                lines.append("            %s: %s," % (_literal(key), _literal(value)))
+            lines.append("        }")
+            lines.extend(
+                [
+                    "        response = self.transport.post_xml("
+                    "self.address, envelope, headers)",
+                    "        return _process_reply(response, deserialize_%s)"
+                    % operation.name,
+                ]
+            )
+        return "\n".join(lines) + "\n"
+
+
+def generate(document, service=None, port=None):
+    """Generate the source of a python module for the operations of the
+    given port of the wsdl.
+
+    :param document: The wsdl document
+    :type document: zeep.wsdl.Document
+    :param service: The name of the service, defaults to the first service
+    :type service: str
+    :param port: The name of the port, defaults to the first soap port of the
+      service
+    :type port: str
+    :returns: The source of the python module
+    :rtype: str
+
+    """
+    document.resolve()
+
+    if service:
+        if service not in document.services:
+            raise CodegenError("Service %r not found" % service)
+        services = [document.services[service]]
+    else:
+        services = list(document.services.values())
+
+    ports = [
+        (service_obj, port_obj)
+        for service_obj in services
+        for port_obj in service_obj.ports.values()
+        if isinstance(port_obj.binding, SoapBinding)
+        and (not port or port_obj.name == port)
+    ]
+    if not ports:
+        raise CodegenError("No soap port found to generate the module for")
+    service_obj, port_obj = ports[0]
+
+    generator = _Generator(
+        document,
+        service_obj.name,
+        port_obj.name,
+        port_obj.binding,
+        port_obj.binding_options["address"],
+    )
+    binding = port_obj.binding
+    binding.resolve_operations()
+    for name in sorted(binding._operations):
+        generator.add_operation(binding._operations[name])
+
+    for name, reason in generator.skipped:
+        logger.info("Skipping operation %s: %s", name, reason)
+    if not generator.operations:
+        raise CodegenError(
+            "None of the operations of the port %s is supported" % port_obj.name
+        )
+    source = generator.render()
+
+    black = _import_black()
+    if black is not None:
+        source = black.format_str(source, mode=black.Mode(line_length=_MAX_LINE_LENGTH))
+    return source
+
+
+@functools.lru_cache(maxsize=None)
+def _import_black():
+    """Return the black module, which is used to format the generated module
+    when it is installed. The generated code is already formatted for the
+    common cases, black takes care of the remaining long lines.
+
+    """
+    try:
+        import black
+    except ImportError:
+        return None
+    return black
+
+
+def _get_elements(indicator):
+    """Return the elements of the (nested) sequences or of the all indicator.
+    The elements are parsed by name, so these are handled the same.
+
+    """
+    if indicator is None:
+        return []
+    if not isinstance(indicator, (All, Sequence)):
+        raise _Unsupported("%s is not supported" % indicator.__class__.__name__)
+    if indicator.min_occurs != 1 or indicator.max_occurs != 1:
+        raise _Unsupported("repeating sequences are not supported")
+
+    result = []
+    for item in indicator:
+        if isinstance(item, Sequence):
+            result.extend(_get_elements(item))
+        elif isinstance(item, Element) and not isinstance(item, Any):
+            result.append(item)
+        else:
+            raise _Unsupported("%s is not supported" % item.__class__.__name__)
+    return result
+
+
+def _identifier(name):
+    if not name:
+        return None
+    name = re.sub(r"\W", "_", name)
+    if name[0].isdigit() or keyword.iskeyword(name):
+        name = "_" + name
+    return name
+
+
+def _literal(value):
+    """Return the python literal for the string (or None) or the tuple of
+    strings.
+
+    """
+    if isinstance(value, tuple):
+        items = [_literal(item) for item in value]
+        if len(items) == 1:
+            return "(%s,)" % items[0]
+        return "(%s)" % ", ".join(items)
+    if value is None:
+        return "None"
+    result = json.dumps(value)
+    if '"' in value and "'" not in value:
+        # Prefer single quotes over escaped double quotes, in the same way as
+        # black does.
+        result = "'%s'" % result[1:-1].replace('\\"', '"')
+    return result
+
+
+def _annotation(field):
+    if isinstance(field.kind, _Class):
+        annotation = field.kind.name
+    elif field.kind.startswith("builtin:"):
+        annotation = _BUILTIN_ANNOTATIONS.get(field.kind[8:], "typing.Any")
+    else:
+        annotation = _KINDS[field.kind][2]
+    if field.many:
+        return "typing.Optional[typing.List[%s]]" % annotation
+    return "typing.Optional[%s]" % annotation
+
+
+def _argument(field):
+    return "%s: %s = None" % (field.name, _annotation(field))
+
+
+def _to_xml(field, value):
+    if field.kind.startswith("builtin:"):
+        return "_%s.xmlvalue(%s)" % (field.kind[8:], value)
+    return _KINDS[field.kind][0] % value
+
+
+def _to_python(field, value):
+    if field.kind.startswith("builtin:"):
+        return "_%s.pythonvalue(%s)" % (field.kind[8:], value)
+    return _KINDS[field.kind][1] % value
+
+
+def _render_def(name, arguments, indent=""):
+    """Return the lines of the function definition, the arguments are placed
+    on separate lines when they don't fit on one line.
+
+    """
+    line = "%sdef %s(%s):" % (indent, name, ", ".join(arguments))
+    if len(line) <= _MAX_LINE_LENGTH:
+        return [line]
+    lines = ["%sdef %s(" % (indent, name)]
+    lines.extend("%s    %s," % (indent, argument) for argument in arguments)
+    lines.append("%s):" % indent)
+    return lines
+
+
+def _render_call(prefix, arguments, indent):
+    """Return the lines of the function call, the arguments are placed on
+    separate lines when they don't fit on one line.
+
+    """
+    line = "%s%s(%s)" % (indent, prefix, ", ".join(arguments))
+    if len(line) <= _MAX_LINE_LENGTH:
+        return [line]
+    lines = ["%s%s(" % (indent, prefix)]
+    lines.extend("%s    %s," % (indent, argument) for argument in arguments)
+    lines.append("%s)" % indent)
+    return lines
+
+
+def _render_condition(keyword, condition, indent="        "):
+    """Return the lines of the if or elif statement, the condition is placed
+    between parentheses when it doesn't fit on one line.
+
+    """
+    line = "%s%s %s:" % (indent, keyword, condition)
+    if len(line) <= _MAX_LINE_LENGTH:
+        return [line]
+    lines = ["%s%s (" % (indent, keyword)]
+    if len(indent) + 4 + len(condition) <= _MAX_LINE_LENGTH:
+        lines.append("%s    %s" % (indent, condition))
+    else:
+        left, operator, right = condition.partition(" == ")
+        lines.append("%s    %s" % (indent, left))
+        lines.append("%s    %s%s" % (indent, operator.lstrip(), right))
+    lines.append("%s):" % indent)
+    return lines
+
+
+def _render_class(cls):
+    lines = [
+        "class %s(_Value):" % cls.name,
+        "    __slots__ = %s" % _literal(tuple(field.name for field in cls.fields)),
+        "    _elements = %s" % _literal(tuple(field.name for field in cls.elements)),
+        "    _attributes = %s"
+        % _literal(tuple(field.name for field in cls.attributes)),
+    ]
+    if not cls.fields:
+        return "\n".join(lines) + "\n"
+
+    lines.append("")
+    lines.extend(
+        _render_def("__init__", ["self"] + [_argument(f) for f in cls.fields], "    ")
+    )
+    for field in cls.fields:
+        if field.many:
+            lines.append(
+                "        self.%s = [] if %s is None else %s"
+                % (field.name, field.name, field.name)
+            )
+        else:
+            lines.append("        self.%s = %s" % (field.name, field.name))
+    return "\n".join(lines) + "\n"
+
+
+def _render_serializer(cls):
+    lines = [
+        "def _render_%s(parent, tag, value):" % cls.name,
+        "    if isinstance(value, dict):",
+        "        value = %s(**value)" % cls.name,
+        "    node = etree.SubElement(parent, tag)",
+    ]
+    for field in cls.attributes:
+        lines.extend(
+            [
+                "    if value.%s is not None:" % field.name,
+            ]
+        )
+        arguments = [_literal(field.tag), _to_xml(field, "value.%s" % field.name)]
+        lines.extend(_render_call("node.set", arguments, "        "))
+
+    for field in cls.elements:
+        tag = _literal(field.tag)
+        if field.many:
+            lines.append("    for item in value.%s or ():" % field.name)
+            lines.append("        if item is None:")
+            lines.append("            continue")
+            indent = "        "
+        else:
+            lines.append("    item = value.%s" % field.name)
+            indent = "    "
+            if field.min_occurs == 0:
+                lines.append("    if item is not None:")
+            else:
+                lines.append("    if item is None:")
+                if field.nillable:
+                    lines.extend(
+                        _render_call(
+                            "child = etree.SubElement", ["node", tag], "        "
+                        )
+                    )
+                    lines.append("        child.set(_XSI_NIL, %s)" % _literal("true"))
+                else:
+                    lines.append("        _missing(%s)" % _literal(field.name))
+                lines.append("    else:")
+            indent = "        "
+
+        if isinstance(field.kind, _Class):
+            lines.extend(
+                _render_call(
+                    "_render_%s" % field.kind.name, ["node", tag, "item"], indent
+                )
+            )
+        else:
+            lines.extend(
+                _render_call("child = etree.SubElement", ["node", tag], indent)
+            )
+            lines.append("%schild.text = %s" % (indent, _to_xml(field, "item")))
+    return "\n".join(lines) + "\n"
+
+
+def _render_parser(cls):
+    lines = [
+        "def _parse_%s(node):" % cls.name,
+        "    if len(node) == 0 and not node.attrib:",
+        "        return None",
+        "    if node.get(_XSI_NIL) == %s:" % _literal("true"),
+        "        return None",
+        "    value = %s()" % cls.name,
+    ]
+    for field in cls.attributes:
+        lines.extend(_render_call("item = node.get", [_literal(field.tag)], "    "))
+        lines.extend(
+            [
+                "    if item is not None:",
+                "        value.%s = %s" % (field.name, _to_python(field, "item")),
+            ]
+        )
+
+    lines.append("    for child in node:")
+    if cls.elements:
+        lines.append("        tag = child.tag")
+    for index, field in enumerate(cls.elements):
+        lines.extend(
+            _render_condition(
+                "if" if index == 0 else "elif", "tag == %s" % _literal(field.tag)
+            )
+        )
+        if isinstance(field.kind, _Class):
+            item = "_parse_%s(child)" % field.kind.name
+        elif field.kind == "string":
+            item = "child.text"
+        else:
+            lines.append("            text = child.text")
+            item = "None if text is None else %s" % _to_python(field, "text")
+
+        if field.many:
+            lines.append("            value.%s.append(%s)" % (field.name, item))
+        else:
+            lines.append("            value.%s = %s" % (field.name, item))
+    if cls.elements:
+        lines.append("        else:")
+        lines.append("            _unexpected(child)")
+    else:
+        lines.append("        _unexpected(child)")
+    lines.append("    return value")
+    return "\n".join(lines) + "\n"
+
+
+def _render_operation(operation):
+    fields = operation.input_class[1].fields if operation.input_class else []
+    lines = _render_def(
+        "serialize_%s" % operation.name, [_argument(field) for field in fields]
+    )
+    lines.append("    envelope, body = _create_envelope()")
+    if operation.input_class:
+        tag, cls = operation.input_class
+        lines.extend(
+            _render_call("value = %s" % cls.name, [f.name for f in fields], "    ")
+        )
+        arguments = ["body", _literal(tag), "value"]
+        lines.extend(_render_call("_render_%s" % cls.name, arguments, "    "))
+    lines.extend(["    return envelope", "", ""])
+
+    lines.append("def deserialize_%s(envelope):" % operation.name)
+    if operation.output_class:
+        tag, cls = operation.output_class
+        lines.extend(
+            [
+                "    body = envelope.find(_BODY)",
+                "    if body is None or len(body) == 0:",
+                "        return None",
+                "    return _unwrap(_parse_%s(body[0]))" % cls.name,
+            ]
+        )
+    else:
+        lines.append("    return None")
+    return "\n".join(lines) + "\n"
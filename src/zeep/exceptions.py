@@ -93,6 +93,18 @@ class IncompleteOperation(Error):
     pass
 
 
+class SnapshotError(Error):
+    pass
+
+
+class BundleError(Error):
+    pass
+
+
+class CodegenError(Error):
+    pass
+
+
 class DTDForbidden(Error):
     def __init__(self, name, sysid, pubid):
         super().__init__()
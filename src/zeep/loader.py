@@ -1,13 +1,62 @@
+import logging
 import os.path
+import threading
 import typing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from lxml import etree
 from lxml.etree import Resolver, XMLParser, XMLSyntaxError, fromstring
 
+from zeep import ns
 from zeep.exceptions import DTDForbidden, EntitiesForbidden, XMLSyntaxError
+from zeep.schemas import get_bundled_schema
 from zeep.settings import Settings
 
+logger = logging.getLogger(__name__)
+
+#: The tags of the elements which reference other documents
+REFERENCE_TAGS = (
+    "{%s}import" % ns.WSDL,
+    "{%s}import" % ns.XSD,
+    "{%s}include" % ns.XSD,
+)
+
+
+class PrefetchedDocuments(dict):
+    """The content of the documents which are retrieved upfront, keyed by
+    their absolute url.
+
+    The documents are parsed to find the documents they reference. These
+    parsed documents are kept as well, so that they are not parsed again when
+    the documents are processed. A parsed document is only handed out once
+    since it may be modified while it is processed.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.nodes = {}
+
+    def update(self, other=(), **kwargs):
+        super().update(other, **kwargs)
+        if isinstance(other, PrefetchedDocuments):
+            self.nodes.update(other.nodes)
+
+    def clear(self):
+        super().clear()
+        self.nodes.clear()
+
+    def pop_node(self, url, content):
+        """Return the parsed document for the url when it is parsed from the
+        given content, otherwise None.
+
+        """
+        if self.get(url) is not content:
+            return None
+        return self.nodes.pop(url, None)
+
 
 class ImportResolver(Resolver):
     """Custom lxml resolve to use the transport object"""
@@ -48,19 +97,81 @@ def parse_xml(content: str, transport, base_url=None, settings=None):
     parser.resolvers.add(ImportResolver(transport))
     try:
         elementtree = fromstring(content, parser=parser, base_url=base_url)
-        docinfo = elementtree.getroottree().docinfo
-        if docinfo.doctype:
-            if settings.forbid_dtd:
-                raise DTDForbidden(
-                    docinfo.doctype, docinfo.system_url, docinfo.public_id
-                )
-        if settings.forbid_entities:
-            for dtd in docinfo.internalDTD, docinfo.externalDTD:
-                if dtd is None:
-                    continue
-                for entity in dtd.iterentities():
-                    raise EntitiesForbidden(entity.name, entity.content)
+        check_docinfo(elementtree.getroottree().docinfo, settings)
+        return elementtree
+    except etree.XMLSyntaxError as exc:
+        raise XMLSyntaxError(
+            "Invalid XML content received (%s)" % exc.msg, content=content
+        )
+
+
+class _ParserPool(threading.local):
+    """The parsers used for responses, per thread (lxml parsers can't be used
+    by multiple threads at the same time) and keyed by the parse settings.
+
+    """
+
+    def __init__(self):
+        self.parsers = {}
+
+    def get(self, transport, settings):
+        """Return the parser for the given settings, the ImportResolver of
+        the parser is bound to the given transport.
+
+        """
+        fast = settings.xml_fast_responses
+        # No resolver is needed when external resources may not be loaded
+        use_resolver = not (fast and settings.forbid_external)
+        key = (not settings.strict, settings.xml_huge_tree, fast, use_resolver)
+
+        try:
+            parser, resolver = self.parsers[key]
+        except KeyError:
+            parser = XMLParser(
+                remove_comments=True,
+                resolve_entities=False,
+                recover=not settings.strict,
+                huge_tree=settings.xml_huge_tree,
+                remove_blank_text=fast,
+                collect_ids=not fast,
+            )
+            resolver = None
+            if use_resolver:
+                resolver = ImportResolver(transport)
+                parser.resolvers.add(resolver)
+            self.parsers[key] = parser, resolver
+
+        if resolver is not None:
+            resolver.transport = transport
+        return parser
+
 
+_parser_pool = _ParserPool()
+
+
+def parse_response(content, transport, settings=None):
+    """Parse the XML content of a response and return the root Element.
+
+    This is the same as :func:`parse_xml`, but the parser is reused for all
+    responses which are parsed in the same thread with the same settings.
+    When the `xml_fast_responses` setting is enabled ignorable whitespace is
+    removed and the ids in the document are not collected.
+
+    :param content: The XML string
+    :type content: bytes
+    :param transport: The transport instance to load external documents
+    :type transport: zeep.transports.Transport
+    :param settings: A zeep.settings.Settings object containing parse settings.
+    :type settings: zeep.settings.Settings
+    :returns: The document root
+    :rtype: lxml.etree._Element
+
+    """
+    settings = settings or Settings()
+    parser = _parser_pool.get(transport, settings)
+    try:
+        elementtree = fromstring(content, parser=parser)
+        check_docinfo(elementtree.getroottree().docinfo, settings)
         return elementtree
     except etree.XMLSyntaxError as exc:
         raise XMLSyntaxError(
@@ -68,8 +179,33 @@ def parse_xml(content: str, transport, base_url=None, settings=None):
         )
 
 
+def check_docinfo(docinfo, settings):
+    """Raise an exception when the document contains a DTD or entities which
+    are forbidden by the settings.
+
+    :param docinfo: The docinfo of the parsed document
+    :type docinfo: lxml.etree.DocInfo
+    :param settings: A zeep.settings.Settings object containing parse settings.
+    :type settings: zeep.settings.Settings
+
+    """
+    if docinfo.doctype:
+        if settings.forbid_dtd:
+            raise DTDForbidden(docinfo.doctype, docinfo.system_url, docinfo.public_id)
+    if settings.forbid_entities:
+        for dtd in docinfo.internalDTD, docinfo.externalDTD:
+            if dtd is None:
+                continue
+            for entity in dtd.iterentities():
+                raise EntitiesForbidden(entity.name, entity.content)
+
+
 def load_external(
-    url: typing.Union[typing.IO, str], transport, base_url=None, settings=None
+    url: typing.Union[typing.IO, str],
+    transport,
+    base_url=None,
+    settings=None,
+    prefetched=None,
 ):
     """Load an external XML document.
 
@@ -78,18 +214,72 @@ def load_external(
     :param base_url:
     :param settings: A zeep.settings.Settings object containing parse settings.
     :type settings: zeep.settings.Settings
+    :param prefetched: Mapping with the content of documents which are
+      already retrieved, keyed by their absolute url.
+    :type prefetched: dict
 
     """
     settings = settings or Settings()
     if hasattr(url, "read"):
         content = url.read()
     else:
-        if base_url:
-            url = absolute_location(url, base_url)
-        content = transport.load(url)
+        url, content = load_content(
+            url, transport, base_url, prefetched=prefetched, settings=settings
+        )
+        node = get_prefetched_node(prefetched, url, content)
+        if node is not None:
+            return node
     return parse_xml(content, transport, base_url, settings=settings)
 
 
+def get_prefetched_node(prefetched, url, content):
+    """Return the already parsed document for the prefetched content of the
+    url, None when it needs to be parsed.
+
+    :param prefetched: The prefetched documents
+    :type prefetched: zeep.loader.PrefetchedDocuments
+    :param url: The absolute url of the document
+    :type url: str
+    :param content: The content which is retrieved for the url
+    :type content: bytes
+    :rtype: lxml.etree._Element
+
+    """
+    if not isinstance(prefetched, PrefetchedDocuments):
+        return None
+    return prefetched.pop_node(url, content)
+
+
+def load_content(url: str, transport, base_url=None, prefetched=None, settings=None):
+    """Return the absolute url and the content of an external document.
+
+    Well-known schemas are served from the copies bundled with zeep unless
+    the `xsd_bundled_schemas` setting is disabled.
+
+    :param url: The (relative) url of the document
+    :type url: str
+    :param transport: The transport instance to load the document
+    :type transport: zeep.transports.Transport
+    :param base_url: The base url, used to make relative urls absolute
+    :type base_url: str
+    :param prefetched: Mapping with the content of documents which are
+      already retrieved, keyed by their absolute url.
+    :type prefetched: dict
+    :param settings: A zeep.settings.Settings object
+    :type settings: zeep.settings.Settings
+    :rtype: tuple
+
+    """
+    if base_url:
+        url = absolute_location(url, base_url)
+    content = prefetched.get(url) if prefetched else None
+    if content is None:
+        content = _get_bundled_schema(url, settings)
+    if content is None:
+        content = transport.load(url)
+    return url, content
+
+
 async def load_external_async(url: typing.IO, transport, base_url=None, settings=None):
     """Load an external XML document.
 
@@ -106,10 +296,191 @@ async def load_external_async(url: typing.IO, transport, base_url=None, settings
     else:
         if base_url:
             url = absolute_location(url, base_url)
-        content = await transport.load(url)
+        content = _get_bundled_schema(url, settings)
+        if content is None:
+            content = await transport.load_async(url)
     return parse_xml(content, transport, base_url, settings=settings)
 
 
+def load_documents(locations, transport, settings=None, max_workers=8):
+    """Retrieve the documents at the given locations and all documents which
+    are (transitively) referenced by them.
+
+    The documents are retrieved level by level, all documents referenced on
+    the same level are retrieved concurrently using a pool of threads.
+    Documents which can't be retrieved or parsed are skipped, they are loaded
+    again (and the error is raised) when the document is processed.
+
+    :param locations: The absolute locations of the documents
+    :type locations: list
+    :param transport: The transport instance to load the documents
+    :type transport: zeep.transports.Transport
+    :param settings: A zeep.settings.Settings object containing parse settings.
+    :type settings: zeep.settings.Settings
+    :param max_workers: The maximum number of concurrent requests
+    :type max_workers: int
+    :returns: dict with the absolute url as key and the content as value
+    :rtype: zeep.loader.PrefetchedDocuments
+
+    """
+    settings = settings or Settings()
+    documents = PrefetchedDocuments()
+    seen = set()
+    pending = _unseen(locations, seen)
+    if not pending:
+        return documents
+
+    def load(url):
+        try:
+            content = _get_bundled_schema(url, settings)
+            if content is None:
+                content = cached.get(url)
+            if content is None:
+                content = transport.load(url)
+            return content
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            # Retrieve the cached documents of this level in a single request
+            # when the cache supports it
+            cached = _load_cached(transport, pending, settings)
+            results = executor.map(load, pending)
+            pending = _process_documents(
+                pending, results, documents, seen, transport, settings
+            )
+    return documents
+
+
+async def load_documents_async(location, transport, settings=None):
+    """Retrieve the document at the given location and all documents which
+    are (transitively) referenced by it.
+
+    This is the asynchronous version of :func:`load_documents`, all documents
+    on the same level are retrieved concurrently via the async transport.
+
+    :param location: The absolute location of the root document
+    :type location: str
+    :param transport: The transport instance to load the documents
+    :type transport: zeep.transports.AsyncTransport
+    :param settings: A zeep.settings.Settings object containing parse settings.
+    :type settings: zeep.settings.Settings
+    :returns: dict with the absolute url as key and the content as value
+    :rtype: zeep.loader.PrefetchedDocuments
+
+    """
+    import asyncio
+
+    settings = settings or Settings()
+    documents = PrefetchedDocuments()
+    seen = set()
+    pending = _unseen([location], seen)
+
+    async def load(url):
+        content = _get_bundled_schema(url, settings)
+        if content is None:
+            content = cached.get(url)
+        if content is None:
+            content = await transport.load_async(url)
+        return content
+
+    while pending:
+        cached = _load_cached(transport, pending, settings)
+        results = await asyncio.gather(
+            *[load(url) for url in pending], return_exceptions=True
+        )
+        pending = _process_documents(
+            pending, results, documents, seen, transport, settings
+        )
+    return documents
+
+
+def find_references(node, location, settings):
+    """Return the locations of the documents referenced by the given document
+    via wsdl:import, xsd:import or xsd:include statements.
+
+    The locations are made absolute in the same way as when the document is
+    processed.
+
+    :param node: The document root
+    :type node: lxml.etree._Element
+    :param location: The location of the document
+    :type location: str
+    :param settings: A zeep.settings.Settings object
+    :type settings: zeep.settings.Settings
+    :rtype: list
+
+    """
+    result = []
+    for child in node.iter(*REFERENCE_TAGS):
+        if child.tag == REFERENCE_TAGS[0]:
+            value = child.get("location")
+            if value:
+                result.append(absolute_location(value, location))
+        elif child.tag == REFERENCE_TAGS[1]:
+            value = child.get("schemaLocation")
+            if value:
+                result.append(normalize_location(settings, value, location))
+        else:
+            value = child.get("schemaLocation")
+            if value:
+                result.append(absolute_location(value, location))
+    return list(OrderedDict.fromkeys(result))
+
+
+def _process_documents(urls, results, documents, seen, transport, settings):
+    """Store the retrieved documents and return the locations of the
+    documents referenced by them which are not retrieved yet.
+
+    """
+    references = []
+    for url, content in zip(urls, results):
+        if isinstance(content, Exception):
+            logger.debug("Unable to prefetch %s: %s", url, content)
+            continue
+        documents[url] = content
+        try:
+            node = parse_xml(content, transport, url, settings=settings)
+        except Exception as exc:
+            logger.debug("Unable to parse prefetched document %s: %s", url, exc)
+            continue
+        documents.nodes[url] = node
+        references.extend(find_references(node, url, settings))
+    return _unseen(references, seen)
+
+
+def _load_cached(transport, urls, settings):
+    """Return the content of the documents which are in the cache of the
+    transport, retrieved via a single request when the cache supports it.
+
+    """
+    load_cached = getattr(transport, "load_cached", None)
+    urls = [url for url in urls if _get_bundled_schema(url, settings) is None]
+    if load_cached is None or not urls:
+        return {}
+    try:
+        return load_cached(urls)
+    except Exception as exc:
+        logger.debug("Unable to retrieve the cached documents: %s", exc)
+        return {}
+
+
+def _get_bundled_schema(url, settings):
+    if settings is not None and not settings.xsd_bundled_schemas:
+        return None
+    return get_bundled_schema(url)
+
+
+def _unseen(urls, seen):
+    result = []
+    for url in urls:
+        if url not in seen:
+            seen.add(url)
+            result.append(url)
+    return result
+
+
 def normalize_location(settings, url, base_url):
     """Return a 'normalized' url for the given url.
 
@@ -0,0 +1,255 @@
+"""
+zeep.pool
+~~~~~~~~~
+
+Process-wide pool of parsed wsdl documents. Creating a client for a wsdl
+which is already in the pool only creates a lightweight client object on top
+of the shared :class:`zeep.wsdl.Document`.
+
+Concurrent requests for the same wsdl are deduplicated: the wsdl is loaded
+by the first caller while the other callers wait for the result.
+
+A document is only shared between clients which use the same transport and
+the same settings object. The document is parsed with these settings and
+its imports are loaded via this transport, so the settings of a client (for
+example ``with client.settings(strict=False)``) apply to the responses it
+receives, and documents retrieved with the credentials or session of one
+transport are not used by clients with another transport. Clients which
+create a new transport for every request therefore never share a document.
+
+Clients which only use a subset of the operations (see the ``operations``
+argument of :class:`zeep.Client`) share the document with the clients for
+the same operations.
+
+"""
+
+import logging
+import os.path
+import threading
+import time
+from collections import OrderedDict
+
+from zeep.loader import is_relative_path
+from zeep.settings import Settings
+from zeep.transports import Transport
+from zeep.wsdl import Document
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ClientPool"]
+
+
+class _Call:
+    """A pending load of a wsdl document."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class ClientPool:
+    """Pool of parsed wsdl documents keyed by the location of the wsdl.
+
+    Example::
+
+        pool = zeep.ClientPool(maxsize=16, ttl=3600)
+
+        # In the request handlers
+        client = pool.client("http://example.com/?wsdl")
+
+    :param maxsize: The maximum number of wsdl documents which are kept, the
+      least recently used document is removed first. Use None for no limit.
+    :type maxsize: int
+    :param ttl: The number of seconds a wsdl document is kept after it is
+      loaded. Use None to keep the documents until they are evicted.
+    :type ttl: int
+    :param transport: The transport used to load the wsdl documents and the
+      default transport of the clients. When not given a transport is
+      created once per client class.
+    :type transport: zeep.transports.Transport
+    :param settings: The default settings of the clients. When not given a
+      settings object is created which is used by all clients.
+    :type settings: zeep.settings.Settings
+
+    """
+
+    def __init__(self, maxsize=32, ttl=None, transport=None, settings=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.transport = transport
+        self.settings = settings or Settings()
+        self._lock = threading.Lock()
+        self._documents = OrderedDict()
+        self._calls = {}
+        self._default_transports = {}
+
+    def __len__(self):
+        return len(self._documents)
+
+    def client(self, wsdl, client_class=None, **kwargs):
+        """Return a new client for the given wsdl, the parsed wsdl document
+        is shared with the other clients of the pool.
+
+        Accepts the same keyword arguments as :class:`zeep.Client`.
+
+        :param wsdl: Url or local path of the wsdl
+        :type wsdl: str
+        :param client_class: The class of the client, defaults to
+          :class:`zeep.Client`.
+        :rtype: zeep.Client
+
+        """
+        if client_class is None:
+            from zeep.client import Client as client_class
+
+        settings = kwargs.pop("settings", None) or self.settings
+        transport = kwargs.pop("transport", None) or self._get_transport(
+            client_class
+        )
+        operations = kwargs.pop("operations", None)
+
+        document = self.get_document(
+            wsdl, transport=transport, settings=settings, operations=operations
+        )
+        return client_class(
+            document, transport=transport, settings=settings, **kwargs
+        )
+
+    def get_document(self, wsdl, transport=None, settings=None, operations=None):
+        """Return the parsed wsdl document for the given location.
+
+        The document is loaded when it is not available in the pool for the
+        given transport, settings and operations or when it is expired.
+
+        :param wsdl: Url or local path of the wsdl
+        :type wsdl: str
+        :param transport: The transport used when the wsdl is loaded
+        :type transport: zeep.transports.Transport
+        :param settings: The settings used when the wsdl is loaded
+        :type settings: zeep.settings.Settings
+        :param operations: The names of the operations which are kept when
+          the wsdl is loaded, see :class:`zeep.Client`.
+        :type operations: list of str
+        :rtype: zeep.wsdl.Document
+
+        """
+        settings = settings or self.settings
+        transport = transport or self._get_transport()
+        key = self._get_key(wsdl, transport, settings, operations)
+
+        with self._lock:
+            document = self._get_cached(key)
+            if document is not None:
+                return document
+
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = Document(
+                key[0], transport, settings=settings, operations=operations
+            )
+        except BaseException as exc:
+            call.exception = exc
+            raise
+        else:
+            with self._lock:
+                self._add(key, call.result)
+            return call.result
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def remove(self, wsdl, transport=None, settings=None, operations=None):
+        """Remove the wsdl document for the given location from the pool.
+
+        :param wsdl: Url or local path of the wsdl
+        :type wsdl: str
+        :param transport: The transport the wsdl is loaded with
+        :type transport: zeep.transports.Transport
+        :param settings: The settings the wsdl is loaded with
+        :type settings: zeep.settings.Settings
+        :param operations: The operations the wsdl is loaded with
+        :type operations: list of str
+
+        """
+        settings = settings or self.settings
+        transport = transport or self._get_transport()
+        key = self._get_key(wsdl, transport, settings, operations)
+        with self._lock:
+            self._documents.pop(key, None)
+
+    def clear(self):
+        """Remove all wsdl documents from the pool."""
+        with self._lock:
+            self._documents.clear()
+
+    def _get_transport(self, client_class=None):
+        """Return the transport of the pool, or the default transport for the
+        client class which is shared by the clients of that class.
+
+        """
+        if self.transport is not None:
+            return self.transport
+
+        with self._lock:
+            transport = self._default_transports.get(client_class)
+            if transport is None:
+                if client_class is None:
+                    transport = Transport()
+                else:
+                    transport = client_class._default_transport()
+                self._default_transports[client_class] = transport
+            return transport
+
+    def _get_cached(self, key):
+        try:
+            document, expires = self._documents[key]
+        except KeyError:
+            return None
+
+        if expires is not None and expires <= time.monotonic():
+            logger.debug("Wsdl document %s is expired", key[0])
+            del self._documents[key]
+            return None
+
+        self._documents.move_to_end(key)
+        return document
+
+    def _add(self, key, document):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._documents[key] = (document, expires)
+        self._documents.move_to_end(key)
+
+        if self.maxsize is not None:
+            while len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+    def _get_key(self, wsdl, transport, settings, operations=None):
+        if not isinstance(wsdl, str):
+            raise TypeError("The wsdl should be an url or path, not %r" % wsdl)
+
+        location = wsdl
+        if is_relative_path(location):
+            location = os.path.abspath(location)
+
+        if operations is not None:
+            operations = tuple(sorted(set(operations)))
+
+        # The objects are referenced by the document, so their ids are not
+        # reused while the document is in the pool.
+        return location, id(transport), id(settings), operations
+
+
+#: The pool used by :meth:`zeep.Client.shared`
+default_pool = ClientPool()
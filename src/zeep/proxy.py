@@ -12,7 +12,7 @@ class OperationProxy:
 
     @property
     def __doc__(self):
-        return str(self._proxy._binding._operations[self._op_name])
+        return str(self._proxy._binding.get(self._op_name))
 
     def _merge_soap_headers(self, operation_soap_headers):
         default_headers = self._proxy._client._default_soapheaders
@@ -51,6 +51,29 @@ class OperationProxy:
             kwargs,
         )
 
+    def stream(self, *args, **kwargs):
+        """Call the operation and iterate over the items in the response as
+        they are received.
+
+        Only the first element in the response which can occur multiple
+        times is deserialized, so that large responses can be processed with
+        bounded memory usage.
+
+        :rtype: iterator of zeep.xsd.CompoundValue
+
+        """
+        soap_headers = self._merge_soap_headers(kwargs.get("_soapheaders"))
+        if soap_headers:
+            kwargs["_soapheaders"] = soap_headers
+
+        return self._proxy._binding.send_stream(
+            self._proxy._client,
+            self._proxy._binding_options,
+            self._op_name,
+            args,
+            kwargs,
+        )
+
 
 class AsyncOperationProxy(OperationProxy):
     async def __call__(self, *args, **kwargs):
@@ -69,6 +92,25 @@ class AsyncOperationProxy(OperationProxy):
             kwargs,
         )
 
+    def stream(self, *args, **kwargs):
+        """Call the operation and asynchronously iterate over the items in
+        the response as they are received.
+
+        :rtype: async iterator of zeep.xsd.CompoundValue
+
+        """
+        soap_headers = self._merge_soap_headers(kwargs.get("_soapheaders"))
+        if soap_headers:
+            kwargs["_soapheaders"] = soap_headers
+
+        return self._proxy._binding.send_stream_async(
+            self._proxy._client,
+            self._proxy._binding_options,
+            self._op_name,
+            args,
+            kwargs,
+        )
+
 
 class ServiceProxy:
     def __init__(self, client, binding, **binding_options):
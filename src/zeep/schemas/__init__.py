@@ -0,0 +1,52 @@
+"""
+zeep.schemas
+~~~~~~~~~~~~
+
+Local copies of well-known schemas which are referenced by many wsdl's (and
+auto-imported by zeep), so that these are not retrieved over the network.
+
+"""
+
+import functools
+import os.path
+
+__all__ = ["get_bundled_schema"]
+
+#: Mapping of the locations of the well-known schemas to the bundled files
+BUNDLED_SCHEMAS = {
+    "http://schemas.xmlsoap.org/soap/encoding/": "soap-encoding.xsd",
+    "https://schemas.xmlsoap.org/soap/encoding/": "soap-encoding.xsd",
+    "http://www.w3.org/2001/xml.xsd": "xml.xsd",
+    "https://www.w3.org/2001/xml.xsd": "xml.xsd",
+    "http://www.w3.org/TR/xmldsig-core/xmldsig-core-schema.xsd": (
+        "xmldsig-core-schema.xsd"
+    ),
+    "https://www.w3.org/TR/xmldsig-core/xmldsig-core-schema.xsd": (
+        "xmldsig-core-schema.xsd"
+    ),
+    "http://www.w3.org/TR/2002/REC-xmldsig-core-20020212/xmldsig-core-schema.xsd": (
+        "xmldsig-core-schema.xsd"
+    ),
+}
+
+
+def get_bundled_schema(url):
+    """Return the content of the bundled copy of the schema at the given
+    url, or None when the schema is not bundled.
+
+    :param url: The absolute url of the schema
+    :type url: str
+    :rtype: bytes
+
+    """
+    filename = BUNDLED_SCHEMAS.get(url)
+    if filename is None:
+        return None
+    return _read(filename)
+
+
+@functools.lru_cache(maxsize=None)
+def _read(filename):
+    path = os.path.join(os.path.dirname(__file__), filename)
+    with open(path, "rb") as fh:
+        return fh.read()
@@ -25,6 +25,11 @@ class Settings:
     :type forbid_external: bool
     :param xml_huge_tree: disable lxml/libxml2 security restrictions and
                           support very deep trees and very long text content
+    :param xml_fast_responses: boolean to indicate whether ignorable
+     whitespace is removed and the ids are not collected when responses are
+     parsed. No resolver for external resources is used when
+     forbid_external is enabled. (default: false)
+    :type xml_fast_responses: boolean
 
     :param force_https: Force all connections to HTTPS if the WSDL is also
       loaded from an HTTPS endpoint. (default: true)
@@ -33,11 +38,39 @@ class Settings:
      transport. This can be used in combination with the context manager
      approach to add http headers for specific calls.
     :type extra_headers: list
+    :param prefetch_workers: The maximum number of documents imported or
+     included by the wsdl which are retrieved concurrently before the wsdl is
+     processed. The documents are then retrieved via the transport from
+     multiple threads, so the transport needs to be thread-safe. With 0 the
+     documents are retrieved one by one while processing the wsdl.
+     (default: 0)
+    :type prefetch_workers: int
+    :param lazy_resolve: boolean to indicate whether the types, elements and
+     operations of the wsdl are only resolved when they are first used
+     instead of when the wsdl is loaded. This speeds up creating a client for
+     large wsdl's of which only a few operations are used. (default: false)
+    :type lazy_resolve: boolean
+    :param operations: The names of the operations which are used. All other
+     operations, and the types and elements which are only used by them, are
+     removed when the wsdl is loaded. Operations are specified as
+     ``operation``, ``port/operation`` or ``service/port/operation``.
+     (default: all operations)
+    :type operations: list
 
     :param xsd_ignore_sequence_order: boolean to indicate whether to enforce sequence
      order when parsing complex types. This is a workaround for servers that
      don't respect sequence order.
     :type xsd_ignore_sequence_order: boolean
+    :param xsd_shared_documents: boolean to indicate whether imported schema
+     documents are shared between all schemas in the process. Identical
+     documents (same location and content) are then only parsed and resolved
+     once. See :mod:`zeep.xsd.registry`.
+    :type xsd_shared_documents: boolean
+    :param xsd_bundled_schemas: boolean to indicate whether the copies of
+     well-known schemas (for example xml.xsd and the soap encoding schema)
+     which are bundled with zeep are used instead of retrieving them.
+     (default: true)
+    :type xsd_bundled_schemas: boolean
     """
 
     strict = attr.ib(default=True)
@@ -46,15 +79,21 @@ class Settings:
     # transport
     force_https = attr.ib(default=True)
     extra_http_headers = attr.ib(default=None)
+    prefetch_workers = attr.ib(default=0)
+    lazy_resolve = attr.ib(default=False)
+    operations = attr.ib(default=None, converter=attr.converters.optional(tuple))
 
     # lxml processing
     xml_huge_tree = attr.ib(default=False)
     forbid_dtd = attr.ib(default=False)
     forbid_entities = attr.ib(default=True)
     forbid_external = attr.ib(default=True)
+    xml_fast_responses = attr.ib(default=False)
 
     # xsd workarounds
     xsd_ignore_sequence_order = attr.ib(default=False)
+    xsd_shared_documents = attr.ib(default=False)
+    xsd_bundled_schemas = attr.ib(default=True)
 
     _tls = attr.ib(default=attr.Factory(threading.local))
 
@@ -0,0 +1,373 @@
+"""
+zeep.snapshot
+~~~~~~~~~~~~~
+
+Store fully resolved wsdl documents on disk. Loading a snapshot skips the
+parsing and resolving of the wsdl and all the xsd documents it references,
+which is the most expensive part of creating a client.
+
+The snapshot is invalidated when the zeep version changes or when the content
+of one of the source documents changes. By default only the local files and
+the documents which are in the cache of the transport are checked, so loading
+a snapshot doesn't require any network access.
+
+Note that snapshots are stored using pickle, so only load snapshots from a
+trusted location.
+
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from lxml import etree
+
+from zeep.exceptions import SnapshotError
+from zeep.loader import is_relative_path
+from zeep.settings import Settings
+from zeep.transports import Transport
+from zeep.utils import get_version
+from zeep.wsdl import Document
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["build", "dump", "load", "load_or_create"]
+
+#: The version of the snapshot format, increment on incompatible changes
+SNAPSHOT_FORMAT = 1
+
+MAGIC = b"ZEEPSNAPSHOT\n"
+
+# The modules of the classes which zeep creates at runtime while processing
+# the xsd documents. These are not importable and are therefore pickled by
+# value instead of by reference.
+DYNAMIC_MODULES = ("zeep.xsd.dynamic_types", "zeep.objects")
+
+
+class _RecordingTransport:
+    """Proxy for the transport which records the hash of all documents which
+    are loaded.
+
+    """
+
+    def __init__(self, transport):
+        self._transport = transport
+        self.sources = {}
+        self.stats = {}
+
+    def load(self, url):
+        content = self._transport.load(url)
+        self.sources[url] = _hash(content)
+        stat = _stat(url)
+        if stat is not None:
+            self.stats[url] = stat
+        return content
+
+    def __getattr__(self, key):
+        return getattr(self._transport, key)
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, fh, transport, **kwargs):
+        super().__init__(fh, **kwargs)
+        self._transport = transport
+
+    def persistent_id(self, obj):
+        # The transport and settings are provided when loading the snapshot
+        if isinstance(obj, Settings):
+            return "settings"
+        if obj is self._transport or isinstance(obj, _RecordingTransport):
+            return "transport"
+        return None
+
+    def reducer_override(self, obj):
+        if isinstance(obj, etree.QName):
+            return etree.QName, (obj.text,)
+
+        if isinstance(obj, type) and obj.__module__ in DYNAMIC_MODULES:
+            # The class is created first and the attributes are set
+            # afterwards so that the attributes can refer to the class.
+            attributes = {
+                key: value
+                for key, value in obj.__dict__.items()
+                if not key.startswith("__")
+            }
+            return (
+                _create_class,
+                (obj.__name__, obj.__bases__, obj.__module__),
+                attributes,
+                None,
+                None,
+                _set_class_attributes,
+            )
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, fh, transport, settings):
+        super().__init__(fh)
+        self._objects = {"transport": transport, "settings": settings}
+
+    def persistent_load(self, pid):
+        try:
+            return self._objects[pid]
+        except KeyError:
+            raise pickle.UnpicklingError("Unsupported persistent id %r" % pid)
+
+
+def _create_class(name, bases, module):
+    return type(name, bases, {"__module__": module})
+
+
+def _set_class_attributes(cls, attributes):
+    for key, value in attributes.items():
+        setattr(cls, key, value)
+    return cls
+
+
+def _hash(content):
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def build(location, transport=None, settings=None):
+    """Create a new wsdl document for which a snapshot can be created.
+
+    This is the same as creating a :class:`zeep.wsdl.Document` except that
+    the documents which are loaded are recorded, so that the snapshot can be
+    invalidated when one of them changes.
+
+    :param location: Location of the wsdl
+    :type location: str
+    :param transport: The transport object to be used
+    :type transport: zeep.transports.Transport
+    :param settings: The settings object
+    :type settings: zeep.settings.Settings
+    :rtype: zeep.wsdl.Document
+
+    """
+    transport = transport if transport is not None else Transport()
+    settings = settings or Settings()
+
+    recorder = _RecordingTransport(transport)
+    document = Document(location, recorder, settings=settings)
+    document.transport = transport
+    document.types._transport = transport
+    document._snapshot_sources = recorder.sources
+    document._snapshot_stats = recorder.stats
+    return document
+
+
+def dump(document, path):
+    """Write a snapshot of the wsdl document to the given path.
+
+    The file is written atomically, so that other processes never read a
+    partially written snapshot.
+
+    :param document: A document created via :func:`build`
+    :type document: zeep.wsdl.Document
+    :param path: The path of the snapshot file
+    :type path: str
+
+    """
+    sources = getattr(document, "_snapshot_sources", None)
+    if sources is None:
+        raise SnapshotError(
+            "The document should be created via zeep.snapshot.build() to "
+            "create a snapshot"
+        )
+
+    # Lazily resolved components refer to the xml nodes, which can't be pickled
+    document.resolve()
+
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": get_version(),
+        "location": document.location,
+        "sources": sources,
+        "stats": getattr(document, "_snapshot_stats", {}),
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".zeep-snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(MAGIC)
+            pickle.dump(header, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler = _Pickler(
+                fh, document.transport, protocol=pickle.HIGHEST_PROTOCOL
+            )
+            pickler.dump(document)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load(path, transport=None, settings=None, location=None, verify=None):
+    """Load a wsdl document from the snapshot at the given path.
+
+    :param path: The path of the snapshot file
+    :type path: str
+    :param transport: The transport object to be used
+    :type transport: zeep.transports.Transport
+    :param settings: The settings object
+    :type settings: zeep.settings.Settings
+    :param location: The location of the wsdl the snapshot should be
+      created from. When given the snapshot is invalid for other locations.
+    :type location: str
+    :param verify: Check that the content of the source documents is not
+      changed. By default only local files (when their modification time or
+      size is changed) and the documents in the cache of the transport are
+      checked. Pass ``True`` to load all documents again via the transport
+      and ``False`` to skip the check.
+    :type verify: bool
+    :raises zeep.exceptions.SnapshotError: when the snapshot is invalid
+    :rtype: zeep.wsdl.Document
+
+    """
+    transport = transport if transport is not None else Transport()
+    settings = settings or Settings()
+
+    try:
+        with open(path, "rb") as fh:
+            if fh.read(len(MAGIC)) != MAGIC:
+                raise SnapshotError("%s is not a zeep snapshot" % path)
+
+            header = pickle.load(fh)
+            _check_header(header, transport, location, verify)
+
+            document = _Unpickler(fh, transport, settings).load()
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        IndexError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as exc:
+        # A corrupt or incompatible snapshot is handled as a stale snapshot
+        raise SnapshotError("Unable to load snapshot %s: %s" % (path, exc))
+
+    document._snapshot_sources = header["sources"]
+    document._snapshot_stats = header.get("stats", {})
+    return document
+
+
+def load_or_create(path, location, transport=None, settings=None, verify=None):
+    """Load the wsdl document from the snapshot at the given path if it is
+    valid, otherwise parse the wsdl and write a new snapshot.
+
+    Example::
+
+        document = zeep.snapshot.load_or_create(
+            "/var/cache/service.snapshot", "http://example.com/?wsdl")
+        client = zeep.Client(document, transport=document.transport)
+
+    :param path: The path of the snapshot file
+    :type path: str
+    :param location: Location of the wsdl
+    :type location: str
+    :param transport: The transport object to be used
+    :type transport: zeep.transports.Transport
+    :param settings: The settings object
+    :type settings: zeep.settings.Settings
+    :param verify: Check that the content of the source documents is not
+      changed, see :func:`load`.
+    :type verify: bool
+    :rtype: zeep.wsdl.Document
+
+    """
+    transport = transport if transport is not None else Transport()
+    settings = settings or Settings()
+
+    if os.path.exists(path):
+        try:
+            return load(path, transport, settings, location=location, verify=verify)
+        except SnapshotError as exc:
+            logger.info("Ignoring snapshot: %s", exc)
+
+    document = build(location, transport, settings)
+    try:
+        dump(document, path)
+    except OSError as exc:
+        logger.warning("Unable to write snapshot %s: %s", path, exc)
+    return document
+
+
+def _check_header(header, transport, location, verify):
+    if header.get("format") != SNAPSHOT_FORMAT:
+        raise SnapshotError("Unsupported snapshot format %r" % header.get("format"))
+
+    if header.get("version") != get_version():
+        raise SnapshotError(
+            "The snapshot is created with zeep %s" % header.get("version")
+        )
+
+    if location is not None and header.get("location") != _location(location):
+        raise SnapshotError(
+            "The snapshot is created for %s" % header.get("location")
+        )
+
+    if verify is False:
+        return
+
+    stats = header.get("stats", {})
+    for url, checksum in header["sources"].items():
+        if verify:
+            content = _load_source(transport, url)
+        elif url in stats:
+            if _stat(url) == tuple(stats[url]):
+                continue
+            content = _load_source(transport, url)
+        else:
+            # Only check remote documents which are available in the cache
+            cache = getattr(transport, "cache", None)
+            content = cache.get(url) if cache is not None else None
+            if content is None:
+                continue
+
+        if _hash(content) != checksum:
+            raise SnapshotError("The content of %s is changed" % url)
+
+
+def _load_source(transport, url):
+    try:
+        return transport.load(url)
+    except Exception as exc:
+        raise SnapshotError("Unable to load %s: %s" % (url, exc))
+
+
+def _stat(url):
+    """Return the modification time and size of the document when it is a
+    local file, otherwise None.
+
+    """
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https"):
+        return None
+    if parsed.scheme == "file":
+        path = url2pathname(parsed.path)
+    else:
+        path = os.path.expanduser(url)
+
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _location(location):
+    # Make the location absolute in the same way as the Document does
+    if is_relative_path(location):
+        return os.path.abspath(location)
+    return location
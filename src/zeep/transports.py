@@ -1,33 +1,35 @@
+import functools
 import logging
 import os
 from contextlib import closing, contextmanager
 from urllib.parse import urlparse
 
-import requests
-from requests import Response
-from requests_file import FileAdapter
-
+from zeep.cache import Base, CacheEntry
 from zeep.exceptions import TransportError
 from zeep.utils import get_media_type, get_version
 from zeep.wsdl.utils import etree_to_string
 
-try:
-    import httpx
-except ImportError:
-    httpx = None
+__all__ = ["AsyncTransport", "Transport"]
 
-try:
-    from packaging.version import Version
 
-    if httpx is None or Version(httpx.__version__) < Version("0.26.0"):
-        HTTPX_PROXY_KWARG_NAME = "proxies"
-    else:
-        HTTPX_PROXY_KWARG_NAME = "proxy"
-except ImportError:
-    Version = None
-    HTTPX_PROXY_KWARG_NAME = None
+@functools.lru_cache(maxsize=None)
+def _import_httpx():
+    """Return the httpx module and the name of the argument to configure the
+    proxy of the httpx clients.
 
-__all__ = ["AsyncTransport", "Transport"]
+    httpx is an optional dependency, it is only imported when the
+    AsyncTransport is used. Returns (None, None) when it is not installed.
+
+    """
+    try:
+        import httpx
+        from packaging.version import Version
+    except ImportError:
+        return None, None
+
+    if Version(httpx.__version__) < Version("0.26.0"):
+        return httpx, "proxies"
+    return httpx, "proxy"
 
 
 class Transport:
@@ -47,6 +49,9 @@ class Transport:
         self.operation_timeout = operation_timeout
         self.logger = logging.getLogger(__name__)
 
+        import requests
+        from requests_file import FileAdapter
+
         self._close_session = not session
         self.session = session or requests.Session()
         self.session.mount("file://", FileAdapter())
@@ -106,6 +111,28 @@ class Transport:
 
         return response
 
+    def connect(self, address):
+        """Open a connection to the given address which is kept in the
+        connection pool of the session, so that the first operation doesn't
+        have to set up the (tls) connection.
+
+        This sends a HEAD request, the response is ignored. Errors are logged
+        instead of raised.
+
+        :param address: The URL of the endpoint
+        :returns: Boolean indicating if the connection succeeded
+        :rtype: bool
+
+        """
+        import requests
+
+        try:
+            self.session.head(address, timeout=self.operation_timeout)
+        except requests.RequestException as exc:
+            self.logger.warning("Unable to connect to %s: %s", address, exc)
+            return False
+        return True
+
     def post_xml(self, address, envelope, headers):
         """Post the envelope xml element to the given address with the headers.
 
@@ -117,6 +144,35 @@ class Transport:
         message = etree_to_string(envelope)
         return self.post(address, message, headers)
 
+    def post_xml_stream(self, address, envelope, headers):
+        """Post the envelope xml element to the given address with the headers
+        without reading the response body.
+
+        The response content can be consumed incrementally via
+        ``response.iter_content()``, the caller is responsible for closing the
+        response.
+
+        """
+        message = etree_to_string(envelope)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "HTTP Post to %s:\n%s", address, message.decode("utf-8")
+            )
+
+        response = self.session.post(
+            address,
+            data=message,
+            headers=headers,
+            timeout=self.operation_timeout,
+            stream=True,
+        )
+        self.logger.debug(
+            "HTTP Response from %s (status: %d), streaming content",
+            address,
+            response.status_code,
+        )
+        return response
+
     def load(self, url):
         """Load the content from the given URL"""
         if not url:
@@ -124,6 +180,15 @@ class Transport:
 
         scheme = urlparse(url).scheme
         if scheme in ("http", "https", "file"):
+            if self._use_conditional_requests():
+                entry = self.cache.get_entry(url)
+                if entry is not None and not entry.expired:
+                    return bytes(entry.content)
+
+                headers = entry.get_conditional_headers() if entry else None
+                response = self._load_remote_response(url, headers=headers)
+                return self._process_load_response(url, response, entry)
+
             if self.cache:
                 response = self.cache.get(url)
                 if response:
@@ -139,12 +204,81 @@ class Transport:
             with open(os.path.expanduser(url), "rb") as fh:
                 return fh.read()
 
+    def load_cached(self, urls):
+        """Return the content of the documents which are available in the
+        cache and not expired. Caches which support it retrieve all the
+        documents in a single request, see :meth:`zeep.cache.Base.get_entries`.
+
+        :param urls: The urls of the documents
+        :type urls: list
+        :returns: dict with the url as key and the content as value
+        :rtype: dict
+
+        """
+        if not self.cache:
+            return {}
+
+        urls = [
+            url for url in urls if urlparse(url).scheme in ("http", "https", "file")
+        ]
+        if isinstance(self.cache, Base):
+            entries = self.cache.get_entries(urls)
+            return {
+                url: bytes(entry.content)
+                for url, entry in entries.items()
+                if not entry.expired
+            }
+
+        result = {}
+        for url in urls:
+            content = self.cache.get(url)
+            if content:
+                result[url] = bytes(content)
+        return result
+
     def _load_remote_data(self, url):
+        return self._load_remote_response(url).content
+
+    def _use_conditional_requests(self):
+        """Return if expired cache entries are revalidated via a conditional
+        request. This is not done when a subclass overrides
+        _load_remote_data(), so that the documents are still retrieved via
+        that method.
+
+        """
+        return (
+            isinstance(self.cache, Base)
+            and type(self)._load_remote_data is Transport._load_remote_data
+        )
+
+    def _load_remote_response(self, url, headers=None):
+        """Retrieve the document at the given url, the headers are used to
+        send a conditional request for a cached document.
+
+        """
         self.logger.debug("Loading remote data from: %s", url)
-        response = self.session.get(url, timeout=self.load_timeout)
+        response = self.session.get(url, headers=headers, timeout=self.load_timeout)
         with closing(response):
-            response.raise_for_status()
-            return response.content
+            if response.status_code != 304:
+                response.raise_for_status()
+
+            # Read the content before the response is closed
+            response.content
+            return response
+
+    def _process_load_response(self, url, response, entry):
+        """Update the cache with the response of a (conditional) request and
+        return the content of the document.
+
+        """
+        if response.status_code == 304 and entry is not None:
+            self.logger.debug("Cached document %s is not modified", url)
+            self.cache.refresh(url)
+            return bytes(entry.content)
+
+        content = response.content
+        self.cache.add_entry(url, CacheEntry.from_response(content, response.headers))
+        return content
 
     @contextmanager
     def settings(self, timeout=None):
@@ -173,8 +307,9 @@ class Transport:
 class AsyncTransport(Transport):
     """Asynchronous Transport class using httpx.
 
-    Note that loading the wsdl is still a sync process since and only the
-    operations can be called via async.
+    Note that loading the wsdl is a sync process unless the client is created
+    via :meth:`zeep.AsyncClient.create`, the operations are always called via
+    async.
 
     """
 
@@ -188,7 +323,8 @@ class AsyncTransport(Transport):
         verify_ssl=True,
         proxy=None,
     ):
-        if httpx is None or HTTPX_PROXY_KWARG_NAME is None:
+        httpx, proxy_kwarg_name = _import_httpx()
+        if httpx is None:
             raise RuntimeError(
                 "To use AsyncTransport, install zeep with the async extras, "
                 "e.g., `pip install zeep[async]`"
@@ -196,7 +332,7 @@ class AsyncTransport(Transport):
 
         self._close_session = False
         self.cache = cache
-        proxy_kwargs = {HTTPX_PROXY_KWARG_NAME: proxy}
+        proxy_kwargs = {proxy_kwarg_name: proxy}
         self.wsdl_client = wsdl_client or httpx.Client(
             verify=verify_ssl,
             timeout=timeout,
@@ -219,15 +355,85 @@ class AsyncTransport(Transport):
     async def aclose(self):
         await self.client.aclose()
 
-    def _load_remote_data(self, url):
-        response = self.wsdl_client.get(url)
-        result = response.read()
+    async def load_async(self, url):
+        """Load the content from the given URL without blocking the event
+        loop. Local files are read directly.
+
+        """
+        if not url:
+            raise ValueError("No url given to load")
+
+        scheme = urlparse(url).scheme
+        if scheme not in ("http", "https"):
+            return self.load(url)
+
+        if self._use_conditional_requests_async():
+            entry = self.cache.get_entry(url)
+            if entry is not None and not entry.expired:
+                return bytes(entry.content)
+
+            headers = entry.get_conditional_headers() if entry else None
+            response = await self._load_remote_response_async(url, headers=headers)
+            return self._process_load_response(url, response, entry)
+
+        if self.cache:
+            response = self.cache.get(url)
+            if response:
+                return bytes(response)
+
+        content = await self._load_remote_data_async(url)
+
+        if self.cache:
+            self.cache.add(url, content)
+        return content
+
+    async def _load_remote_data_async(self, url):
+        response = await self._load_remote_response_async(url)
+        return response.content
+
+    def _use_conditional_requests_async(self):
+        return (
+            isinstance(self.cache, Base)
+            and type(self)._load_remote_data_async
+            is AsyncTransport._load_remote_data_async
+        )
+
+    async def _load_remote_response_async(self, url, headers=None):
+        self.logger.debug("Loading remote data from: %s", url)
+        response = await self.client.get(
+            url, headers=headers, timeout=self.wsdl_client.timeout
+        )
+        await response.aread()
+        self._raise_for_load_status(response)
+        return response
+
+    def _load_remote_response(self, url, headers=None):
+        response = self.wsdl_client.get(url, headers=headers)
+        response.read()
+        self._raise_for_load_status(response)
+        return response
 
+    def _raise_for_load_status(self, response):
+        if response.status_code == 304:
+            return
+        httpx, _ = _import_httpx()
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError:
             raise TransportError(status_code=response.status_code)
-        return result
+
+    async def connect(self, address):
+        """Open a connection to the given address which is kept in the
+        connection pool of the async client. See :meth:`Transport.connect`.
+
+        """
+        httpx, _ = _import_httpx()
+        try:
+            await self.client.head(address)
+        except httpx.HTTPError as exc:
+            self.logger.warning("Unable to connect to %s: %s", address, exc)
+            return False
+        return True
 
     async def post(self, address, message, headers):
         self.logger.debug("HTTP Post to %s:\n%s", address, message)
@@ -249,6 +455,28 @@ class AsyncTransport(Transport):
         response = await self.post(address, message, headers)
         return self.new_response(response)
 
+    async def post_xml_stream(self, address, envelope, headers):
+        """Post the envelope xml element to the given address with the headers
+        without reading the response body.
+
+        The response content can be consumed incrementally via
+        ``response.aiter_bytes()``, the caller is responsible for closing the
+        response via ``response.aclose()``.
+
+        """
+        message = etree_to_string(envelope)
+        self.logger.debug("HTTP Post to %s:\n%s", address, message)
+        request = self.client.build_request(
+            "POST", address, content=message, headers=headers
+        )
+        response = await self.client.send(request, stream=True)
+        self.logger.debug(
+            "HTTP Response from %s (status: %d), streaming content",
+            address,
+            response.status_code,
+        )
+        return response
+
     async def get(self, address, params, headers):
         response = await self.client.get(
             address,
@@ -259,6 +487,8 @@ class AsyncTransport(Transport):
 
     def new_response(self, response):
         """Convert an aiohttp.Response object to a requests.Response object"""
+        from requests import Response
+
         body = response.read()
 
         new = Response()
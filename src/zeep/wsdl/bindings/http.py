@@ -48,6 +48,7 @@ class HttpBinding(Binding):
         return obj
 
     def process_reply(self, client, operation, response):
+        self._resolve_operation(operation.name)
         if response.status_code != 200:
             return self.process_error(response.content)
         return operation.process_reply(response.content)
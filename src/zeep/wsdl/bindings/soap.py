@@ -1,16 +1,16 @@
 import logging
 import typing
+from contextlib import closing
 
 from lxml import etree
-from requests_toolbelt.multipart.decoder import MultipartDecoder
 
 from zeep import ns, plugins, wsa
 from zeep.exceptions import Fault, TransportError, XMLSyntaxError
-from zeep.loader import parse_xml
+from zeep.loader import parse_response
 from zeep.utils import as_qname, get_media_type, qname_attr
-from zeep.wsdl.attachments import MessagePack
 from zeep.wsdl.definitions import Binding, Operation
 from zeep.wsdl.messages import DocumentMessage, RpcMessage
+from zeep.wsdl.messages.streaming import StreamDeserializer
 from zeep.wsdl.messages.xop import process_xop
 from zeep.wsdl.utils import etree_to_string, url_http_to_https
 
@@ -20,6 +20,9 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: The number of bytes read from the response at once when streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class SoapBinding(Binding):
     """Soap 1.1/1.2 binding"""
@@ -163,6 +166,125 @@ class SoapBinding(Binding):
         operation_obj = self.get(operation)
         return self.process_reply(client, operation_obj, response)
 
+    def send_stream(self, client, options, operation, args, kwargs):
+        """Called from the service to stream the reply of the operation.
+
+        Returns a generator which yields the deserialized items of the first
+        repeating element in the output message. The request is sent when
+        the iteration starts.
+
+        :param client: The client with which the operation was called
+        :type client: zeep.client.Client
+        :param options: The binding options
+        :type options: dict
+        :param operation: The operation object from which this is a reply
+        :type operation: zeep.wsdl.definitions.Operation
+        :param args: The args to pass to the operation
+        :type args: tuple
+        :param kwargs: The kwargs to pass to the operation
+        :type kwargs: dict
+
+        """
+        if client.settings.raw_response:
+            raise ValueError(
+                "The raw_response setting is not supported when streaming"
+            )
+
+        operation_obj = self.get(operation)
+        deserializer = StreamDeserializer(operation_obj.output, client.settings)
+
+        envelope, http_headers = self._create(
+            operation, args, kwargs, client=client, options=options
+        )
+        response = client.transport.post_xml_stream(
+            options["address"], envelope, http_headers
+        )
+
+        with closing(response):
+            if not self._can_stream(client, response):
+                yield from self._process_reply_iter(
+                    client, operation_obj, response, deserializer
+                )
+                return
+
+            try:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    yield from deserializer.feed(chunk)
+                yield from deserializer.close()
+            except etree.XMLSyntaxError as exc:
+                raise TransportError(
+                    "Server returned response (%s) with invalid XML: %s."
+                    % (response.status_code, exc),
+                    status_code=response.status_code,
+                )
+
+        if deserializer.is_fault:
+            self.process_error(deserializer.root, operation_obj)
+
+    async def send_stream_async(self, client, options, operation, args, kwargs):
+        """Called from the async service to stream the reply of the operation.
+
+        Returns an async generator which yields the deserialized items of the
+        first repeating element in the output message while the response is
+        received.
+
+        :param client: The client with which the operation was called
+        :type client: zeep.client.AsyncClient
+        :param options: The binding options
+        :type options: dict
+        :param operation: The operation object from which this is a reply
+        :type operation: zeep.wsdl.definitions.Operation
+        :param args: The args to pass to the operation
+        :type args: tuple
+        :param kwargs: The kwargs to pass to the operation
+        :type kwargs: dict
+
+        """
+        if client.settings.raw_response:
+            raise ValueError(
+                "The raw_response setting is not supported when streaming"
+            )
+
+        operation_obj = self.get(operation)
+        deserializer = StreamDeserializer(operation_obj.output, client.settings)
+
+        envelope, http_headers = self._create(
+            operation, args, kwargs, client=client, options=options
+        )
+        response = await client.transport.post_xml_stream(
+            options["address"], envelope, http_headers
+        )
+
+        try:
+            if not self._can_stream(client, response):
+                await response.aread()
+                for item in self._process_reply_iter(
+                    client,
+                    operation_obj,
+                    client.transport.new_response(response),
+                    deserializer,
+                ):
+                    yield item
+                return
+
+            try:
+                async for chunk in response.aiter_bytes():
+                    for item in deserializer.feed(chunk):
+                        yield item
+                for item in deserializer.close():
+                    yield item
+            except etree.XMLSyntaxError as exc:
+                raise TransportError(
+                    "Server returned response (%s) with invalid XML: %s."
+                    % (response.status_code, exc),
+                    status_code=response.status_code,
+                )
+        finally:
+            await response.aclose()
+
+        if deserializer.is_fault:
+            self.process_error(deserializer.root, operation_obj)
+
     def process_reply(self, client, operation, response):
         """Process the XML reply from the server.
 
@@ -174,10 +296,54 @@ class SoapBinding(Binding):
         :type response: requests.Response
 
         """
+        self._resolve_operation(operation.name)
         if response.status_code in (201, 202) and not response.content:
             return None
 
-        elif response.status_code != 200 and not response.content:
+        doc, message_pack = self._load_reply(client, operation, response)
+        if self._is_error(doc, response):
+            return self.process_error(doc, operation)
+
+        result = operation.process_reply(doc)
+
+        if message_pack:
+            message_pack._set_root(result)
+            return message_pack
+        return result
+
+    def _process_reply_iter(self, client, operation, response, deserializer):
+        """Process the complete XML reply and yield the items of the repeating
+        element. Used when the reply cannot be processed incrementally.
+
+        """
+        if response.status_code in (201, 202) and not response.content:
+            return
+
+        doc, message_pack = self._load_reply(client, operation, response)
+        if self._is_error(doc, response):
+            self.process_error(doc, operation)
+            return
+
+        yield from deserializer.iterwalk(doc)
+
+    def _can_stream(self, client, response):
+        """Return if the response can be processed incrementally.
+
+        Error responses, multipart responses, ws-security verification and
+        ingress plugins all require the complete document.
+
+        """
+        content_type = response.headers.get("Content-Type", "text/xml")
+        return (
+            response.status_code == 200
+            and get_media_type(content_type) != "multipart/related"
+            and not client.wsse
+            and not client.plugins
+        )
+
+    def _load_reply(self, client, operation, response):
+        """Parse the XML reply and return the document and the attachments."""
+        if response.status_code != 200 and not response.content:
             raise TransportError(
                 "Server returned HTTP status %d (no content available)"
                 % response.status_code,
@@ -191,6 +357,10 @@ class SoapBinding(Binding):
         # If the reply is a multipart/related then we need to retrieve all the
         # parts
         if media_type == "multipart/related":
+            from requests_toolbelt.multipart.decoder import MultipartDecoder
+
+            from zeep.wsdl.attachments import MessagePack
+
             decoder = MultipartDecoder(
                 response.content, content_type, response.encoding or "utf-8"
             )
@@ -201,7 +371,7 @@ class SoapBinding(Binding):
             content = response.content
 
         try:
-            doc = parse_xml(content, self.transport, settings=client.settings)
+            doc = parse_response(content, self.transport, settings=client.settings)
         except XMLSyntaxError as exc:
             raise TransportError(
                 "Server returned response (%s) with invalid XML: %s.\nContent: %r"
@@ -221,19 +391,17 @@ class SoapBinding(Binding):
         doc, http_headers = plugins.apply_ingress(
             client, doc, response.headers, operation
         )
+        return doc, message_pack
 
-        # If the response code is not 200 or if there is a Fault node available
-        # then assume that an error occured.
-        fault_node = doc.find("soap-env:Body/soap-env:Fault", namespaces=self.nsmap)
-        if response.status_code != 200 or fault_node is not None:
-            return self.process_error(doc, operation)
+    def _is_error(self, doc, response):
+        """Return if the response is an error.
 
-        result = operation.process_reply(doc)
+        If the response code is not 200 or if there is a Fault node available
+        then assume that an error occured.
 
-        if message_pack:
-            message_pack._set_root(result)
-            return message_pack
-        return result
+        """
+        fault_node = doc.find("soap-env:Body/soap-env:Fault", namespaces=self.nsmap)
+        return response.status_code != 200 or fault_node is not None
 
     def process_error(self, doc, operation):
         raise NotImplementedError
@@ -16,6 +16,7 @@ This module defines the definitions which occur within a WSDL document,
 
 """
 
+import threading
 import typing
 import warnings
 from collections import OrderedDict, namedtuple
@@ -31,6 +32,9 @@ else:
 
 MessagePart = namedtuple("MessagePart", ["element", "type"])
 
+# Guards the resolving of operations on first use (see Settings.lazy_resolve)
+_resolve_lock = threading.RLock()
+
 
 class AbstractMessage:
     """Messages consist of one or more logical parts.
@@ -47,16 +51,40 @@ class AbstractMessage:
 
     def __init__(self, name):
         self.name = name
-        self.parts = OrderedDict()
+        self._parts = OrderedDict()
+        self._lazy_parts = None
 
     def __repr__(self):
         return "<%s(name=%r)>" % (self.__class__.__name__, self.name.text)
 
+    @property
+    def parts(self):
+        if self._lazy_parts is not None:
+            self._load_parts()
+        return self._parts
+
     def resolve(self, definitions):
         pass
 
     def add_part(self, name, element):
-        self.parts[name] = element
+        self._parts[name] = element
+
+    def add_lazy_parts(self, func):
+        """Set the callable which returns the parts of this message when they
+        are first used.
+
+        :param func: Callable returning a list of (name, MessagePart) tuples
+        :type func: callable
+
+        """
+        self._lazy_parts = func
+
+    def _load_parts(self):
+        with _resolve_lock:
+            if self._lazy_parts is not None:
+                for name, element in self._lazy_parts():
+                    self._parts[name] = element
+                self._lazy_parts = None
 
 
 class AbstractOperation:
@@ -137,16 +165,48 @@ class Binding:
         self.wsdl = wsdl
         self._operations = {}
 
+        # Operations which are resolved when they are first retrieved
+        self._unresolved_operations = {}
+
     def resolve(self, definitions: Definition) -> None:
         self.port_type = definitions.get("port_types", self.port_name.text)
+        lazy = self.wsdl.settings.lazy_resolve
 
         for name, operation in list(self._operations.items()):
+            if lazy and name in self.port_type.operations:
+                self._unresolved_operations[name] = definitions
+                continue
+
             try:
                 operation.resolve(definitions)
             except IncompleteOperation as exc:
                 warnings.warn(str(exc))
                 del self._operations[name]
 
+    def resolve_operations(self):
+        """Resolve the operations which are otherwise resolved when they are
+        first used (see the lazy_resolve setting).
+
+        """
+        for name in list(self._unresolved_operations):
+            self._resolve_operation(name)
+
+    def _resolve_operation(self, name):
+        if name not in self._unresolved_operations:
+            return
+
+        with _resolve_lock:
+            definitions = self._unresolved_operations.pop(name, None)
+            if definitions is None:
+                return
+
+            try:
+                self._operations[name].resolve(definitions)
+            except Exception:
+                # Don't leave a partially resolved operation behind
+                del self._operations[name]
+                raise
+
     def _operation_add(self, operation):
         # XXX: operation name is not unique
         self._operations[operation.name] = operation
@@ -166,10 +226,13 @@ class Binding:
 
     def get(self, key):
         try:
-            return self._operations[key]
+            operation = self._operations[key]
         except KeyError:
             raise ValueError("No such operation %r on %s" % (key, self.name))
 
+        self._resolve_operation(key)
+        return operation
+
     @classmethod
     def match(cls, node):
         raise NotImplementedError()
@@ -221,6 +284,7 @@ class Operation:
         return retval
 
     def create(self, *args, **kwargs):
+        self.binding._resolve_operation(self.name)
         assert self.input is not None
         return self.input.serialize(*args, **kwargs)
 
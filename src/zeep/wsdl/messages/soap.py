@@ -379,6 +379,16 @@ class SoapMessage(ConcreteMessage):
     def _deserialize_body(self, xmlelement):
         raise NotImplementedError()
 
+    def _get_body_path(self):
+        """Return the localnames of the elements leading from the
+        soap:Envelope to the element which is deserialized via self.body.
+
+        This is used for the streaming deserialization, ``None`` matches
+        every element.
+
+        """
+        raise NotImplementedError()
+
     def _deserialize_headers(self, xmlelement):
         """Deserialize the values in the SOAP:Header element"""
         if not self.header or xmlelement is None:
@@ -453,6 +463,11 @@ class DocumentMessage(SoapMessage):
         result = self.body.parse(xmlelement, self.wsdl.types, context=context)
         return {"body": result}
 
+    def _get_body_path(self):
+        if self._is_body_wrapped:
+            return ["Envelope", "Body"]
+        return ["Envelope", "Body", self.body.qname.localname]
+
     def _resolve_body(self, info, definitions, parts):
         name = etree.QName(self.nsmap["soap-env"], "Body")
 
@@ -550,3 +565,8 @@ class RpcMessage(SoapMessage):
             result = self.body.parse(response_element, self.wsdl.types, context=context)
             return {"body": result}
         return {"body": None}
+
+    def _get_body_path(self):
+        # The name of the wrapper element is not defined, see
+        # _deserialize_body()
+        return ["Envelope", "Body", None]
@@ -0,0 +1,192 @@
+"""
+zeep.wsdl.messages.streaming
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Incremental deserialization of SOAP responses. Instead of building the
+complete lxml tree of the response before processing it, the items of the
+first repeating element in the output message are deserialized as soon as
+their closing tag is received.
+
+"""
+
+from lxml import etree
+
+from zeep import xsd
+from zeep.exceptions import XMLSyntaxError
+from zeep.loader import check_docinfo
+from zeep.xsd.context import XmlParserContext
+
+__all__ = ["StreamDeserializer"]
+
+
+class StreamDeserializer:
+    """Deserialize the repeating element of a SOAP response incrementally.
+
+    The data is passed in chunks via :meth:`feed` which returns the items that
+    are completed by that chunk. Items which are processed are removed from
+    the tree so that the memory usage stays bounded, regardless of the number
+    of items in the response.
+
+    Only the first element in the output message which can occur multiple
+    times is returned, all other elements in the body are ignored.
+
+    :param message: The output message of the operation
+    :type message: zeep.wsdl.messages.soap.SoapMessage
+    :param settings: The settings object
+    :type settings: zeep.settings.Settings
+
+    """
+
+    def __init__(self, message, settings):
+        if not message or not message.body:
+            raise ValueError("The operation doesn't define an output message")
+
+        elements = _find_repeating_element(message.body.type, set())
+        if not elements:
+            raise ValueError(
+                "The output message of %r doesn't contain an element which "
+                "can occur multiple times" % message.operation.name
+            )
+
+        self.message = message
+        self.settings = settings
+        self.root = None
+        self.is_fault = False
+
+        self._item = elements[-1]
+        self._path = message._get_body_path() + [
+            element.qname.localname for element in elements
+        ]
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"),
+            remove_comments=True,
+            resolve_entities=False,
+            recover=not settings.strict,
+            huge_tree=settings.xml_huge_tree,
+        )
+        self._context = XmlParserContext(settings=message.wsdl.settings)
+        self._depth = 0
+        self._matched = 0
+
+    def feed(self, data):
+        """Feed a chunk of the response and return the items which were
+        completed.
+
+        :param data: The chunk of data
+        :type data: bytes
+        :rtype: list
+
+        """
+        self._parser.feed(data)
+        return list(self.process(self._parser.read_events()))
+
+    def close(self):
+        """Signal the end of the response and return the remaining items.
+
+        :rtype: list
+
+        """
+        root = self._parser.close()
+        result = list(self.process(self._parser.read_events()))
+        self.root = root
+        return result
+
+    def iterwalk(self, doc):
+        """Yield the items from an already parsed document.
+
+        :param doc: The soap:Envelope element
+        :type doc: lxml.etree._Element
+
+        """
+        self.root = doc
+        yield from self.process(
+            etree.iterwalk(doc, events=("start", "end")), clear=False
+        )
+
+    def process(self, events, clear=True):
+        """Process the (event, element) tuples from lxml and yield the
+        deserialized items.
+
+        """
+        for event, element in events:
+            if event == "start":
+                if self._depth == 0:
+                    self._check_root(element)
+                elif self._depth == 2 and self._is_fault(element):
+                    self.is_fault = True
+
+                if (
+                    self._depth == self._matched
+                    and self._depth < len(self._path)
+                    and self._path[self._depth]
+                    in (None, etree.QName(element.tag).localname)
+                ):
+                    self._matched += 1
+                self._depth += 1
+                continue
+
+            self._depth -= 1
+            if self._matched <= self._depth:
+                continue
+
+            self._matched = self._depth
+            if self._depth != len(self._path) - 1 or self.is_fault:
+                continue
+
+            yield self._item.parse(
+                element,
+                self.message.wsdl.types,
+                allow_none=True,
+                context=self._context,
+            )
+
+            # Remove the processed item (and all previous siblings) from the
+            # tree to keep the memory usage bounded.
+            if clear:
+                element.clear()
+                parent = element.getparent()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    def _check_root(self, element):
+        check_docinfo(element.getroottree().docinfo, self.settings)
+
+        envelope_qname = etree.QName(self.message.nsmap["soap-env"], "Envelope")
+        if element.tag != envelope_qname:
+            raise XMLSyntaxError(
+                (
+                    "The XML returned by the server does not contain a valid "
+                    + "{%s}Envelope root element. The root element found is %s "
+                )
+                % (envelope_qname.namespace, element.tag)
+            )
+
+    def _is_fault(self, element):
+        return element.tag == etree.QName(self.message.nsmap["soap-env"], "Fault")
+
+
+def _find_repeating_element(xsd_type, seen):
+    """Return the list of elements leading to the first element which can
+    occur multiple times.
+
+    Elements on the same level are preferred above nested elements.
+
+    """
+    if not isinstance(xsd_type, xsd.ComplexType) or id(xsd_type) in seen:
+        return None
+    seen.add(id(xsd_type))
+
+    elements = [
+        element
+        for name, element in xsd_type.elements
+        if isinstance(element, xsd.Element)
+    ]
+    for element in elements:
+        if element.accepts_multiple:
+            return [element]
+
+    for element in elements:
+        result = _find_repeating_element(element.type, seen)
+        if result:
+            return [element] + result
+    return None
@@ -4,6 +4,7 @@ zeep.wsdl.parse
 
 """
 
+import functools
 import typing
 
 from lxml import etree
@@ -44,6 +45,32 @@ def parse_abstract_message(
     if not message_name:
         raise IncompleteMessage("Message element is missing required name attribute")
 
+    msg = definitions.AbstractMessage(message_name)
+
+    # The parts are only looked up in the schema when the message is first
+    # used if the lazy_resolve setting is enabled.
+    if wsdl.wsdl.settings.lazy_resolve:
+        msg.add_lazy_parts(
+            functools.partial(_parse_message_parts, wsdl, message_name, xmlelement)
+        )
+    else:
+        for part_name, part_value in _parse_message_parts(
+            wsdl, message_name, xmlelement
+        ):
+            msg.add_part(part_name, part_value)
+    return msg
+
+
+def _parse_message_parts(
+    wsdl: "Definition", message_name: etree.QName, xmlelement: etree._Element
+) -> typing.List[typing.Tuple[str, definitions.MessagePart]]:
+    """Return the parts of the wsdl:message as (name, MessagePart) tuples.
+
+    :param wsdl: The parent definition instance
+    :param message_name: The qualified name of the message
+    :param xmlelement: The XML node
+
+    """
     parts = []
 
     for part in xmlelement.findall("wsdl:part", namespaces=NSMAP):
@@ -68,12 +95,7 @@ def parse_abstract_message(
 
         message_part = definitions.MessagePart(part_element, part_type)
         parts.append((part_name, message_part))
-
-    # Create the object, add the parts and return it
-    msg = definitions.AbstractMessage(message_name)
-    for part_name, part_value in parts:
-        msg.add_part(part_name, part_value)
-    return msg
+    return parts
 
 
 def parse_abstract_operation(
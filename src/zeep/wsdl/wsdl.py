@@ -4,6 +4,7 @@ zeep.wsdl.wsdl
 
 """
 
+import gc
 import logging
 import operator
 import os
@@ -19,7 +20,7 @@ from zeep.settings import Settings
 from zeep.utils import findall_multiple_ns
 from zeep.wsdl import parse
 from zeep.wsdl.definitions import Binding, PortType, Service
-from zeep.xsd import Schema
+from zeep.xsd import Schema, const, graph
 
 if typing.TYPE_CHECKING:
     from zeep.transports import Transport
@@ -51,16 +52,28 @@ class Document:
     :type base: str
     :param strict: Indicates if strict mode is enabled
     :type strict: bool
+    :param prefetched: Mapping with the content of documents which are
+      already retrieved, keyed by their absolute url.
+    :type prefetched: dict
 
     """
 
     def __init__(
-        self, location, transport: typing.Type["Transport"], base=None, settings=None
+        self,
+        location,
+        transport: typing.Type["Transport"],
+        base=None,
+        settings=None,
+        prefetched=None,
+        operations=None,
     ):
         """Initialize a WSDL document.
 
         The root definition properties are exposed as entry points.
 
+        :param operations: The names of the operations to load, defaults to
+          the ``operations`` setting. See :meth:`_prune`.
+
         """
         self.settings = settings or Settings()
 
@@ -83,7 +96,20 @@ class Document:
             location=self.location,
             settings=self.settings,
         )
-        self.load(location)
+        if prefetched:
+            self.types._prefetched.update(prefetched)
+        elif isinstance(location, str):
+            self.types.prefetch_documents([self.location])
+
+        try:
+            self.load(location)
+        finally:
+            self.types._prefetched.clear()
+
+        if operations is None:
+            operations = self.settings.operations
+        if operations:
+            self._prune(operations)
 
     def load(self, location):
         document = self._get_xml_document(location)
@@ -100,6 +126,221 @@ class Document:
     def __repr__(self):
         return "<WSDL(location=%r)>" % self.location
 
+    def warmup(self, operations=None):
+        """Compute all lazily computed properties of the types, elements and
+        messages in this document upfront.
+
+        These are otherwise computed when they are first used, for example
+        when an operation is called for the first time. The schemas which
+        are imported automatically when they are first referenced (the soap
+        encoding schema) are imported as well.
+
+        :param operations: Only warm up the messages of the given operations
+          and the xsd components used by them. Operations are specified as
+          ``operation``, ``port/operation`` or ``service/port/operation``.
+        :type operations: list of str
+
+        """
+        self.types.import_auto_namespaces()
+        if operations is None:
+            self.resolve()
+            components = self._get_components()
+        else:
+            # The operations (and the components they use) are resolved by
+            # the binding when they are retrieved.
+            found = self._find_operations(operations)
+            components = list(
+                self._get_operation_components([op for port, op in found])
+            )
+            for document in self.types.documents:
+                if document._target_namespace in const.AUTO_IMPORT_NAMESPACES:
+                    if self.settings.lazy_resolve:
+                        document.resolve()
+                    components.extend(_get_document_components(document))
+
+        for component in graph.walk(*components):
+            graph.warmup(component)
+
+    def resolve(self):
+        """Resolve all types, elements and operations which are otherwise
+        only resolved when they are first used.
+
+        This is a no-op unless the ``lazy_resolve`` setting is enabled.
+
+        """
+        if not self.settings.lazy_resolve:
+            return
+
+        for document in self.types.documents:
+            if not document._is_internal:
+                document.resolve()
+
+        for definition in self._definitions.values():
+            for message in definition.messages.values():
+                message._load_parts()
+            for binding in definition.bindings.values():
+                binding.resolve_operations()
+
+    def freeze(self):
+        """Prepare the document to be shared with forked worker processes.
+
+        This computes all lazily computed properties (see :meth:`warmup`) and
+        then moves all objects into the permanent generation of the garbage
+        collector via :func:`gc.freeze`. The garbage collector then no longer
+        visits these objects, so the memory pages holding them stay shared
+        between the processes after forking.
+
+        Note that :func:`gc.freeze` applies to all objects which exist in the
+        process, so call this in the master process right before forking. On
+        Python implementations without :func:`gc.freeze` (PyPy) only the
+        lazily computed properties are computed.
+
+        """
+        self.warmup()
+        if hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+
+    def _prune(self, operations):
+        """Remove all operations except the given ones, and the xsd
+        components which are not used by the remaining operations.
+
+        The operations are specified as ``operation``, ``port/operation`` or
+        ``service/port/operation``. Ports and services without any of the
+        given operations are removed as well.
+
+        :param operations: The names of the operations to keep
+        :type operations: list of str
+
+        """
+        matcher = _OperationMatcher(operations)
+
+        # The allowed operations of the bindings which are used by a port
+        allowed = {}
+        for definition in self._definitions.values():
+            for service_name, service in list(definition.services.items()):
+                for port_name, port in list(service.ports.items()):
+                    names = {
+                        name
+                        for name in port.binding.all()
+                        if matcher.match(service_name, port_name, name)
+                    }
+                    allowed.setdefault(port.binding, set()).update(names)
+                    if not names:
+                        del service.ports[port_name]
+                if not service.ports:
+                    del definition.services[service_name]
+
+        used_operations = {}
+        for definition in self._definitions.values():
+            for binding in definition.bindings.values():
+                if binding in allowed:
+                    names = allowed[binding]
+                else:
+                    names = {
+                        name
+                        for name in binding.all()
+                        if matcher.match(None, None, name)
+                    }
+                for name in list(binding.all()):
+                    if name not in names:
+                        del binding._operations[name]
+                        binding._unresolved_operations.pop(name, None)
+                if binding.port_type is not None:
+                    used_operations.setdefault(binding.port_type, set()).update(names)
+
+        matcher.check()
+
+        # Resolve the remaining operations before the messages are removed,
+        # soap headers can refer to messages of other operations.
+        for definition in self._definitions.values():
+            for binding in definition.bindings.values():
+                binding.resolve_operations()
+
+        # Remove the abstract operations and messages which are not used
+        used_messages = {}
+        for definition in self._definitions.values():
+            for port_type in definition.port_types.values():
+                names = used_operations.get(port_type, set())
+                for name in list(port_type.operations):
+                    if name not in names:
+                        del port_type.operations[name]
+                        continue
+                    operation = port_type.operations[name]
+                    messages = [operation.input_message, operation.output_message]
+                    messages.extend((operation.fault_messages or {}).values())
+                    for message in messages:
+                        if message is not None:
+                            used_messages[id(message)] = message
+
+        for definition in self._definitions.values():
+            for name, message in list(definition.messages.items()):
+                if id(message) not in used_messages:
+                    del definition.messages[name]
+
+        # The elements of the fault messages are looked up when the detail
+        # of a fault is processed.
+        components = list(self._get_operation_components())
+        for message in used_messages.values():
+            for part in message.parts.values():
+                components.extend([part.element, part.type])
+        self.types.prune(components)
+
+    def _find_operations(self, operations):
+        """Return the (port, operation) tuples of the given operations of all
+        services.
+
+        :param operations: The names of the operations, specified as
+          ``operation``, ``port/operation`` or ``service/port/operation``.
+        :type operations: list of str
+        :rtype: list of tuple
+
+        """
+        matcher = _OperationMatcher(operations)
+        result = []
+        for definition in self._definitions.values():
+            for service_name, service in definition.services.items():
+                for port_name, port in service.ports.items():
+                    for name in list(port.binding.all()):
+                        if matcher.match(service_name, port_name, name):
+                            result.append((port, port.binding.get(name)))
+
+        matcher.check()
+        return result
+
+    def _get_components(self):
+        """Yield the global xsd components and the xsd elements of the
+        messages of all operations.
+
+        """
+        for document in self.types.documents:
+            yield from _get_document_components(document)
+
+        yield from self._get_operation_components()
+
+    def _get_operation_components(self, operations=None):
+        """Yield the xsd elements of the messages of the given operations,
+        defaults to all operations.
+
+        """
+        if operations is None:
+            operations = [
+                operation
+                for definition in self._definitions.values()
+                for binding in definition.bindings.values()
+                for operation in binding._operations.values()
+            ]
+
+        for operation in operations:
+            messages = [operation.input, operation.output]
+            messages.extend(operation.faults.values())
+            for message in messages:
+                if message is None:
+                    continue
+                yield getattr(message, "envelope", None)
+                yield getattr(message, "header", None)
+                yield getattr(message, "body", None)
+
     def dump(self):
         print("")
         print("Prefixes:")
@@ -130,6 +371,7 @@ class Document:
                 print(" " * 4, str(port))
                 print(" " * 8, "Operations:")
 
+                port.binding.resolve_operations()
                 operations = sorted(
                     port.binding._operations.values(), key=operator.attrgetter("name")
                 )
@@ -147,7 +389,11 @@ class Document:
 
         """
         return load_external(
-            location, self.transport, self.location, settings=self.settings
+            location,
+            self.transport,
+            self.location,
+            settings=self.settings,
+            prefetched=self.types._prefetched,
         )
 
     def _add_definition(self, definition: "Definition"):
@@ -155,6 +401,76 @@ class Document:
         self._definitions[key] = definition
 
 
+def _get_document_components(document):
+    """Yield the global xsd components of the schema document."""
+    for container in (
+        document._types,
+        document._elements,
+        document._attributes,
+        document._groups,
+        document._attribute_groups,
+    ):
+        yield from container.values()
+
+
+class _OperationMatcher:
+    """Match operations against the ``[service/][port/]operation`` names
+    given by the user and keep track of the names which matched.
+
+    :param operations: The names of the operations
+    :type operations: list of str
+
+    """
+
+    def __init__(self, operations):
+        self._operations = list(operations)
+        self._patterns = [_parse_operation_name(value) for value in operations]
+        self._matched = set()
+
+    def match(self, service_name, port_name, operation_name):
+        """Return boolean indicating if the operation matches one of the
+        names. The service and port name are None for operations of a
+        binding which isn't used by a service.
+
+        """
+        result = False
+        for i, (service, port, operation) in enumerate(self._patterns):
+            if (
+                operation == operation_name
+                and service in (None, service_name)
+                and port in (None, port_name)
+            ):
+                self._matched.add(i)
+                result = True
+        return result
+
+    def check(self):
+        """Raise a ValueError when one of the names didn't match any
+        operation.
+
+        """
+        missing = [
+            value for i, value in enumerate(self._operations) if i not in self._matched
+        ]
+        if missing:
+            raise ValueError(
+                "No operations found for %s" % ", ".join(repr(x) for x in missing)
+            )
+
+
+def _parse_operation_name(value):
+    """Return a (service, port, operation) tuple for the given
+    ``[service/][port/]operation`` string.
+
+    """
+    parts = value.split("/")
+    if len(parts) > 3 or not all(parts):
+        raise ValueError(
+            "Invalid operation %r, expected [service/][port/]operation" % value
+        )
+    return tuple([None] * (3 - len(parts)) + parts)
+
+
 class Definition:
     """The Definition represents one wsdl:definition within a Document.
 
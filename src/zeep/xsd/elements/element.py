@@ -9,7 +9,7 @@ from zeep.utils import qname_attr
 from zeep.xsd.const import Nil, NotSet, xsi_ns
 from zeep.xsd.context import XmlParserContext
 from zeep.xsd.elements.base import Base
-from zeep.xsd.utils import create_prefixed_name, max_occurs_iter
+from zeep.xsd.utils import create_prefixed_name, max_occurs_iter, take_xmlelement
 from zeep.xsd.valueobjects import CompoundValue
 
 logger = logging.getLogger(__name__)
@@ -173,33 +173,13 @@ class Element(Base):
             # Only compare the localname
             if element_tag.localname == self.qname.localname:
                 xmlelement = xmlelements.popleft()
-                num_matches += 1
-                item = self.parse(xmlelement, schema, allow_none=True, context=context)
-                result.append(item)
-            elif (
-                schema is not None
-                and schema.settings.xsd_ignore_sequence_order
-                and list(
-                    filter(
-                        lambda elem: etree.QName(elem.tag).localname
-                        == self.qname.localname,
-                        xmlelements,
-                    )
-                )
-            ):
+            elif schema is not None and schema.settings.xsd_ignore_sequence_order:
                 # Search for the field in remaining elements, not only the leftmost
-                xmlelement = list(
-                    filter(
-                        lambda elem: etree.QName(elem.tag).localname
-                        == self.qname.localname,
-                        xmlelements,
-                    )
-                )[0]
-                xmlelements.remove(xmlelement)
-                num_matches += 1
-                item = self.parse(xmlelement, schema, allow_none=True, context=context)
-                result.append(item)
+                xmlelement = take_xmlelement(xmlelements, self.qname.localname)
             else:
+                xmlelement = None
+
+            if xmlelement is None:
                 # If the element passed doesn't match and the current one is
                 # not optional then throw an error
                 if num_matches == 0 and not self.is_optional:
@@ -209,6 +189,10 @@ class Element(Base):
                     )
                 break
 
+            num_matches += 1
+            item = self.parse(xmlelement, schema, allow_none=True, context=context)
+            result.append(item)
+
         if not self.accepts_multiple:
             result = result[0] if result else None
         return result
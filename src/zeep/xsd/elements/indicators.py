@@ -16,6 +16,9 @@ import copy
 import operator
 from collections import OrderedDict, defaultdict, deque
 from functools import cached_property as threaded_cached_property
+from itertools import islice
+
+from lxml import etree
 
 from zeep.exceptions import UnexpectedElementError, ValidationError
 from zeep.xsd.const import NotSet, SkipValue
@@ -30,6 +33,9 @@ from zeep.xsd.utils import (
 
 __all__ = ["All", "Choice", "Group", "Sequence"]
 
+# Number of xml elements on which a choice element is initially trial parsed
+_TRIAL_WINDOW = 16
+
 
 class Indicator(Base):
     """Base class for the other indicators"""
@@ -349,47 +355,59 @@ class Choice(OrderIndicator):
         :rtype: dict or None
 
         """
-        result = []
+        ignore_order = schema is not None and schema.settings.xsd_ignore_sequence_order
+        if ignore_order:
+            # Elements are matched anywhere in the remaining xml elements, so
+            # try every choice element on a copy of all remaining elements.
+            candidates = [
+                (element_name, element, False, False)
+                for element_name, element, direct, local in self._options
+            ]
+        else:
+            strict = schema is not None and schema.settings.strict
+            table, wildcards = self._dispatch_tables[strict]
 
+        result = []
         for _unused in max_occurs_iter(self.max_occurs):
             if not xmlelements:
                 break
 
-            # Choose out of multiple
-            options = []
-            for element_name, element in self.elements_nested:
-
-                local_xmlelements = copy.copy(xmlelements)
-
-                try:
-                    sub_result = element.parse_xmlelements(
-                        xmlelements=local_xmlelements,
-                        schema=schema,
-                        name=element_name,
-                        context=context,
-                    )
-                except UnexpectedElementError:
-                    continue
-
+            if not ignore_order:
+                candidates = table.get(_localname(xmlelements[0].tag), wildcards)
+
+            # A single element which can start with the xml element consumes
+            # it, so no trial parse is needed
+            if len(candidates) == 1 and candidates[0][2]:
+                element_name, element, direct, local = candidates[0]
+                num_elements = len(xmlelements)
+                sub_result = element.parse_xmlelements(
+                    xmlelements=xmlelements,
+                    schema=schema,
+                    name=element_name,
+                    context=context,
+                )
+                if len(xmlelements) == num_elements:
+                    break
                 if isinstance(element, Element):
                     sub_result = {element_name: sub_result}
+                result.append(sub_result)
+                continue
+
+            # Choose out of multiple, the one which consumes the most elements
+            best = None
+            for element_name, element, direct, local in candidates:
+                option = self._trial_parse(
+                    element, element_name, xmlelements, schema, context, local
+                )
+                if option and (best is None or option[0] > best[0]):
+                    best = option
 
-                num_consumed = len(xmlelements) - len(local_xmlelements)
-                if num_consumed:
-                    options.append((num_consumed, sub_result))
-
-            if not options:
-                xmlelements = []
+            if best is None:
                 break
 
-            # Sort on least left
-            options = sorted(options, key=operator.itemgetter(0), reverse=True)
-            if options:
-                result.append(options[0][1])
-                for i in range(options[0][0]):
-                    xmlelements.popleft()
-            else:
-                break
+            result.append(best[1])
+            for i in range(best[0]):
+                xmlelements.popleft()
 
         if self.accepts_multiple:
             result = {name: result}
@@ -397,6 +415,94 @@ class Choice(OrderIndicator):
             result = result[0] if result else {}
         return result
 
+    def _trial_parse(self, element, element_name, xmlelements, schema, context, local):
+        """Parse the choice element on a copy of the xml elements.
+
+        Returns a tuple with the number of consumed xml elements and the
+        result, or None when the element doesn't match.
+
+        Elements which only consume xml elements from the start (local) are
+        parsed on a small window which is enlarged when it is completely
+        consumed, instead of on a copy of all remaining xml elements.
+
+        """
+        size = _TRIAL_WINDOW if local else len(xmlelements)
+        while True:
+            if size >= len(xmlelements):
+                # Keeps the index of the xml elements (if any)
+                trial_xmlelements = copy.copy(xmlelements)
+            else:
+                trial_xmlelements = deque(islice(xmlelements, size))
+            num_elements = len(trial_xmlelements)
+            try:
+                sub_result = element.parse_xmlelements(
+                    xmlelements=trial_xmlelements,
+                    schema=schema,
+                    name=element_name,
+                    context=context,
+                )
+            except UnexpectedElementError:
+                sub_result = NotSet
+
+            if trial_xmlelements or num_elements == len(xmlelements):
+                break
+            size *= 4
+
+        num_consumed = num_elements - len(trial_xmlelements)
+        if sub_result is NotSet or not num_consumed:
+            return None
+        if isinstance(element, Element):
+            sub_result = {element_name: sub_result}
+        return num_consumed, sub_result
+
+    @threaded_cached_property
+    def _options(self):
+        """List of (name, element, direct, local) tuples for the choice
+        elements.
+
+        Direct elements consume the first xml element when its tag can start
+        them. Local elements only consume xml elements from the start.
+
+        """
+        result = []
+        for element_name, element in self.elements_nested:
+            direct = type(element) in (Element, Any) and (
+                type(element).parse_xmlelements
+                in (Element.parse_xmlelements, Any.parse_xmlelements)
+            )
+            result.append((element_name, element, direct, _is_local(element)))
+        return result
+
+    @threaded_cached_property
+    def _dispatch_tables(self):
+        """Map the localname of the first xml element to the choice elements
+        which can start with it (the FIRST sets of the choice elements).
+
+        Returns a dict with a (table, wildcards) tuple for strict and for
+        non-strict parsing. The wildcards are the choice elements which can
+        start with any xml element and are used for unknown localnames.
+
+        """
+        result = {}
+        for strict in (True, False):
+            wildcards = []
+            first_sets = []
+            for option in self._options:
+                tags, nullable = _first_tags(option[1], strict)
+                if tags is None:
+                    wildcards.append(option)
+                first_sets.append((option, tags))
+
+            table = {}
+            for localname in {tag for __, tags in first_sets for tag in tags or ()}:
+                table[localname] = [
+                    option
+                    for option, tags in first_sets
+                    if tags is None or localname in tags
+                ]
+            result[strict] = table, wildcards
+        return result
+
     def parse_kwargs(self, kwargs, name, available_kwargs):
         """Processes the kwargs for this choice element.
 
@@ -580,6 +686,76 @@ class Choice(OrderIndicator):
         return part
 
 
+def _localname(tag):
+    if isinstance(tag, str):
+        return tag.rpartition("}")[2]
+    return etree.QName(tag).localname
+
+
+def _first_tags(element, strict):
+    """Return the localnames of the xml elements with which the given element
+    can start, and whether it can match without consuming xml elements.
+
+    The localnames are None when the element can start with any xml element.
+    In non-strict mode missing required elements of a sequence are skipped,
+    so a sequence can start with any of its elements.
+
+    :rtype: tuple(set, bool)
+
+    """
+    if isinstance(element, (Element, Any)) and type(element).parse_xmlelements not in (
+        Element.parse_xmlelements,
+        Any.parse_xmlelements,
+    ):
+        return None, True
+
+    if isinstance(element, Any):
+        return None, element.is_optional
+    if isinstance(element, Element):
+        return {element.qname.localname}, element.is_optional
+    if isinstance(element, Group):
+        tags, nullable = _first_tags(element.child, strict)
+        return tags, nullable or element.is_optional
+    if isinstance(element, Choice):
+        result = set()
+        for __, child in element.elements_nested:
+            tags, nullable = _first_tags(child, strict)
+            if tags is None:
+                return None, True
+            result.update(tags)
+        return result, True
+    if isinstance(element, Sequence):
+        result = set()
+        nullable = True
+        for __, child in element.elements_nested:
+            tags, child_nullable = _first_tags(child, strict)
+            if tags is None:
+                return None, True
+            result.update(tags)
+            if strict and not child_nullable:
+                nullable = False
+                break
+        return result, nullable or element.is_optional
+    return None, True
+
+
+def _is_local(element):
+    """Return if the element only consumes xml elements from the start of the
+    given xml elements (so not an xsd:all or an unknown element).
+
+    """
+    if isinstance(element, (Element, Any)):
+        return type(element).parse_xmlelements in (
+            Element.parse_xmlelements,
+            Any.parse_xmlelements,
+        )
+    if isinstance(element, Group):
+        return _is_local(element.child)
+    if isinstance(element, (Choice, Sequence)):
+        return all(_is_local(child) for __, child in element.elements_nested)
+    return False
+
+
 class Sequence(OrderIndicator):
     """Requires the elements in the group to appear in the specified sequence
     within the containing element.
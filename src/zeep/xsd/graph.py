@@ -0,0 +1,97 @@
+"""
+zeep.xsd.graph
+~~~~~~~~~~~~~~
+
+Helpers to traverse the graph of resolved xsd components (elements,
+attributes, indicators and types).
+
+"""
+
+from collections import deque
+from functools import cached_property
+
+from zeep.xsd.elements import Any, AttributeGroup, Element, Group
+from zeep.xsd.elements.base import Base
+from zeep.xsd.elements.indicators import OrderIndicator
+from zeep.xsd.types import ComplexType, ListType, Type, UnionType
+
+__all__ = ["walk", "warmup"]
+
+_COMPONENT_CLASSES = (Base, Type, AttributeGroup)
+
+# Mapping of classes to the names of their cached properties
+_cached_properties = {}
+
+
+def walk(*roots):
+    """Yield all xsd components which are reachable from the given roots.
+
+    Every component is yielded once, breadth-first. Note that this computes
+    the nested elements of the complex types which are visited.
+
+    :param roots: The elements or types to start from
+    :rtype: iterator of components
+
+    """
+    seen = set()
+    queue = deque(roots)
+    while queue:
+        component = queue.popleft()
+        if not isinstance(component, _COMPONENT_CLASSES):
+            continue
+        if id(component) in seen:
+            continue
+        seen.add(id(component))
+
+        yield component
+        queue.extend(_children(component))
+
+
+def warmup(component):
+    """Compute all lazily computed properties of the given component.
+
+    :param component: The xsd component
+    :type component: zeep.xsd.elements.base.Base or zeep.xsd.types.base.Type
+
+    """
+    for name in _get_cached_properties(type(component)):
+        if name == "_array_class" and not component._array_type:
+            continue
+        getattr(component, name)
+
+
+def _children(component):
+    if isinstance(component, ComplexType):
+        yield component._element
+        yield from component._attributes
+        yield component._extension
+        yield component._restriction
+        for name, element in component.elements_nested:
+            yield element
+    elif isinstance(component, OrderIndicator):
+        yield from component
+    elif isinstance(component, Group):
+        yield component.child
+    elif isinstance(component, AttributeGroup):
+        yield from component._attributes
+    elif isinstance(component, ListType):
+        yield component.item_type
+    elif isinstance(component, UnionType):
+        yield from component.item_types
+    elif isinstance(component, (Element, Any)):
+        yield component.type
+
+
+def _get_cached_properties(cls):
+    try:
+        return _cached_properties[cls]
+    except KeyError:
+        pass
+
+    names = []
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if isinstance(value, cached_property) and name not in names:
+                names.append(name)
+    _cached_properties[cls] = names
+    return names
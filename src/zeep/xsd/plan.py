@@ -0,0 +1,270 @@
+"""
+zeep.xsd.plan
+~~~~~~~~~~~~~
+
+Compiled parse plans for complex types.
+
+The generic parser walks the indicators and elements of a complexType for
+every xml element it parses. Most complex types consist of a flat
+xsd:sequence of elements though, for these a plan is compiled once which
+matches the child elements against the expected tags and calls the parsers
+of the child types directly.
+
+Types which can't be compiled (for example types containing a choice, group,
+any element or a soap-enc array) keep using the generic parser, as do all
+types when the ``xsd_ignore_sequence_order`` setting is enabled.
+
+"""
+
+from collections import OrderedDict, deque
+
+from lxml import etree
+
+from zeep.exceptions import XMLParseError
+from zeep.xsd.const import xsi_ns
+from zeep.xsd.context import XmlParserContext
+from zeep.xsd.elements import Element, Sequence
+from zeep.xsd.types.base import Type
+from zeep.xsd.types.complex import ComplexType
+from zeep.xsd.types.simple import AnySimpleType
+from zeep.xsd.valueobjects import CompoundValue
+
+__all__ = ["ParsePlan", "compile_plan"]
+
+_XSI_TYPE = xsi_ns("type")
+_UNBOUNDED = 2**31 - 1
+
+
+def compile_plan(xsd_type):
+    """Return a ParsePlan for the given resolved complex type.
+
+    Returns None when the type isn't a flat sequence of elements and should
+    be parsed via the generic parser.
+
+    :param xsd_type: The complex type
+    :type xsd_type: zeep.xsd.types.complex.ComplexType
+    :rtype: zeep.xsd.plan.ParsePlan
+
+    """
+    if xsd_type._array_type or len(xsd_type.elements_nested) != 1:
+        return None
+
+    container_name, sequence = xsd_type.elements_nested[0]
+    if type(sequence) is not Sequence or sequence.accepts_multiple:
+        return None
+
+    steps = []
+    for name, element in sequence.elements:
+        step = _compile_step(name, element)
+        if step is None:
+            return None
+        steps.append(step)
+
+    attributes = []
+    for name, attribute in xsd_type.attributes:
+        qname = attribute.qname.text if attribute.name else None
+        attributes.append((name, qname, attribute.parse))
+
+    defaults = OrderedDict(sequence.default_value)
+    for name, attribute in xsd_type.attributes:
+        defaults[name] = attribute.default_value
+
+    return ParsePlan(xsd_type._value_class, steps, attributes, defaults)
+
+
+def _compile_step(name, element):
+    """Return the tuple with everything needed to parse the element, or None
+    when the element needs the generic parser.
+
+    """
+    if (
+        not isinstance(element, Element)
+        or type(element).parse_xmlelements is not Element.parse_xmlelements
+        or type(element).parse is not Element.parse
+        or name != element.attr_name
+        or element.type is None
+    ):
+        return None
+
+    xsd_type = element.type
+    parse_kwargs = type(xsd_type).parse_kwargs
+    if parse_kwargs is Type.parse_kwargs:
+        create = None
+    elif parse_kwargs is ComplexType.parse_kwargs:
+        create = xsd_type._create_object
+    else:
+        return None
+
+    # Simple types are parsed inline via their pythonvalue() method
+    simple = (
+        isinstance(xsd_type, AnySimpleType)
+        and type(xsd_type).parse_xmlelement is AnySimpleType.parse_xmlelement
+    )
+
+    max_occurs = element.max_occurs
+    return (
+        name,
+        element.qname.text,
+        element.qname.localname,
+        element.qname.namespace,
+        _UNBOUNDED if max_occurs == "unbounded" else max_occurs,
+        element.is_optional,
+        element.accepts_multiple,
+        element,
+        xsd_type,
+        simple,
+        create,
+    )
+
+
+def _split_tag(tag):
+    """Return the namespace and localname of the given tag"""
+    if isinstance(tag, str):
+        if tag[:1] == "{":
+            namespace, localname = tag[1:].split("}", 1)
+            return namespace, localname
+        return None, tag
+    qname = etree.QName(tag)
+    return qname.namespace, qname.localname
+
+
+class ParsePlan:
+    """Parse xml elements of a complex type which consists of a flat
+    xsd:sequence of elements.
+
+    The result is the same as the one of the generic parser for these types
+    (ComplexType.parse_xmlelement), including the handling of unexpected
+    elements when strict mode is disabled.
+
+    :param value_class: The class of the created values
+    :param steps: The compiled elements of the sequence
+    :param attributes: List of (name, qname, parse) tuples, qname is None
+      for xsd:anyAttribute
+    :param defaults: The default values for the created values
+
+    """
+
+    def __init__(self, value_class, steps, attributes, defaults):
+        self.value_class = value_class
+        self.steps = steps
+        self.attributes = attributes
+        self.defaults = defaults
+        self.lists = [step[0] for step in steps if step[6]]
+
+    def parse(self, xmlelement, schema, strict, allow_none=True, context=None):
+        """Parse the xml element and return a new value object.
+
+        :param xmlelement: The XML element to parse
+        :type xmlelement: lxml.etree._Element
+        :param schema: The parent XML schema
+        :type schema: zeep.xsd.Schema
+        :param strict: Raise an error for unexpected elements
+        :type strict: bool
+        :param allow_none: Return None for empty xml elements
+        :type allow_none: bool
+        :param context: Optional parsing context (for inline schemas)
+        :type context: zeep.xsd.context.XmlParserContext
+        :rtype: zeep.xsd.valueobjects.CompoundValue
+
+        """
+        children = list(xmlelement)
+        attrib = xmlelement.attrib
+        if allow_none and not children and not attrib:
+            return None
+
+        context = context or XmlParserContext()
+        values = self.defaults.copy()
+        for name in self.lists:
+            values[name] = []
+
+        index = 0
+        num_children = len(children)
+        for step in self.steps if children else ():
+            (
+                name,
+                tag,
+                localname,
+                namespace,
+                max_occurs,
+                optional,
+                multiple,
+                element,
+                xsd_type,
+                simple,
+                create,
+            ) = step
+
+            items = []
+            skipped = False
+            while index < num_children and len(items) < max_occurs:
+                child = children[index]
+                if child.tag != tag:
+                    child_namespace, child_localname = _split_tag(child.tag)
+
+                    # Elements from another namespace are left for the next
+                    # elements (and reported as unexpected when unconsumed)
+                    if (
+                        strict
+                        and child_namespace
+                        and namespace
+                        and child_namespace != namespace
+                    ):
+                        skipped = True
+                        break
+                    if child_localname != localname:
+                        break
+
+                if child.get(_XSI_TYPE) is not None:
+                    item = element.parse(
+                        child, schema, allow_none=True, context=context
+                    )
+                elif simple:
+                    try:
+                        text = child.text
+                        item = None if text is None else xsd_type.pythonvalue(text)
+                    except (TypeError, ValueError):
+                        # Let the type handle (and log) the error
+                        item = xsd_type.parse_xmlelement(child, schema, True, context)
+                else:
+                    item = xsd_type.parse_xmlelement(
+                        child, schema, True, context, xsd_type
+                    )
+                items.append(item)
+                index += 1
+
+            if not items and not optional and not skipped:
+                if strict:
+                    raise XMLParseError(
+                        "Unexpected element %r, expected %r"
+                        % (etree.QName(children[index].tag).text, tag)
+                    )
+                value = None
+            elif multiple:
+                value = items
+            else:
+                value = items[0] if items else None
+
+            if create is not None and value is not None:
+                if not isinstance(value, CompoundValue):
+                    value = create(value, name)
+            values[name] = value
+
+            if index == num_children:
+                break
+
+        if index < num_children:
+            if strict:
+                raise XMLParseError("Unexpected element %r" % children[index].tag)
+            values["_raw_elements"] = deque(children[index:])
+
+        if attrib:
+            attrib = dict(attrib)
+            for name, qname, parse in self.attributes:
+                if qname is None:
+                    values[name] = parse(attrib)
+                elif qname in attrib:
+                    values[name] = parse(attrib.pop(qname))
+
+        value = self.value_class.__new__(self.value_class)
+        value.__values__ = values
+        return value
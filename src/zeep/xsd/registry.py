@@ -0,0 +1,205 @@
+"""
+zeep.xsd.registry
+~~~~~~~~~~~~~~~~~
+
+Process-wide registry of resolved schema documents. When enabled via the
+`xsd_shared_documents` setting, schema documents which are imported by
+multiple wsdl's (for example common vendor types) are only parsed and
+resolved once and are shared between the :class:`zeep.xsd.Schema` instances.
+
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+from zeep.xsd import graph
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SchemaDocumentRegistry", "registry"]
+
+
+def checksum(content):
+    """Return the checksum of the content of a document.
+
+    :type content: bytes or str
+    :rtype: str
+
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def create_key(location, content, namespace, settings):
+    """Return the key of a schema document in the registry.
+
+    The namespace is the namespace defined on the xsd:import statement, this
+    is used when the imported document doesn't define a target namespace.
+    The settings which influence how a document is loaded are part of the key
+    as well.
+
+    """
+    return (
+        location,
+        checksum(content),
+        namespace,
+        settings.strict,
+        settings.force_https,
+        settings.xml_huge_tree,
+        settings.forbid_dtd,
+        settings.forbid_entities,
+        settings.forbid_external,
+    )
+
+
+class SchemaDocumentRegistry:
+    """Registry of resolved schema documents and the documents they
+    (transitively) import.
+
+    A document is only registered when all the components it references are
+    defined in the document itself or in the documents it imports, since the
+    document can then be used in any schema.
+
+    :param verify_interval: The number of seconds after which the content of
+      the included and imported documents is verified again when the document
+      is reused. When None the documents are never verified again.
+    :type verify_interval: int
+
+    """
+
+    def __init__(self, verify_interval=3600):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.verify_interval = verify_interval
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, transport):
+        """Return the registered document and the documents it imports.
+
+        The content of all the included and imported documents is verified
+        via the transport once the `verify_interval` is passed since the last
+        verification, if one of them is changed then None is returned.
+
+        :param key: The key created via :func:`create_key`
+        :param transport: The transport to load the documents
+        :type transport: zeep.transports.Transport
+        :rtype: list of zeep.xsd.schema.SchemaDocument
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        documents, sources, verified = entry
+        now = time.monotonic()
+        if self.verify_interval is None or now - verified < self.verify_interval:
+            return documents
+
+        for url, value in sources.items():
+            if url == key[0]:
+                continue
+            try:
+                content = transport.load(url)
+            except Exception as exc:
+                logger.debug("Unable to verify shared document %s: %s", url, exc)
+                return None
+            if checksum(content) != value:
+                logger.debug("Shared document %s is changed", url)
+                with self._lock:
+                    self._entries.pop(key, None)
+                return None
+
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries[key] = (documents, sources, now)
+        return documents
+
+    def add(self, document, schema):
+        """Register the given resolved document.
+
+        :param document: The resolved schema document
+        :type document: zeep.xsd.schema.SchemaDocument
+        :param schema: The schema in which the document is resolved
+        :type schema: zeep.xsd.Schema
+        :returns: Boolean indicating if the document is registered
+        :rtype: bool
+
+        """
+        documents = _get_import_closure(document)
+        if any(doc._registry_key is None for doc in documents):
+            return False
+        if not _is_self_contained(documents, schema):
+            logger.debug("Not sharing %r, it uses external components", document)
+            return False
+
+        sources = {}
+        for doc in documents:
+            sources.update(doc._sources)
+
+        # The sources are loaded while the document is parsed, so they don't
+        # need to be verified until the verify_interval is passed.
+        entry = (documents, sources, time.monotonic())
+        with self._lock:
+            self._entries.setdefault(document._registry_key, entry)
+        return True
+
+    def clear(self):
+        """Remove all registered documents."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _get_import_closure(document):
+    result = []
+    seen = set()
+    queue = [document]
+    while queue:
+        doc = queue.pop(0)
+        if id(doc) in seen:
+            continue
+        seen.add(id(doc))
+        result.append(doc)
+        for documents in doc._imports.values():
+            queue.extend(documents)
+    return result
+
+
+def _get_global_components(documents):
+    for document in documents:
+        for container in (
+            document._types,
+            document._elements,
+            document._attributes,
+            document._groups,
+            document._attribute_groups,
+        ):
+            yield from container.values()
+
+
+def _is_self_contained(documents, schema):
+    """Check that the documents only refer to components defined by the
+    documents themselves (or the builtin xsd types).
+
+    Resolved components don't refer back to the document which defines them,
+    so this is checked via the namespace of the named components.
+
+    """
+    allowed = {None}
+    allowed.update(doc.namespace for doc in documents)
+    allowed.update(doc.namespace for doc in schema.documents if doc._is_internal)
+
+    for component in graph.walk(*_get_global_components(documents)):
+        qname = getattr(component, "qname", None)
+        if qname is not None and qname.namespace not in allowed:
+            return False
+    return True
+
+
+#: The process-wide registry
+registry = SchemaDocumentRegistry()
@@ -1,21 +1,32 @@
 import logging
+import threading
 import typing
 from collections import OrderedDict
 
 from lxml import etree
 
 from zeep import exceptions, ns
-from zeep.loader import load_external
+from zeep.loader import (
+    PrefetchedDocuments,
+    find_references,
+    load_documents,
+    load_external,
+)
 from zeep.settings import Settings
 from zeep.xsd import const
 from zeep.xsd import elements as xsd_elements
+from zeep.xsd import graph
 from zeep.xsd import types as xsd_types
 from zeep.xsd.elements import builtins as xsd_builtins_elements
+from zeep.xsd.registry import registry
 from zeep.xsd.types import builtins as xsd_builtins_types
 from zeep.xsd.visitor import SchemaVisitor
 
 logger = logging.getLogger(__name__)
 
+# Guards the resolving of components on first use (see Settings.lazy_resolve)
+_resolve_lock = threading.RLock()
+
 
 class Schema:
     """A schema is a collection of schema documents."""
@@ -32,6 +43,9 @@ class Schema:
 
         self._transport = transport
 
+        # Content of documents which are retrieved upfront, keyed by url
+        self._prefetched = PrefetchedDocuments()
+
         self.documents = _SchemaContainer()
         self._prefix_map_auto = {}
         self._prefix_map_custom = {}
@@ -42,7 +56,18 @@ class Schema:
             nodes = [node] if node is not None else []
         else:
             nodes = node
-        self.add_documents(nodes, location)
+
+        self.prefetch_documents(
+            [
+                url
+                for node in nodes
+                for url in find_references(node, location, self.settings)
+            ]
+        )
+        try:
+            self.add_documents(nodes, location)
+        finally:
+            self._prefetched.clear()
 
     def __repr__(self):
         main_doc = self.root_document
@@ -84,7 +109,8 @@ class Schema:
         """
         seen = set()
         for document in self.documents:
-            for element in document._elements.values():
+            for qname in list(document._elements):
+                element = document.get_element(qname)
                 if element.qname not in seen:
                     yield element
                     seen.add(element.qname)
@@ -98,7 +124,8 @@ class Schema:
         """
         seen = set()
         for document in self.documents:
-            for type_ in document._types.values():
+            for qname in list(document._types):
+                type_ = document.get_type(qname)
                 if type_.qname not in seen:
                     yield type_
                     seen.add(type_.qname)
@@ -111,15 +138,38 @@ class Schema:
             document = self.create_new_document(node, location)
             resolve_queue.append(document)
 
-        for document in resolve_queue:
-            document.resolve()
+        if not self.settings.lazy_resolve:
+            for document in resolve_queue:
+                document.resolve()
 
+        self._register_shared_documents()
         self._prefix_map_auto = self._create_prefix_map()
 
+    def prefetch_documents(self, locations: typing.List[str]) -> None:
+        """Retrieve the documents at the given locations and the documents
+        they import or include concurrently. The documents are used when the
+        schema documents are processed.
+
+        This is a no-op when the `prefetch_workers` setting is disabled.
+
+        """
+        workers = self.settings.prefetch_workers
+        if not workers or not locations or self._transport is None:
+            return
+
+        documents = load_documents(
+            locations, self._transport, self.settings, max_workers=workers
+        )
+        self._prefetched.update(documents)
+
     def add_document_by_url(self, url: str) -> None:
-        schema_node = load_external(url, self._transport, settings=self.settings)
+        schema_node = load_external(
+            url, self._transport, settings=self.settings, prefetched=self._prefetched
+        )
         document = self.create_new_document(schema_node, url=url)
-        document.resolve()
+        if not self.settings.lazy_resolve:
+            document.resolve()
+        self._register_shared_documents()
 
     def get_element(self, qname) -> xsd_elements.Element:
         """Return a global xsd.Element object with the given qname"""
@@ -178,9 +228,21 @@ class Schema:
             return "soap-env"
         return namespace
 
-    def create_new_document(self, node, url, base_url=None, target_namespace=None):
+    def create_new_document(
+        self,
+        node,
+        url,
+        base_url=None,
+        target_namespace=None,
+        registry_key=None,
+        sources=None,
+    ):
         """
 
+        :param registry_key: The key used to share the document via the
+          process-wide registry once it is resolved.
+        :param sources: Dict with the checksums of the content of the
+          document, keyed by url. Required to share the document.
         :rtype: zeep.xsd.schema.SchemaDocument
 
         """
@@ -191,10 +253,103 @@ class Schema:
             base_url = url
 
         schema = SchemaDocument(namespace, url, base_url)
+        schema._lazy_resolve = self.settings.lazy_resolve
+        schema._registry_key = registry_key
+        schema._sources = sources
         self.documents.add(schema)
         schema.load(self, node)
         return schema
 
+    def add_shared_documents(self, documents):
+        """Add resolved documents from the process-wide registry to this
+        schema, documents which are already available are skipped.
+
+        :type documents: list of zeep.xsd.schema.SchemaDocument
+
+        """
+        for document in documents:
+            existing = self.documents.get_by_namespace_and_location(
+                document.namespace, document._location
+            )
+            if existing is None:
+                self.documents.add(document)
+                document._shared = True
+
+    def _register_shared_documents(self):
+        """Add the resolved documents which can be shared to the
+        process-wide registry.
+
+        """
+        if not self.settings.xsd_shared_documents:
+            return
+
+        for document in list(self.documents):
+            if document._registry_key and document._resolved and not document._shared:
+                document._shared = registry.add(document, self)
+
+    def prune(self, components):
+        """Remove the global components which are not reachable from the
+        given components.
+
+        Global types which extend a reachable type are kept as well, since
+        they can be used via the xsi:type attribute. Documents which are
+        shared via the process-wide registry are not modified.
+
+        :param components: The xsd elements and types which are used
+        :type components: iterable
+
+        """
+        keep = {
+            "type": set(),
+            "element": set(),
+            "group": set(),
+            "attribute": set(),
+            "attribute_group": set(),
+        }
+        value_classes = set()
+
+        def visit(roots):
+            for component in graph.walk(*roots):
+                kind = _get_component_kind(component)
+                qname = getattr(component, "qname", None)
+                if kind is None or qname is None:
+                    continue
+                if isinstance(qname, etree.QName):
+                    qname = qname.text
+                keep[kind].add(qname)
+                if isinstance(component, xsd_types.ComplexType):
+                    value_classes.add(component._value_class)
+
+        documents = [
+            document
+            for document in self.documents
+            if not document._is_internal and not document._shared
+        ]
+
+        visit(components)
+        changed = True
+        while changed:
+            changed = False
+            for document in documents:
+                for qname, type_ in list(document._types.items()):
+                    if qname in keep["type"]:
+                        continue
+                    if _is_extension(type_, keep["type"], value_classes):
+                        visit([document.get_type(qname)])
+                        changed = True
+
+        for document in documents:
+            for kind, items in (
+                ("type", document._types),
+                ("element", document._elements),
+                ("group", document._groups),
+                ("attribute", document._attributes),
+                ("attribute_group", document._attribute_groups),
+            ):
+                for qname in list(items):
+                    if qname not in keep[kind]:
+                        del items[qname]
+
     def merge(self, schema):
         """Merge an other XSD schema in this one"""
         for document in schema.documents:
@@ -277,6 +432,14 @@ class Schema:
             i += 1
         return prefix_map
 
+    def import_auto_namespaces(self):
+        """Import the schemas which are otherwise imported automatically when
+        they are first referenced, see ``const.AUTO_IMPORT_NAMESPACES``.
+
+        """
+        for namespace in const.AUTO_IMPORT_NAMESPACES:
+            self._get_schema_documents(namespace, fail_silently=True)
+
     def _get_schema_documents(self, namespace, fail_silently=False):
         """Return a list of SchemaDocument's for the given namespace.
 
@@ -293,6 +456,39 @@ class Schema:
         return self.documents.get_by_namespace(namespace, fail_silently)
 
 
+def _get_component_kind(component):
+    """Return the kind of the given component as used by :meth:`Schema.prune`"""
+    if isinstance(component, xsd_elements.Attribute):
+        return "attribute"
+    elif isinstance(component, xsd_elements.AttributeGroup):
+        return "attribute_group"
+    elif isinstance(component, xsd_elements.Element):
+        return "element"
+    elif isinstance(component, xsd_elements.Group):
+        return "group"
+    elif isinstance(component, xsd_types.Type):
+        return "type"
+
+
+def _is_extension(type_, type_names, value_classes):
+    """Return if the complex type extends one of the given types.
+
+    Types which are not resolved yet refer to their base type, resolved types
+    only have the value classes of their base types.
+
+    """
+    if not isinstance(type_, xsd_types.ComplexType):
+        return False
+
+    base = type_._extension
+    if base is not None and base.qname is not None:
+        qname = base.qname
+        if isinstance(qname, etree.QName):
+            qname = qname.text
+        return qname in type_names
+    return any(cls in value_classes for cls in type_._extension_types)
+
+
 class _SchemaContainer:
     """Container instances to store multiple SchemaDocument objects per
     namespace.
@@ -376,9 +572,21 @@ class SchemaDocument:
         self._types = {}
 
         self._imports = OrderedDict()
+
+        # Used to share the document via the process-wide registry
+        self._registry_key = None
+        self._sources = None
+        self._shared = False
+
         self._element_form = "unqualified"
         self._attribute_form = "unqualified"
         self._resolved = False
+
+        # Components are resolved when they are first retrieved instead of
+        # via resolve(), the keys of the resolved components are tracked.
+        self._lazy_resolve = False
+        self._resolved_components = set()
+        self._resolving_components = set()
         # self._xml_schema = None
 
     def __repr__(self):
@@ -522,7 +730,7 @@ class SchemaDocument:
 
     def _get_component(self, qname, items, item_name):
         try:
-            return items[qname]
+            value = items[qname]
         except KeyError:
             known_items = ", ".join(items.keys())
             raise exceptions.LookupError(
@@ -541,3 +749,35 @@ class SchemaDocument:
                 item_name=item_name,
                 location=self._location,
             )
+
+        if self._lazy_resolve and not self._resolved:
+            value = self._resolve_component(qname, value, items, item_name)
+        return value
+
+    def _resolve_component(self, qname, value, items, item_name):
+        """Resolve a component when it is retrieved for the first time.
+
+        Recursive references to a component which is being resolved return
+        the component itself, the same as when all components are resolved
+        via :meth:`resolve`.
+
+        """
+        key = (item_name, qname.text if isinstance(qname, etree.QName) else qname)
+        if key in self._resolved_components:
+            return value
+
+        with _resolve_lock:
+            if key in self._resolved_components:
+                return items[key[1]]
+            if key in self._resolving_components:
+                return value
+
+            logger.debug("Resolving %s %s on first use", item_name, key[1])
+            self._resolving_components.add(key)
+            try:
+                value = value.resolve()
+                items[key[1]] = value
+                self._resolved_components.add(key)
+            finally:
+                self._resolving_components.discard(key)
+            return value
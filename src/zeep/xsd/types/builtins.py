@@ -1,12 +1,10 @@
 import base64
 import datetime
+import functools
 import math
 import re
 from decimal import Decimal as _Decimal
 
-import isodate
-import pytz
-
 from zeep.xsd.const import xsd_ns
 from zeep.xsd.types.any import AnyType
 from zeep.xsd.types.simple import AnySimpleType
@@ -49,6 +47,47 @@ def treat_whitespace(behaviour):
     return _treat_whitespace
 
 
+@functools.lru_cache(maxsize=None)
+def _import_isodate():
+    """Return the isodate module, it is imported on first use since it is
+    only needed for the date and time types.
+
+    """
+    import isodate
+
+    return isodate
+
+
+@functools.lru_cache(maxsize=None)
+def _import_pytz():
+    """Return the pytz module, it is imported on first use since it is only
+    needed for values with a timezone.
+
+    """
+    import pytz
+
+    return pytz
+
+
+class _LazyClassAttribute:
+    """Class attribute of which the value is created on first access, the
+    value then replaces the descriptor on the class.
+
+    """
+
+    def __init__(self, func):
+        self._func = func
+
+    def __set_name__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        value = self._func()
+        setattr(self._owner, self._name, value)
+        return value
+
+
 ##
 # Primitive types
 class String(BuiltinType):
@@ -124,16 +163,22 @@ class Double(BuiltinType):
 
 class Duration(BuiltinType):
     _default_qname = xsd_ns("duration")
-    accepted_types = [isodate.duration.Duration, datetime.timedelta, str]
+    accepted_types = _LazyClassAttribute(
+        lambda: [_import_isodate().duration.Duration, datetime.timedelta, str]
+    )
 
     @check_no_collection
     def xmlvalue(self, value):
+        isodate = _import_isodate()
+
         if isinstance(value, str):
             value = isodate.parse_duration(value)
         return isodate.duration_isoformat(value)
 
     @treat_whitespace("collapse")
     def pythonvalue(self, value):
+        isodate = _import_isodate()
+
         if value.startswith("PT-"):
             value = value.replace("PT-", "PT")
             result = isodate.parse_duration(value)
@@ -164,12 +209,15 @@ class DateTime(BuiltinType):
                 ),
             )
 
+        isodate = _import_isodate()
+
         if getattr(value, "microsecond", 0):
             return isodate.isostrf.strftime(value, "%Y-%m-%dT%H:%M:%S.%f%Z")
         return isodate.isostrf.strftime(value, "%Y-%m-%dT%H:%M:%S%Z")
 
     @treat_whitespace("collapse")
     def pythonvalue(self, value):
+        isodate = _import_isodate()
 
         # Determine based on the length of the value if it only contains a date
         # lazy hack ;-)
@@ -189,12 +237,16 @@ class Time(BuiltinType):
         if isinstance(value, str):
             return value
 
+        isodate = _import_isodate()
+
         if value.microsecond:
             return isodate.isostrf.strftime(value, "%H:%M:%S.%f%Z")
         return isodate.isostrf.strftime(value, "%H:%M:%S%Z")
 
     @treat_whitespace("collapse")
     def pythonvalue(self, value):
+        isodate = _import_isodate()
+
         return isodate.parse_time(value)
 
 
@@ -207,10 +259,15 @@ class Date(BuiltinType):
     def xmlvalue(self, value):
         if isinstance(value, str):
             return value
+
+        isodate = _import_isodate()
+
         return isodate.isostrf.strftime(value, "%Y-%m-%d")
 
     @treat_whitespace("collapse")
     def pythonvalue(self, value):
+        isodate = _import_isodate()
+
         try:
             return isodate.parse_date(value)
         except isodate.ISO8601Error:
@@ -552,6 +609,8 @@ def _parse_timezone(val):
     if not val:
         return
 
+    pytz = _import_pytz()
+
     if val == "Z" or val == "+00:00":
         return pytz.utc
 
@@ -568,6 +627,8 @@ def _unparse_timezone(tzinfo):
     if not tzinfo:
         return ""
 
+    pytz = _import_pytz()
+
     if tzinfo == pytz.utc:
         return "Z"
 
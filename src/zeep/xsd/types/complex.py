@@ -24,7 +24,7 @@ from zeep.xsd.elements import (
 from zeep.xsd.elements.indicators import OrderIndicator
 from zeep.xsd.types.any import AnyType
 from zeep.xsd.types.simple import AnySimpleType
-from zeep.xsd.utils import NamePrefixGenerator
+from zeep.xsd.utils import IndexedXmlElements, NamePrefixGenerator
 from zeep.xsd.valueobjects import ArrayValue, CompoundValue
 
 if typing.TYPE_CHECKING:
@@ -159,6 +159,16 @@ class ComplexType(AnyType):
                 result.append((generator.get_name(), self._element))
         return result
 
+    @threaded_cached_property
+    def _parse_plan(self):
+        """The compiled ParsePlan for this type, None if the type needs the
+        generic parser.
+
+        """
+        from zeep.xsd.plan import compile_plan
+
+        return compile_plan(self)
+
     @property
     def _array_type(self):
         attrs = {attr.qname.text: attr for attr in self._attributes if attr.qname}
@@ -186,6 +196,18 @@ class ComplexType(AnyType):
         if not self.attributes and not self.elements:
             return None
 
+        plan = self._parse_plan
+        if plan is not None and schema is not None:
+            settings = schema.settings
+            if not settings.xsd_ignore_sequence_order:
+                value = plan.parse(
+                    xmlelement, schema, settings.strict, allow_none, context
+                )
+                schema_type = schema_type or self
+                if value is not None and getattr(schema_type, "_array_type", None):
+                    return schema_type._array_class.from_value_object(value)
+                return value
+
         attributes = xmlelement.attrib
         init_kwargs = OrderedDict()
 
@@ -200,7 +222,10 @@ class ComplexType(AnyType):
                 xmlelement, schema, name, context=context
             )
         else:
-            elements = deque(xmlelement.iterchildren())
+            if schema is not None and schema.settings.xsd_ignore_sequence_order:
+                elements = IndexedXmlElements(xmlelement.iterchildren())
+            else:
+                elements = deque(xmlelement.iterchildren())
             if allow_none and len(elements) == 0 and len(attributes) == 0:
                 return None
 
@@ -222,7 +247,7 @@ class ComplexType(AnyType):
                 if schema and schema.settings.strict:
                     raise XMLParseError("Unexpected element %r" % elements[0].tag)
                 else:
-                    init_kwargs["_raw_elements"] = elements
+                    init_kwargs["_raw_elements"] = deque(elements)
 
         # Parse attributes
         if attributes:
@@ -1,3 +1,5 @@
+from collections import defaultdict, deque
+
 from zeep import ns
 
 
@@ -25,6 +27,157 @@ class UniqueNameGenerator:
             return name
 
 
+class IndexedXmlElements:
+    """Queue of xml elements which is also indexed on the localname of the
+    elements, it supports the operations of a deque which are used when
+    parsing the xml elements.
+
+    This is used when the xsd_ignore_sequence_order setting is enabled, so
+    that an element can be taken from anywhere in the remaining xml elements
+    without searching them. Within a localname the document order is
+    preserved.
+
+    Elements which are taken from the middle are only marked as consumed,
+    they are skipped when the remaining elements are iterated or when they
+    reach the start or the end of the queue.
+
+    """
+
+    def __init__(self, xmlelements=()):
+        self._elements = list(xmlelements)
+        self._consumed = bytearray(len(self._elements))
+        self._start = 0
+        self._end = len(self._elements)
+        self._size = len(self._elements)
+        self._index = defaultdict(deque)
+        for position, xmlelement in enumerate(self._elements):
+            self._index[_localname(xmlelement.tag)].append(position)
+
+    def take(self, localname):
+        """Remove and return the first xml element with the given localname,
+        or None when there is no such element.
+
+        """
+        queue = self._index.get(localname)
+        while queue:
+            position = queue.popleft()
+            if not self._consumed[position]:
+                return self._consume(position)
+        return None
+
+    def popleft(self):
+        self._skip()
+        if not self._size:
+            raise IndexError("pop from an empty deque")
+        return self._consume(self._start)
+
+    def pop(self):
+        self._skip()
+        if not self._size:
+            raise IndexError("pop from an empty deque")
+        return self._consume(self._end - 1)
+
+    def remove(self, xmlelement):
+        for position in self._positions():
+            if self._elements[position] is xmlelement:
+                self._consume(position)
+                return
+        raise ValueError("deque.remove(x): x not in deque")
+
+    def clear(self):
+        self._start = self._end
+        self._size = 0
+        self._index.clear()
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for position in self._positions():
+            yield self._elements[position]
+
+    def __getitem__(self, index):
+        return self._elements[self._position(index)]
+
+    def __delitem__(self, index):
+        self._consume(self._position(index))
+
+    def __copy__(self):
+        other = self.__class__.__new__(self.__class__)
+        other._elements = self._elements
+        other._consumed = self._consumed[:]
+        other._start = self._start
+        other._end = self._end
+        other._size = self._size
+        other._index = defaultdict(deque)
+        for localname, queue in self._index.items():
+            other._index[localname] = queue.copy()
+        return other
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, list(self))
+
+    def _consume(self, position):
+        self._consumed[position] = 1
+        self._size -= 1
+        return self._elements[position]
+
+    def _skip(self):
+        consumed = self._consumed
+        while self._start < self._end and consumed[self._start]:
+            self._start += 1
+        while self._start < self._end and consumed[self._end - 1]:
+            self._end -= 1
+
+    def _positions(self, reverse=False):
+        self._skip()
+        positions = range(self._start, self._end)
+        if reverse:
+            positions = reversed(positions)
+        consumed = self._consumed
+        return (position for position in positions if not consumed[position])
+
+    def _position(self, index):
+        if index < 0:
+            index, reverse = -index - 1, True
+        else:
+            reverse = False
+        if index >= self._size:
+            raise IndexError("deque index out of range")
+        if index == 0:
+            self._skip()
+            return self._end - 1 if reverse else self._start
+        for i, position in enumerate(self._positions(reverse)):
+            if i == index:
+                return position
+
+
+def take_xmlelement(xmlelements, localname):
+    """Remove and return the first xml element with the given localname from
+    the xml elements, or None when there is no such element.
+
+    :type xmlelements: collections.deque of lxml.etree._Element
+    :type localname: str
+    :rtype: lxml.etree._Element
+
+    """
+    if isinstance(xmlelements, IndexedXmlElements):
+        return xmlelements.take(localname)
+
+    for xmlelement in xmlelements:
+        if _localname(xmlelement.tag) == localname:
+            xmlelements.remove(xmlelement)
+            return xmlelement
+    return None
+
+
+def _localname(tag):
+    # Comments and processing instructions don't have a string tag
+    if isinstance(tag, str):
+        return tag.rpartition("}")[2]
+    return None
+
+
 def max_occurs_iter(max_occurs, items=None):
     assert max_occurs is not None
     generator = range(0, max_occurs if max_occurs != "unbounded" else 2**31 - 1)
@@ -5,11 +5,18 @@ import typing
 from lxml import etree
 
 from zeep.exceptions import XMLParseError
-from zeep.loader import absolute_location, load_external, normalize_location
+from zeep.loader import (
+    absolute_location,
+    get_prefetched_node,
+    load_content,
+    normalize_location,
+    parse_xml,
+)
 from zeep.utils import as_qname, qname_attr
 from zeep.xsd import elements as xsd_elements
 from zeep.xsd import types as xsd_types
 from zeep.xsd.const import AUTO_IMPORT_NAMESPACES, xsd_ns
+from zeep.xsd.registry import checksum, create_key, registry
 from zeep.xsd.types.unresolved import UnresolvedCustomType, UnresolvedType
 
 logger = logging.getLogger(__name__)
@@ -235,7 +242,26 @@ class SchemaVisitor:
             return
 
         # Load the XML
-        schema_node = self._retrieve_data(location, base_url=self.document._location)
+        url, content = self._retrieve_content(
+            location, base_url=self.document._location
+        )
+
+        # Reuse the resolved document from the process-wide registry
+        registry_key = None
+        if self.schema.settings.xsd_shared_documents:
+            registry_key = create_key(
+                location, content, namespace, self.schema.settings
+            )
+            documents = registry.get(registry_key, self.schema._transport)
+            if documents:
+                logger.debug("Using shared schema document: %r", location)
+                self.schema.add_shared_documents(documents)
+                self.register_import(namespace, documents[0])
+                return documents[0]
+
+        schema_node = self._parse_data(
+            content, base_url=self.document._location, url=url
+        )
 
         # Check if the xsd:import namespace matches the targetNamespace. If
         # the xsd:import statement didn't specify a namespace then make sure
@@ -259,7 +285,11 @@ class SchemaVisitor:
             namespace = self.document._target_namespace
 
         schema = self.schema.create_new_document(
-            schema_node, location, target_namespace=namespace
+            schema_node,
+            location,
+            target_namespace=namespace,
+            registry_key=registry_key,
+            sources={url: checksum(content)} if registry_key else None,
         )
         self.register_import(namespace, schema)
         return schema
@@ -289,9 +319,18 @@ class SchemaVisitor:
         if location in self._includes:
             return
 
-        schema_node = self._retrieve_data(location, base_url=self.document._base_url)
+        url, content = self._retrieve_content(
+            location, base_url=self.document._base_url
+        )
+        schema_node = self._parse_data(
+            content, base_url=self.document._base_url, url=url
+        )
         self._includes.add(location)
 
+        # Track the included content for documents which can be shared
+        if self.document._sources is not None:
+            self.document._sources[url] = checksum(content)
+
         # When the included document has no default namespace defined but the
         # parent document does have this then we should (atleast for #360)
         # transfer the default namespace to the included schema. We can't
@@ -1194,9 +1233,21 @@ class SchemaVisitor:
         """
         pass
 
-    def _retrieve_data(self, url: typing.IO, base_url=None):
-        return load_external(
-            url, self.schema._transport, base_url, settings=self.schema.settings
+    def _retrieve_content(self, url: str, base_url=None):
+        return load_content(
+            url,
+            self.schema._transport,
+            base_url,
+            prefetched=self.schema._prefetched,
+            settings=self.schema.settings,
+        )
+
+    def _parse_data(self, content, base_url=None, url=None):
+        node = get_prefetched_node(self.schema._prefetched, url, content)
+        if node is not None:
+            return node
+        return parse_xml(
+            content, self.schema._transport, base_url, settings=self.schema.settings
         )
 
     def _get_type(self, name):
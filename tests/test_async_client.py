@@ -1,6 +1,8 @@
 import pytest
+from pretend import stub
 
 from zeep import AsyncClient
+from zeep.transports import AsyncTransport
 
 
 @pytest.mark.requests
@@ -8,3 +10,99 @@ from zeep import AsyncClient
 async def test_context_manager():
     async with AsyncClient("tests/wsdl_files/soap.wsdl") as async_client:
         assert async_client
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_create(httpx_mock):
+    wsdl = """
+        <wsdl:definitions
+            xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+            xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+            xmlns:tns="http://tests.python-zeep.org/async"
+            targetNamespace="http://tests.python-zeep.org/async">
+          <wsdl:types>
+            <xsd:schema targetNamespace="http://tests.python-zeep.org/async">
+              <xsd:import namespace="http://tests.python-zeep.org/types"
+                          schemaLocation="xsd/types.xsd"/>
+            </xsd:schema>
+          </wsdl:types>
+          <wsdl:message name="Input">
+            <wsdl:part name="parameters" element="ns1:Request"
+                       xmlns:ns1="http://tests.python-zeep.org/types"/>
+          </wsdl:message>
+          <wsdl:portType name="PortType">
+            <wsdl:operation name="Ping">
+              <wsdl:input message="tns:Input"/>
+              <wsdl:output message="tns:Input"/>
+            </wsdl:operation>
+          </wsdl:portType>
+          <wsdl:binding name="Binding" type="tns:PortType">
+            <soap:binding style="document"
+                          transport="http://schemas.xmlsoap.org/soap/http"/>
+            <wsdl:operation name="Ping">
+              <soap:operation soapAction=""/>
+              <wsdl:input><soap:body use="literal"/></wsdl:input>
+              <wsdl:output><soap:body use="literal"/></wsdl:output>
+            </wsdl:operation>
+          </wsdl:binding>
+          <wsdl:service name="Service">
+            <wsdl:port name="Port" binding="tns:Binding">
+              <soap:address location="http://tests.python-zeep.org/async/ping"/>
+            </wsdl:port>
+          </wsdl:service>
+        </wsdl:definitions>
+    """
+    types = """
+        <xsd:schema
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+            targetNamespace="http://tests.python-zeep.org/types">
+          <xsd:include schemaLocation="common.xsd"/>
+        </xsd:schema>
+    """
+    common = """
+        <xsd:schema
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+            targetNamespace="http://tests.python-zeep.org/types">
+          <xsd:element name="Request" type="xsd:string"/>
+        </xsd:schema>
+    """
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/async/service.wsdl", content=wsdl
+    )
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/async/xsd/types.xsd", content=types
+    )
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/async/xsd/common.xsd", content=common
+    )
+
+    def load_sync(url):
+        raise AssertionError("Unexpected blocking request to %s" % url)
+
+    transport = AsyncTransport(wsdl_client=stub(get=load_sync, timeout=5))
+    async_client = await AsyncClient.create(
+        "http://tests.python-zeep.org/async/service.wsdl", transport=transport
+    )
+    assert isinstance(async_client, AsyncClient)
+    assert async_client.transport is transport
+    assert async_client.get_element("{http://tests.python-zeep.org/types}Request")
+    assert async_client.service.Ping
+    assert len(httpx_mock.get_requests()) == 3
+
+    # The prefetched documents are not kept around
+    assert not async_client.wsdl.types._prefetched
+    await async_client.transport.aclose()
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_warmup(httpx_mock):
+    httpx_mock.add_response(method="HEAD", url="http://tests.python-zeep.org/items")
+
+    async with AsyncClient("tests/wsdl_files/soap_items.wsdl") as async_client:
+        await async_client.warmup(["GetItems"], connect=True)
+
+    request = httpx_mock.get_requests()[0]
+    assert request.method == "HEAD"
@@ -1,10 +1,12 @@
+import time
+
 import pytest
 from lxml import etree
 from pretend import stub
 from pytest_httpx import HTTPXMock
 
 from zeep import exceptions
-from zeep.cache import InMemoryCache
+from zeep.cache import InMemoryCache, LRUCache
 from zeep.transports import AsyncTransport
 
 
@@ -73,3 +75,59 @@ async def test_http_error(httpx_mock: HTTPXMock):
         transport.load("http://tests.python-zeep.org/test.xml")
         assert exc.value.status_code == 500
         assert exc.value.message is None
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_load_async(httpx_mock: HTTPXMock):
+    cache = InMemoryCache()
+    transport = AsyncTransport(cache=cache)
+
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/test-async.xml", content="x"
+    )
+    result = await transport.load_async("http://tests.python-zeep.org/test-async.xml")
+    assert result == b"x"
+    assert cache.get("http://tests.python-zeep.org/test-async.xml") == b"x"
+
+    # Second call is served from the cache
+    result = await transport.load_async("http://tests.python-zeep.org/test-async.xml")
+    assert result == b"x"
+    assert len(httpx_mock.get_requests()) == 1
+    await transport.aclose()
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_load_async_error(httpx_mock: HTTPXMock):
+    transport = AsyncTransport()
+
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/test.xml", status_code=404
+    )
+    with pytest.raises(exceptions.TransportError):
+        await transport.load_async("http://tests.python-zeep.org/test.xml")
+    await transport.aclose()
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_load_async_revalidate(httpx_mock: HTTPXMock):
+    url = "http://tests.python-zeep.org/test-revalidate.xml"
+    cache = LRUCache(timeout=60)
+    transport = AsyncTransport(cache=cache)
+
+    httpx_mock.add_response(url=url, content="x", headers={"ETag": '"v1"'})
+    assert await transport.load_async(url) == b"x"
+
+    # Expire the entry
+    cache._expire(time.monotonic() + 120)
+    assert cache.get(url) is None
+
+    httpx_mock.add_response(url=url, status_code=304)
+    assert await transport.load_async(url) == b"x"
+
+    request = httpx_mock.get_requests()[-1]
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert cache.get(url) == b"x"
+    await transport.aclose()
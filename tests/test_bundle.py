@@ -0,0 +1,133 @@
+import json
+import os
+import zipfile
+
+import pytest
+
+from tests.utils import DummyTransport
+from zeep import AsyncClient, Client, bundle
+from zeep.exceptions import BundleError, TransportError
+from zeep.transports import Transport
+
+
+@pytest.fixture
+def transport():
+    transport = DummyTransport()
+    with open("tests/wsdl_files/soap_items.wsdl", "rb") as fh:
+        transport.bind("http://tests.python-zeep.org/items.wsdl", fh.read())
+    return transport
+
+
+def test_create(tmpdir, transport):
+    path = os.path.join(str(tmpdir), "items.zip")
+    urls = bundle.create("http://tests.python-zeep.org/items.wsdl", path, transport)
+    assert urls == ["http://tests.python-zeep.org/items.wsdl"]
+    assert bundle.is_bundle(path)
+
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        assert manifest["location"] == "http://tests.python-zeep.org/items.wsdl"
+
+        document = manifest["documents"][0]
+        assert document["url"] == "http://tests.python-zeep.org/items.wsdl"
+        with open("tests/wsdl_files/soap_items.wsdl", "rb") as fh:
+            assert archive.read(document["path"]) == fh.read()
+
+
+def test_create_imports(tmpdir):
+    path = os.path.join(str(tmpdir), "imports.zip")
+    urls = bundle.create("tests/wsdl_files/soap_import_main.wsdl", path, Transport())
+
+    location = os.path.abspath("tests/wsdl_files/soap_import_main.wsdl")
+    directory = os.path.dirname(location)
+    assert urls == [
+        location,
+        os.path.join(directory, "soap_import_2.wsdl"),
+        os.path.join(directory, "test_import_2.xsd"),
+    ]
+
+    transport = bundle.BundleTransport(path)
+    assert transport.location == location
+    assert sorted(transport.urls) == sorted(urls)
+    transport.close()
+
+
+def test_client(tmpdir, transport):
+    path = os.path.join(str(tmpdir), "items.zip")
+    bundle.create("http://tests.python-zeep.org/items.wsdl", path, transport)
+
+    client = Client(path)
+    assert isinstance(client.transport, bundle.BundleTransport)
+    assert client.wsdl.location == "http://tests.python-zeep.org/items.wsdl"
+    assert client.service.GetItems
+    client.transport.close()
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_async_client_create(tmpdir, transport):
+    path = os.path.join(str(tmpdir), "items.zip")
+    bundle.create("http://tests.python-zeep.org/items.wsdl", path, transport)
+
+    client = await AsyncClient.create(path)
+    assert isinstance(client.transport, bundle.BundleTransport)
+    assert client.wsdl.location == "http://tests.python-zeep.org/items.wsdl"
+    assert client.service.GetItems
+    client.transport.close()
+
+
+def test_client_imports(tmpdir):
+    path = os.path.join(str(tmpdir), "imports.zip")
+    bundle.create("tests/wsdl_files/soap_import_main.wsdl", path, Transport())
+
+    client = Client(path)
+    assert client.get_type("{http://example.com/stockquote.xsd}Address")
+    client.transport.close()
+
+
+def test_transport_unknown_url(tmpdir, transport):
+    path = os.path.join(str(tmpdir), "items.zip")
+    bundle.create("http://tests.python-zeep.org/items.wsdl", path, transport)
+
+    bundle_transport = bundle.BundleTransport(path, transport)
+    with pytest.raises(TransportError):
+        bundle_transport.load("http://tests.python-zeep.org/other.xsd")
+
+    # Other attributes are delegated to the wrapped transport
+    assert bundle_transport.bind == transport.bind
+
+
+def test_transport_checksum(tmpdir, transport):
+    path = os.path.join(str(tmpdir), "items.zip")
+    bundle.create("http://tests.python-zeep.org/items.wsdl", path, transport)
+
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        content = archive.read(manifest["documents"][0]["path"])
+
+    manifest["documents"][0]["sha256"] = "0" * 64
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(manifest["documents"][0]["path"], content)
+        archive.writestr("manifest.json", json.dumps(manifest))
+
+    bundle_transport = bundle.BundleTransport(path)
+    with pytest.raises(BundleError):
+        bundle_transport.load("http://tests.python-zeep.org/items.wsdl")
+
+    bundle_transport = bundle.BundleTransport(path, verify=False)
+    assert bundle_transport.load("http://tests.python-zeep.org/items.wsdl") == content
+
+
+def test_transport_invalid_file(tmpdir):
+    path = os.path.join(str(tmpdir), "invalid.zip")
+    with open(path, "wb") as fh:
+        fh.write(b"PK\x03\x04invalid")
+
+    assert not bundle.is_bundle(path)
+    with pytest.raises(BundleError):
+        bundle.BundleTransport(path)
+
+
+def test_is_bundle():
+    assert not bundle.is_bundle("tests/wsdl_files/soap_items.wsdl")
+    assert not bundle.is_bundle("http://tests.python-zeep.org/items.wsdl")
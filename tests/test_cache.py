@@ -1,4 +1,9 @@
+import base64
 import datetime
+import gc
+import sqlite3
+import threading
+import time
 
 import freezegun
 import pytest
@@ -53,6 +58,211 @@ class TestSqliteCache:
         result = c.get("http://tests.python-zeep.org/example.wsdl")
         assert result == b"content"
 
+    def test_replace(self, tmpdir):
+        c = cache.SqliteCache(path=tmpdir.join("sqlite.cache.db").strpath)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+        c.add("http://tests.python-zeep.org/example.wsdl", b"other")
+        result = c.get("http://tests.python-zeep.org/example.wsdl")
+        assert result == b"other"
+
+        with c.db_connection() as conn:
+            rows = conn.execute("SELECT url, content FROM request_v2").fetchall()
+        assert rows == [("http://tests.python-zeep.org/example.wsdl", b"other")]
+
+    def test_wal(self, tmpdir):
+        c = cache.SqliteCache(path=tmpdir.join("sqlite.cache.db").strpath)
+        with c.db_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    def test_connection_per_thread(self, tmpdir):
+        c = cache.SqliteCache(path=tmpdir.join("sqlite.cache.db").strpath)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+
+        with c.db_connection() as conn_1, c.db_connection() as conn_2:
+            assert conn_1 is conn_2
+
+        results = []
+
+        def worker():
+            with c.db_connection() as conn:
+                results.append(conn)
+            results.append(c.get("http://tests.python-zeep.org/example.wsdl"))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert results[0] is not conn_1
+        assert results[1] == b"content"
+
+        c.close()
+        assert c.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+
+    def test_connection_closed_when_thread_ends(self, tmpdir):
+        c = cache.SqliteCache(path=tmpdir.join("sqlite.cache.db").strpath)
+        connections = []
+
+        def worker():
+            with c.db_connection() as conn:
+                connections.append(conn)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        del thread
+        gc.collect()
+
+        assert connections[0] not in c._connections
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+
+        # The connection of the current thread is kept open
+        assert len(c._connections) == 1
+        with c.db_connection() as conn:
+            assert conn.execute("SELECT 1").fetchone() == (1,)
+
+    def test_migrate(self, tmpdir):
+        path = tmpdir.join("sqlite.cache.db").strpath
+        created = datetime.datetime.now(datetime.timezone.utc)
+
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE request (created timestamp, url text, content text)")
+        conn.executemany(
+            "INSERT INTO request (created, url, content) VALUES (?, ?, ?)",
+            [
+                (
+                    created.isoformat(" "),
+                    "http://tests.python-zeep.org/example.wsdl",
+                    b"$ZEEP:1$" + base64.b64encode(b"content"),
+                ),
+                (created.isoformat(" "), "http://tests.python-zeep.org/x", b"x"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        c = cache.SqliteCache(path=path)
+        assert c.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+        assert c.get("http://tests.python-zeep.org/x") is None
+
+        with c.db_connection() as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        assert ("request",) not in tables
+
+
+class TestFileSystemCache:
+    def test_cache(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+
+        result = c.get("http://tests.python-zeep.org/example.wsdl")
+        assert result == b"content"
+
+    def test_no_records(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+
+    def test_empty_content(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"")
+        assert c.get("http://tests.python-zeep.org/example.wsdl") == b""
+
+    def test_shared_directory(self, tmpdir):
+        a = cache.FileSystemCache(path=tmpdir.strpath)
+        b = cache.FileSystemCache(path=tmpdir.strpath)
+        a.add("http://tests.python-zeep.org/a.wsdl", b"content")
+        a.add("http://tests.python-zeep.org/b.wsdl", b"content")
+        b.add("http://tests.python-zeep.org/a.wsdl", b"other")
+
+        assert a.get("http://tests.python-zeep.org/a.wsdl") == b"other"
+        assert b.get("http://tests.python-zeep.org/b.wsdl") == b"content"
+
+        # Identical content is stored once and no temporary files remain
+        assert len(tmpdir.join("objects").listdir()) == 2
+        assert not [p for p in tmpdir.visit() if p.basename.startswith(".tmp-")]
+
+    def test_has_expired(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath, timeout=60)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+
+        freeze_dt = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+            seconds=120
+        )
+        with freezegun.freeze_time(freeze_dt):
+            assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+
+    def test_timeout_none(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath, timeout=None)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+
+        freeze_dt = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+            days=365
+        )
+        with freezegun.freeze_time(freeze_dt):
+            assert c.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+
+    def test_invalid_files(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+
+        path = c._get_metadata_path("http://tests.python-zeep.org/example.wsdl")
+        with open(path, "w") as fh:
+            fh.write("{invalid")
+        assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+        for obj in tmpdir.join("objects").listdir():
+            obj.remove()
+        assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+
+    def test_replaced_content_kept_until_sweep(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        c.SWEEP_GRACE_PERIOD = 0
+        c.add("http://tests.python-zeep.org/a.wsdl", b"content")
+        c.add("http://tests.python-zeep.org/b.wsdl", b"content")
+        c.add("http://tests.python-zeep.org/a.wsdl", b"other")
+        c.add("http://tests.python-zeep.org/b.wsdl", b"other")
+        assert len(tmpdir.join("objects").listdir()) == 2
+
+        c.delete("http://tests.python-zeep.org/unknown.wsdl")
+        assert len(tmpdir.join("objects").listdir()) == 2
+
+        c.delete("http://tests.python-zeep.org/a.wsdl")
+        assert len(tmpdir.join("objects").listdir()) == 1
+        assert c.get("http://tests.python-zeep.org/b.wsdl") == b"other"
+
+    def test_sweep_grace_period(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        c.add("http://tests.python-zeep.org/a.wsdl", b"content")
+        c.add("http://tests.python-zeep.org/b.wsdl", b"other")
+
+        # Another process wrote the content but not the entry yet
+        c.clear()
+        assert len(tmpdir.join("objects").listdir()) == 2
+
+        for obj in tmpdir.join("objects").listdir():
+            obj.setmtime(time.time() - c.SWEEP_GRACE_PERIOD - 1)
+        c.clear()
+        assert tmpdir.join("objects").listdir() == []
+
+    def test_delete_and_clear(self, tmpdir):
+        c = cache.FileSystemCache(path=tmpdir.strpath)
+        c.SWEEP_GRACE_PERIOD = 0
+        c.add("http://tests.python-zeep.org/a.wsdl", b"content")
+        c.add("http://tests.python-zeep.org/b.wsdl", b"content")
+        c.add("http://tests.python-zeep.org/c.wsdl", b"other")
+
+        c.delete("http://tests.python-zeep.org/c.wsdl")
+        assert c.get("http://tests.python-zeep.org/c.wsdl") is None
+        assert len(tmpdir.join("objects").listdir()) == 1
+
+        c.delete("http://tests.python-zeep.org/a.wsdl")
+        assert c.get("http://tests.python-zeep.org/b.wsdl") == b"content"
+        assert len(tmpdir.join("objects").listdir()) == 1
+
+        c.clear()
+        assert c.get("http://tests.python-zeep.org/b.wsdl") is None
+        assert tmpdir.join("objects").listdir() == []
+
 
 @pytest.mark.network
 def test_memory_cache_timeout(tmpdir):
@@ -78,6 +288,129 @@ def test_memory_cache_share_data(tmpdir):
     assert result == b"content"
 
 
+def test_memory_cache_validators():
+    c = cache.InMemoryCache()
+    url = "http://tests.python-zeep.org/validators.wsdl"
+    c.add_entry(url, cache.CacheEntry(b"content", etag='"v1"'))
+
+    freeze_dt = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        seconds=7200
+    )
+    with freezegun.freeze_time(freeze_dt):
+        entry = c.get_entry(url)
+        assert entry.expired
+        assert entry.etag == '"v1"'
+
+    c.add_entry(url, cache.CacheEntry(b"other"))
+    assert c.get_entry(url).etag is None
+
+    with freezegun.freeze_time(freeze_dt):
+        assert c.get_entry(url) is None
+    assert url not in c._cache
+
+
+class TestLRUCache:
+    def test_cache(self):
+        c = cache.LRUCache()
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+        assert c.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+        assert c.get("http://tests.python-zeep.org/other.wsdl") is None
+        assert c.stats == {
+            "entries": 1,
+            "size": 7,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def test_not_shared(self):
+        a = cache.LRUCache()
+        b = cache.LRUCache()
+        a.add("http://tests.python-zeep.org/example.wsdl", b"content")
+        assert b.get("http://tests.python-zeep.org/example.wsdl") is None
+
+    def test_invalid_content(self):
+        c = cache.LRUCache()
+        with pytest.raises(TypeError):
+            c.add("http://tests.python-zeep.org/example.wsdl", None)
+
+    def test_maxsize(self):
+        c = cache.LRUCache(maxsize=2)
+        c.add("http://tests.python-zeep.org/a.xsd", b"a")
+        c.add("http://tests.python-zeep.org/b.xsd", b"b")
+
+        # Mark a as recently used
+        assert c.get("http://tests.python-zeep.org/a.xsd") == b"a"
+        c.add("http://tests.python-zeep.org/c.xsd", b"c")
+
+        assert len(c) == 2
+        assert c.evictions == 1
+        assert c.get("http://tests.python-zeep.org/b.xsd") is None
+        assert c.get("http://tests.python-zeep.org/a.xsd") == b"a"
+        assert c.get("http://tests.python-zeep.org/c.xsd") == b"c"
+
+    def test_max_bytes(self):
+        c = cache.LRUCache(max_bytes=10)
+        c.add("http://tests.python-zeep.org/a.xsd", b"aaaa")
+        c.add("http://tests.python-zeep.org/b.xsd", b"bbbb")
+        c.add("http://tests.python-zeep.org/a.xsd", b"aaaaa")
+        assert c.size == 9
+
+        c.add("http://tests.python-zeep.org/c.xsd", b"cccc")
+        assert c.size == 9
+        assert c.evictions == 1
+        assert c.get("http://tests.python-zeep.org/b.xsd") is None
+
+        # Content larger than the budget is never cached
+        c.add("http://tests.python-zeep.org/d.xsd", b"d" * 11)
+        assert c.get("http://tests.python-zeep.org/d.xsd") is None
+        assert c.size == 9
+
+    def test_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+        c = cache.LRUCache(timeout=60)
+        c.add("http://tests.python-zeep.org/a.xsd", b"a")
+        now[0] += 30
+        c.add("http://tests.python-zeep.org/b.xsd", b"b")
+        assert c.get("http://tests.python-zeep.org/a.xsd") == b"a"
+
+        # Expired entries are removed, even when they are not requested
+        now[0] += 31
+        assert c.get("http://tests.python-zeep.org/b.xsd") == b"b"
+        assert len(c) == 1
+        assert c.size == 1
+        assert c.expirations == 1
+
+    def test_clear(self):
+        c = cache.LRUCache()
+        c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+        c.clear()
+        assert len(c) == 0
+        assert c.size == 0
+        assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+
+    def test_threads(self):
+        c = cache.LRUCache(maxsize=10)
+
+        def worker(prefix):
+            for i in range(200):
+                url = "http://tests.python-zeep.org/%s/%d.xsd" % (prefix, i % 20)
+                c.add(url, b"x" * (i % 7))
+                c.get(url)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(c) == 10
+        assert c.size == sum(size for size, content in c._entries.values())
+
+
 class TestIsExpired:
     def test_timeout_none(self):
         assert cache._is_expired(100, None) is False
@@ -0,0 +1,182 @@
+import datetime
+import socketserver
+import threading
+
+import freezegun
+import pytest
+
+from zeep import cache
+
+
+class MemcachedHandler(socketserver.StreamRequestHandler):
+    """Minimal implementation of the get and set commands of the memcached
+    text protocol.
+
+    """
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            self.server.commands.append(line.split()[0])
+
+            parts = line.split()
+            if parts[0] == b"get":
+                for key in parts[1:]:
+                    if key in store:
+                        flags, value = store[key]
+                        header = b"VALUE %s %d %d\r\n" % (key, flags, len(value))
+                        self.wfile.write(header + value + b"\r\n")
+                self.wfile.write(b"END\r\n")
+            elif parts[0] == b"set":
+                value = self.rfile.read(int(parts[4]) + 2)[:-2]
+                store[parts[1]] = (int(parts[2]), value)
+                self.server.exptimes[parts[1]] = int(parts[3])
+                if parts[-1] != b"noreply":
+                    self.wfile.write(b"STORED\r\n")
+            else:
+                self.wfile.write(b"ERROR\r\n")
+
+
+@pytest.fixture
+def server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), MemcachedHandler)
+    server.daemon_threads = True
+    server.store = {}
+    server.commands = []
+    server.exptimes = {}
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.requests
+def test_cache(server):
+    c = cache.MemcachedCache(server=server.server_address)
+    c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+
+    assert c.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+    assert c.get("http://tests.python-zeep.org/other.wsdl") is None
+    c.close()
+
+
+@pytest.mark.requests
+def test_shared_between_instances(server):
+    a = cache.MemcachedCache(server=server.server_address)
+    b = cache.MemcachedCache(server=server.server_address)
+    a.add("http://tests.python-zeep.org/example.wsdl", b"content")
+    assert a.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+    assert b.get("http://tests.python-zeep.org/example.wsdl") == b"content"
+
+
+@pytest.mark.requests
+def test_compression(server):
+    c = cache.MemcachedCache(server=server.server_address, compress_threshold=1000)
+    content = b"<xsd:element/>" * 1000
+    c.add("http://tests.python-zeep.org/large.xsd", content)
+    c.add("http://tests.python-zeep.org/small.xsd", b"x")
+
+    # The sets are sent with noreply, the get waits until they are processed
+    assert c.get("http://tests.python-zeep.org/large.xsd") == content
+    assert c.get("http://tests.python-zeep.org/small.xsd") == b"x"
+
+    values = sorted(server.store.values(), key=lambda value: len(value[1]))
+    assert values[0][0] == 0
+    assert values[1][0] == cache.MemcachedCache.FLAG_COMPRESSED
+    assert len(values[1][1]) < len(content) / 10
+
+
+@pytest.mark.requests
+def test_pipelining(server):
+    c = cache.MemcachedCache(server=server.server_address)
+    c.add_entries(
+        {
+            "http://tests.python-zeep.org/a.xsd": cache.CacheEntry(b"a"),
+            "http://tests.python-zeep.org/b.xsd": cache.CacheEntry(b"b", etag='"1"'),
+        }
+    )
+    result = c.get_entries(
+        [
+            "http://tests.python-zeep.org/a.xsd",
+            "http://tests.python-zeep.org/b.xsd",
+            "http://tests.python-zeep.org/c.xsd",
+        ]
+    )
+    assert server.commands == [b"set", b"set", b"get"]
+
+    assert sorted(result) == [
+        "http://tests.python-zeep.org/a.xsd",
+        "http://tests.python-zeep.org/b.xsd",
+    ]
+    assert result["http://tests.python-zeep.org/b.xsd"].content == b"b"
+    assert result["http://tests.python-zeep.org/b.xsd"].etag == '"1"'
+
+
+@pytest.mark.requests
+@freezegun.freeze_time("2024-01-01")
+def test_expiration_time(server):
+    c = cache.MemcachedCache(server=server.server_address, timeout=60)
+    c.add("http://tests.python-zeep.org/a.xsd", b"a")
+    c.add_entry("http://tests.python-zeep.org/b.xsd", cache.CacheEntry(b"b", etag="1"))
+    assert c.get("http://tests.python-zeep.org/a.xsd") == b"a"
+
+    # Expiration times of more than 30 days are absolute unix timestamps
+    timeout = 60 * 60 * 24 * 60
+    c = cache.MemcachedCache(server=server.server_address, timeout=timeout)
+    c.add("http://tests.python-zeep.org/c.xsd", b"c")
+    assert c.get("http://tests.python-zeep.org/c.xsd") == b"c"
+
+    assert sorted(server.exptimes.values()) == [0, 60, 1704067200 + timeout]
+
+
+@pytest.mark.requests
+def test_expired(server):
+    c = cache.MemcachedCache(server=server.server_address, timeout=60)
+    c.add("http://tests.python-zeep.org/a.xsd", b"a")
+    c.add_entry("http://tests.python-zeep.org/b.xsd", cache.CacheEntry(b"b", etag="1"))
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    with freezegun.freeze_time(now + datetime.timedelta(seconds=120)):
+        assert c.get("http://tests.python-zeep.org/a.xsd") is None
+        assert c.get("http://tests.python-zeep.org/b.xsd") is None
+
+        entry = c.get_entry("http://tests.python-zeep.org/b.xsd")
+        assert entry.expired
+
+        c.refresh("http://tests.python-zeep.org/b.xsd")
+        assert c.get("http://tests.python-zeep.org/b.xsd") == b"b"
+
+
+@pytest.mark.requests
+def test_server_unavailable(server, monkeypatch):
+    address = server.server_address
+    server.shutdown()
+    server.server_close()
+
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+    c = cache.MemcachedCache(server=address, retry_interval=30)
+    c.add("http://tests.python-zeep.org/example.wsdl", b"content")
+    assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+
+    # The server is not contacted until the retry interval passed
+    attempts = []
+
+    def create_connection(*args):
+        attempts.append(args)
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(cache.socket, "create_connection", create_connection)
+    assert c.get("http://tests.python-zeep.org/example.wsdl") is None
+    assert not attempts
+
+    now[0] += 31
+    c.get("http://tests.python-zeep.org/example.wsdl")
+    assert attempts
@@ -1,6 +1,7 @@
 import os
 
 import pytest
+import requests
 import requests_mock
 
 from tests.utils import load_xml
@@ -159,6 +160,33 @@ def test_create_message():
     assert data is not None
 
 
+def test_warmup():
+    client_obj = client.Client("tests/wsdl_files/soap_items.wsdl")
+    response = client_obj.get_element(
+        "{http://tests.python-zeep.org/items}GetCountResponse"
+    )
+
+    with requests_mock.mock() as m:
+        m.head("http://tests.python-zeep.org/items", status_code=405)
+        client_obj.warmup(["GetCount"], connect=True)
+        assert m.call_count == 1
+        assert m.request_history[0].method == "HEAD"
+
+    assert "_value_class" in vars(response.type)
+
+
+def test_warmup_connect_error(caplog):
+    client_obj = client.Client("tests/wsdl_files/soap_items.wsdl")
+
+    with requests_mock.mock() as m:
+        m.head(
+            "http://tests.python-zeep.org/items",
+            exc=requests.exceptions.ConnectionError,
+        )
+        client_obj.warmup(connect=True)
+    assert "Unable to connect to http://tests.python-zeep.org/items" in caplog.text
+
+
 @pytest.mark.skipif(os.name == "nt", reason="test valid for unix platforms only")
 def test_load_wsdl_with_file_prefix_unix():
     cwd = os.path.dirname(__file__)
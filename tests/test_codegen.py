@@ -0,0 +1,333 @@
+import datetime
+import importlib.util
+import io
+import os
+from decimal import Decimal
+
+import pytest
+import requests_mock
+from pretend import stub
+
+from tests.utils import DummyTransport, assert_nodes_equal, load_xml
+from zeep import Client, codegen
+from zeep.exceptions import CodegenError, Fault, ValidationError
+from zeep.transports import Transport
+from zeep.wsdl import Document
+
+WSDL = """
+<?xml version="1.0"?>
+<wsdl:definitions
+    xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:tns="http://tests.python-zeep.org/tns"
+    targetNamespace="http://tests.python-zeep.org/tns">
+  <wsdl:types>
+    <xsd:schema targetNamespace="http://tests.python-zeep.org/tns"
+                elementFormDefault="qualified">
+      <xsd:complexType name="Item">
+        <xsd:sequence>
+          <xsd:element name="name" type="xsd:string"/>
+          <xsd:element name="quantity" type="xsd:int"/>
+          <xsd:element name="price" type="xsd:decimal" minOccurs="0"/>
+          <xsd:element name="available" type="xsd:boolean" minOccurs="0"/>
+          <xsd:element name="note" type="xsd:string" nillable="true"/>
+        </xsd:sequence>
+        <xsd:attribute name="id" type="xsd:int"/>
+      </xsd:complexType>
+      <xsd:element name="CreateOrder">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="customer" type="xsd:string"/>
+            <xsd:element name="created" type="xsd:dateTime" minOccurs="0"/>
+            <xsd:element name="item" type="tns:Item"
+                         minOccurs="0" maxOccurs="unbounded"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+      <xsd:element name="CreateOrderResponse">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="id" type="xsd:long"/>
+            <xsd:element name="item" type="tns:Item"
+                         minOccurs="0" maxOccurs="unbounded"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+      <xsd:element name="GetStatus">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="id" type="xsd:long"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+      <xsd:element name="GetStatusResponse">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="status" type="xsd:string"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+      <xsd:element name="Search">
+        <xsd:complexType>
+          <xsd:choice>
+            <xsd:element name="name" type="xsd:string"/>
+            <xsd:element name="id" type="xsd:long"/>
+          </xsd:choice>
+        </xsd:complexType>
+      </xsd:element>
+    </xsd:schema>
+  </wsdl:types>
+
+  <wsdl:message name="CreateOrderInput">
+    <wsdl:part name="parameters" element="tns:CreateOrder"/>
+  </wsdl:message>
+  <wsdl:message name="CreateOrderOutput">
+    <wsdl:part name="parameters" element="tns:CreateOrderResponse"/>
+  </wsdl:message>
+  <wsdl:message name="GetStatusInput">
+    <wsdl:part name="parameters" element="tns:GetStatus"/>
+  </wsdl:message>
+  <wsdl:message name="GetStatusOutput">
+    <wsdl:part name="parameters" element="tns:GetStatusResponse"/>
+  </wsdl:message>
+  <wsdl:message name="SearchInput">
+    <wsdl:part name="parameters" element="tns:Search"/>
+  </wsdl:message>
+
+  <wsdl:portType name="OrderPortType">
+    <wsdl:operation name="CreateOrder">
+      <wsdl:input message="tns:CreateOrderInput"/>
+      <wsdl:output message="tns:CreateOrderOutput"/>
+    </wsdl:operation>
+    <wsdl:operation name="GetStatus">
+      <wsdl:input message="tns:GetStatusInput"/>
+      <wsdl:output message="tns:GetStatusOutput"/>
+    </wsdl:operation>
+    <wsdl:operation name="Search">
+      <wsdl:input message="tns:SearchInput"/>
+    </wsdl:operation>
+  </wsdl:portType>
+
+  <wsdl:binding name="OrderBinding" type="tns:OrderPortType">
+    <soap:binding style="document"
+                  transport="http://schemas.xmlsoap.org/soap/http"/>
+    <wsdl:operation name="CreateOrder">
+      <soap:operation soapAction="urn:CreateOrder"/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+      <wsdl:output><soap:body use="literal"/></wsdl:output>
+    </wsdl:operation>
+    <wsdl:operation name="GetStatus">
+      <soap:operation soapAction="urn:GetStatus"/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+      <wsdl:output><soap:body use="literal"/></wsdl:output>
+    </wsdl:operation>
+    <wsdl:operation name="Search">
+      <soap:operation soapAction="urn:Search"/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+    </wsdl:operation>
+  </wsdl:binding>
+
+  <wsdl:service name="OrderService">
+    <wsdl:port name="OrderPort" binding="tns:OrderBinding">
+      <soap:address location="http://tests.python-zeep.org/orders"/>
+    </wsdl:port>
+  </wsdl:service>
+</wsdl:definitions>
+""".strip()
+
+CREATE_ORDER_RESPONSE = """
+<soap-env:Envelope
+    xmlns:soap-env="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    xmlns:tns="http://tests.python-zeep.org/tns">
+  <soap-env:Body>
+    <tns:CreateOrderResponse>
+      <tns:id>42</tns:id>
+      <tns:item id="1">
+        <tns:name>foo</tns:name>
+        <tns:quantity>2</tns:quantity>
+        <tns:price>1.50</tns:price>
+        <tns:available>true</tns:available>
+        <tns:note xsi:nil="true"/>
+      </tns:item>
+      <tns:item>
+        <tns:name>bar</tns:name>
+        <tns:quantity>1</tns:quantity>
+        <tns:note>fragile</tns:note>
+      </tns:item>
+    </tns:CreateOrderResponse>
+  </soap-env:Body>
+</soap-env:Envelope>
+""".strip()
+
+
+@pytest.fixture
+def transport():
+    transport = DummyTransport()
+    transport.bind("http://tests.python-zeep.org/orders.wsdl", WSDL)
+    return transport
+
+
+@pytest.fixture
+def module(tmpdir, transport):
+    document = Document("http://tests.python-zeep.org/orders.wsdl", transport)
+    path = os.path.join(str(tmpdir), "orders.py")
+    with open(path, "w") as fh:
+        fh.write(codegen.generate(document))
+
+    spec = importlib.util.spec_from_file_location("orders", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(transport):
+    return Client("http://tests.python-zeep.org/orders.wsdl", transport=transport)
+
+
+def test_module(module):
+    assert module.ADDRESS == "http://tests.python-zeep.org/orders"
+    assert "- Search: Choice is not supported" in module.__doc__
+    assert not hasattr(module, "serialize_Search")
+
+    item = module.Item(name="foo", quantity=1, id=2)
+    assert item.__slots__ == ("name", "quantity", "price", "available", "note", "id")
+    assert item == module.Item("foo", 1, id=2)
+    assert item["name"] == "foo"
+    assert repr(item).startswith("Item(name='foo', quantity=1, price=None")
+
+
+def test_serialize(module, client):
+    created = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    items = [
+        {"name": "foo", "quantity": 2, "price": Decimal("1.50"), "id": 1},
+        {"name": "bar", "quantity": 1, "available": False, "note": "fragile"},
+    ]
+    expected = client.create_message(
+        client.service, "CreateOrder", customer="me", created=created, item=items
+    )
+
+    result = module.serialize_CreateOrder(customer="me", created=created, item=items)
+    assert_nodes_equal(result, expected)
+
+    items = [module.Item(**item) for item in items]
+    result = module.serialize_CreateOrder(customer="me", created=created, item=items)
+    assert_nodes_equal(result, expected)
+
+
+def test_serialize_missing_element(module):
+    with pytest.raises(ValidationError) as exc:
+        module.serialize_CreateOrder(item=[])
+    assert exc.value.message == "Missing element customer"
+
+
+def test_deserialize(module, client):
+    response = stub(status_code=200, headers={}, content=CREATE_ORDER_RESPONSE)
+    operation = client.service._binding.get("CreateOrder")
+    expected = client.service._binding.process_reply(client, operation, response)
+
+    result = module.deserialize_CreateOrder(load_xml(CREATE_ORDER_RESPONSE))
+    assert result.id == expected.id == 42
+    assert len(result.item) == len(expected.item) == 2
+    for item, expected_item in zip(result.item, expected.item):
+        for name in item.__slots__:
+            assert getattr(item, name) == getattr(expected_item, name)
+    assert result.item[0].price == Decimal("1.50")
+    assert result.item[0].note is None
+
+
+def test_client(module):
+    response = """
+        <soap-env:Envelope
+            xmlns:soap-env="http://schemas.xmlsoap.org/soap/envelope/"
+            xmlns:tns="http://tests.python-zeep.org/tns">
+          <soap-env:Body>
+            <tns:GetStatusResponse>
+              <tns:status>shipped</tns:status>
+            </tns:GetStatusResponse>
+          </soap-env:Body>
+        </soap-env:Envelope>
+    """.strip()
+
+    client = module.Client(transport=Transport())
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/orders", text=response)
+        assert client.GetStatus(id=1) == "shipped"
+
+        request = m.request_history[0]
+        assert request.headers["SOAPAction"] == '"urn:GetStatus"'
+        assert b"<ns0:id>1</ns0:id>" in request.body
+
+
+def test_client_fault(module):
+    response = """
+        <soap-env:Envelope
+            xmlns:soap-env="http://schemas.xmlsoap.org/soap/envelope/">
+          <soap-env:Body>
+            <soap-env:Fault>
+              <faultcode>soap-env:Server</faultcode>
+              <faultstring>Order not found</faultstring>
+            </soap-env:Fault>
+          </soap-env:Body>
+        </soap-env:Envelope>
+    """.strip()
+
+    client = module.Client(transport=Transport())
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/orders", text=response, status_code=500)
+        with pytest.raises(Fault) as exc:
+            client.GetStatus(id=1)
+    assert exc.value.message == "Order not found"
+    assert exc.value.code == "soap-env:Server"
+
+
+@pytest.mark.parametrize(
+    "location",
+    [
+        "http://tests.python-zeep.org/orders.wsdl",
+        "tests/wsdl_files/soap.wsdl",
+        "tests/wsdl_files/soap_items.wsdl",
+    ],
+)
+def test_generated_module_is_clean(monkeypatch, transport, location):
+    pyflakes_api = pytest.importorskip("pyflakes.api")
+    pyflakes_reporter = pytest.importorskip("pyflakes.reporter")
+    black = pytest.importorskip("black")
+
+    # Check the code as it is generated, without formatting it via black
+    monkeypatch.setattr(codegen, "_import_black", lambda: None)
+    if not location.startswith("http"):
+        transport = Transport()
+    source = codegen.generate(Document(location, transport))
+
+    warnings = io.StringIO()
+    reporter = pyflakes_reporter.Reporter(warnings, warnings)
+    assert pyflakes_api.check(source, "generated.py", reporter) == 0, warnings
+    assert black.format_str(source, mode=black.Mode()) == source
+
+
+def test_generated_module_imports(transport):
+    document = Document("http://tests.python-zeep.org/orders.wsdl", transport)
+    assert "\nimport datetime\n" in codegen.generate(document)
+
+    document = Document("tests/wsdl_files/soap_items.wsdl", Transport())
+    assert "\nimport datetime\n" not in codegen.generate(document)
+
+
+def test_generate_formats_via_black(monkeypatch, transport):
+    black = stub(
+        Mode=lambda line_length: stub(line_length=line_length),
+        format_str=lambda source, mode: "# line length %d\n" % mode.line_length,
+    )
+    monkeypatch.setattr(codegen, "_import_black", lambda: black)
+
+    document = Document("http://tests.python-zeep.org/orders.wsdl", transport)
+    assert codegen.generate(document) == "# line length 88\n"
+
+
+def test_unknown_service(transport):
+    document = Document("http://tests.python-zeep.org/orders.wsdl", transport)
+    with pytest.raises(CodegenError):
+        codegen.generate(document, service="Unknown")
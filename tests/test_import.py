@@ -0,0 +1,71 @@
+import subprocess
+import sys
+
+import pytest
+
+OPTIONAL_MODULES = [
+    "asyncio",
+    "httpx",
+    "isodate",
+    "packaging",
+    "platformdirs",
+    "pytz",
+    "requests",
+    "requests_file",
+    "requests_toolbelt",
+    "sqlite3",
+]
+
+
+def get_imported_modules(statement):
+    """Return the names of the modules imported by the given statement in a
+    fresh interpreter.
+
+    The interpreter runs with ``-X importtime`` so that the import times are
+    shown in the captured output when one of the tests fails.
+
+    """
+    code = "%s\nimport sys\nprint('\\n'.join(sys.modules))" % statement
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    sys.stderr.write(result.stderr)
+    return set(result.stdout.split())
+
+
+def test_import_zeep():
+    modules = get_imported_modules("import zeep")
+    assert "zeep" in modules
+    assert "zeep.client" not in modules
+    assert "lxml.etree" not in modules
+
+
+@pytest.mark.parametrize("statement", ["import zeep.client", "from zeep import Client"])
+def test_import_client_skips_optional_modules(statement):
+    modules = get_imported_modules(statement)
+    assert "zeep.client" in modules
+    assert [name for name in OPTIONAL_MODULES if name in modules] == []
+
+
+def test_lazy_attributes():
+    import zeep
+
+    assert zeep.Client.__module__ == "zeep.client"
+    assert zeep.Transport.__module__ == "zeep.transports"
+    assert "Client" in dir(zeep)
+    with pytest.raises(AttributeError):
+        zeep.DoesNotExist
+
+
+def test_submodules_after_import_zeep():
+    modules = get_imported_modules(
+        "import zeep\n"
+        "zeep.exceptions.Fault\n"
+        "zeep.xsd.String()\n"
+        "zeep.helpers.serialize_object\n"
+        "assert not hasattr(zeep, 'does_not_exist')"
+    )
+    assert {"zeep.exceptions", "zeep.xsd", "zeep.helpers"} <= modules
@@ -0,0 +1,91 @@
+import os
+import warnings
+
+import pytest
+
+from tests.utils import assert_nodes_equal
+from zeep import Client, Settings, snapshot
+from zeep.exceptions import IncompleteMessage
+from zeep.xsd.types.unresolved import UnresolvedType
+
+NAMESPACE = "http://example.com/stockquote.xsd"
+
+
+@pytest.fixture
+def client():
+    return Client("tests/wsdl_files/soap.wsdl", settings=Settings(lazy_resolve=True))
+
+
+def _get_document(client):
+    return client.wsdl.types.documents.get_by_namespace(NAMESPACE, False)[0]
+
+
+def test_operations_resolved_on_first_use(client):
+    binding = client.service._binding
+    assert sorted(binding._unresolved_operations) == [
+        "GetLastTradePrice",
+        "GetLastTradePriceNoOutput",
+    ]
+
+    result = client.create_message(
+        client.service, "GetLastTradePrice", tickerSymbol="ZEEP"
+    )
+    expected = Client("tests/wsdl_files/soap.wsdl").create_message(
+        client.service, "GetLastTradePrice", tickerSymbol="ZEEP"
+    )
+    assert_nodes_equal(result, expected)
+    assert list(binding._unresolved_operations) == ["GetLastTradePriceNoOutput"]
+
+
+def test_types_resolved_on_first_use(client):
+    document = _get_document(client)
+    assert ("type", "{%s}ArrayOfAddress" % NAMESPACE) not in (
+        document._resolved_components
+    )
+
+    array_type = client.get_type("ns0:ArrayOfAddress")
+    assert not isinstance(array_type.elements[0][1].type, UnresolvedType)
+    assert array_type.elements[0][1].type.name == "Address"
+    assert ("type", "{%s}ArrayOfAddress" % NAMESPACE) in (
+        document._resolved_components
+    )
+
+    value = array_type(Address=[{"NameFirst": "J", "NameLast": "Doe"}])
+    assert value.Address[0].NameLast == "Doe"
+
+
+def test_resolve_document(client):
+    client.wsdl.resolve()
+
+    assert not client.service._binding._unresolved_operations
+    assert _get_document(client)._resolved
+    assert str(client.service.GetLastTradePriceNoOutput.__doc__)
+
+
+def test_invalid_message_part(tmpdir):
+    with open("tests/wsdl_files/soap.wsdl") as fh:
+        content = fh.read().replace(
+            'element="xsd1:TradePriceRequest"', 'element="xsd1:UnknownRequest"'
+        )
+    path = tmpdir.join("soap.wsdl")
+    path.write(content)
+
+    # The message is only validated when the operation is used
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        client = Client(str(path), settings=Settings(lazy_resolve=True))
+
+    with pytest.raises(IncompleteMessage):
+        client.service._binding.get("GetLastTradePrice")
+
+
+def test_snapshot(tmpdir):
+    path = os.path.join(str(tmpdir), "soap.snapshot")
+    document = snapshot.build(
+        "tests/wsdl_files/soap.wsdl", settings=Settings(lazy_resolve=True)
+    )
+    snapshot.dump(document, path)
+
+    result = snapshot.load(path, settings=Settings(lazy_resolve=True))
+    client = Client(result, transport=result.transport)
+    assert client.get_type("ns0:ArrayOfAddress")
@@ -1,9 +1,21 @@
 import pytest
+from lxml import etree
 
 from tests.utils import DummyTransport
+from zeep import xsd
+from zeep.cache import InMemoryCache
 from zeep.exceptions import DTDForbidden, EntitiesForbidden
-from zeep.loader import parse_xml
+from zeep.loader import (
+    _parser_pool,
+    find_references,
+    load_content,
+    load_documents,
+    load_external,
+    parse_response,
+    parse_xml,
+)
 from zeep.settings import Settings
+from zeep.transports import Transport
 
 
 def test_huge_text():
@@ -46,3 +58,191 @@ def test_allow_entities_and_dtd():
     tree = parse_xml(xml, DummyTransport(), settings=Settings(forbid_entities=False))
 
     assert tree[0][0].tag == "Author"
+
+
+def test_parse_response_reuses_parser():
+    xml = b"""
+        <s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+         <s:Body>
+            <Author> <Name>Donald Duck</Name> </Author>
+         </s:Body>
+        </s:Envelope>
+    """
+    settings = Settings()
+    transport = DummyTransport()
+    parser = _parser_pool.get(transport, settings)
+    assert _parser_pool.get(DummyTransport(), Settings()) is parser
+    assert _parser_pool.get(transport, Settings(strict=False)) is not parser
+
+    tree = parse_response(xml, transport, settings=settings)
+    assert tree[0][0].text == " "
+    assert parse_response(xml, transport, settings=settings)[0][0][0].text == (
+        "Donald Duck"
+    )
+
+
+def test_parse_response_fast():
+    xml = b"""
+        <s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+         <s:Body>
+            <Author> <Name>Donald Duck</Name> </Author>
+            <Empty> </Empty>
+         </s:Body>
+        </s:Envelope>
+    """
+    settings = Settings(xml_fast_responses=True)
+    tree = parse_response(xml, DummyTransport(), settings=settings)
+    assert tree[0][0].text is None
+    assert tree[0][0].tail is None
+    assert tree[0][0][0].text == "Donald Duck"
+    assert tree[0][1].text == " "
+
+    with pytest.raises(EntitiesForbidden):
+        parse_response(
+            b"""
+            <!DOCTYPE Author [<!ENTITY writer "Donald Duck.">]>
+            <Author>&writer;</Author>
+            """.strip(),
+            DummyTransport(),
+            settings=settings,
+        )
+
+
+def test_find_references():
+    node = parse_xml(
+        """
+        <wsdl:definitions
+            xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+          <wsdl:import namespace="http://tests.python-zeep.org/a"
+                       location="a.wsdl"/>
+          <wsdl:types>
+            <xsd:schema>
+              <xsd:import namespace="http://tests.python-zeep.org/b"
+                          schemaLocation="xsd/b.xsd"/>
+              <xsd:import namespace="http://tests.python-zeep.org/c"/>
+              <xsd:include schemaLocation="http://other.python-zeep.org/d.xsd"/>
+              <xsd:include schemaLocation="xsd/b.xsd"/>
+            </xsd:schema>
+          </wsdl:types>
+        </wsdl:definitions>
+    """,
+        DummyTransport(),
+    )
+
+    result = find_references(node, "http://tests.python-zeep.org/wsdl", Settings())
+    assert result == [
+        "http://tests.python-zeep.org/a.wsdl",
+        "http://tests.python-zeep.org/xsd/b.xsd",
+        "http://other.python-zeep.org/d.xsd",
+    ]
+
+
+def test_load_content_bundled_schema():
+    transport = DummyTransport()
+    url, content = load_content(
+        "https://www.w3.org/2001/xml.xsd", transport, settings=Settings()
+    )
+    assert url == "https://www.w3.org/2001/xml.xsd"
+    assert b'targetNamespace="http://www.w3.org/XML/1998/namespace"' in content
+
+    transport.bind("https://www.w3.org/2001/xml.xsd", b"<remote/>")
+    settings = Settings(xsd_bundled_schemas=False)
+    url, content = load_content(
+        "https://www.w3.org/2001/xml.xsd", transport, settings=settings
+    )
+    assert content == b"<remote/>"
+
+
+def test_load_documents_bundled_schema():
+    transport = DummyTransport()
+    transport.bind(
+        "http://tests.python-zeep.org/a.xsd",
+        """
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+          <xs:import
+            namespace="http://schemas.xmlsoap.org/soap/encoding/"
+            schemaLocation="http://schemas.xmlsoap.org/soap/encoding/"/>
+        </xs:schema>
+        """.strip(),
+    )
+    documents = load_documents(["http://tests.python-zeep.org/a.xsd"], transport)
+    assert sorted(documents) == [
+        "http://schemas.xmlsoap.org/soap/encoding/",
+        "http://tests.python-zeep.org/a.xsd",
+    ]
+
+
+def test_load_documents_reuses_parsed_documents():
+    url = "http://tests.python-zeep.org/a.xsd"
+    transport = DummyTransport()
+    transport.bind(url, '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"/>')
+    documents = load_documents([url], transport)
+
+    node = documents.nodes[url]
+    assert load_external(url, transport, prefetched=documents) is node
+
+    # The parsed document is only used once
+    other = load_external(url, transport, prefetched=documents)
+    assert other is not node
+    assert other.tag == node.tag
+
+
+def test_load_documents_batched_cache_lookup():
+    class RecordingCache(InMemoryCache):
+        def __init__(self):
+            super().__init__()
+            self.lookups = []
+
+        def get_entries(self, urls):
+            self.lookups.append(list(urls))
+            return super().get_entries(urls)
+
+    a_url = "http://tests.python-zeep.org/batch-a.xsd"
+    b_url = "http://tests.python-zeep.org/batch-b.xsd"
+    cache = RecordingCache()
+    cache.add(
+        a_url,
+        b"""
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+          <xs:include schemaLocation="batch-b.xsd"/>
+        </xs:schema>
+        """.strip(),
+    )
+    cache.add(b_url, b'<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"/>')
+
+    transport = Transport(cache=cache)
+    transport.load = pytest.fail
+    documents = load_documents([a_url], transport)
+
+    assert sorted(documents) == [a_url, b_url]
+    assert cache.lookups == [[a_url], [b_url]]
+
+
+def test_auto_import_bundled_schemas():
+    # The transport doesn't serve any document
+    schema = xsd.Schema(
+        etree.fromstring(
+            """
+            <xs:schema
+                xmlns:xs="http://www.w3.org/2001/XMLSchema"
+                xmlns:soapenc="http://schemas.xmlsoap.org/soap/encoding/"
+                xmlns:tns="http://tests.python-zeep.org/"
+                targetNamespace="http://tests.python-zeep.org/">
+              <xs:import namespace="http://www.w3.org/XML/1998/namespace"/>
+              <xs:element name="container">
+                <xs:complexType>
+                  <xs:sequence>
+                    <xs:element name="item" type="soapenc:string"/>
+                  </xs:sequence>
+                  <xs:attribute ref="xml:lang"/>
+                </xs:complexType>
+              </xs:element>
+            </xs:schema>
+            """.strip()
+        ),
+        transport=DummyTransport(),
+    )
+    container = schema.get_element("{http://tests.python-zeep.org/}container")
+    value = container(item="foo", lang="en")
+    assert value.lang == "en"
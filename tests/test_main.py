@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 from pretend import stub
 
-from zeep import __main__, client
+from zeep import __main__, bundle, client
 
 
 def test_main_no_args(monkeypatch):
@@ -31,3 +31,26 @@ def test_main_extract_auth(monkeypatch):
 
         args, kwargs = mock_transport.call_args
         assert kwargs["session"].auth == ("user", "secret")
+
+
+def test_bundle(tmpdir, capsys):
+    output = str(tmpdir.join("bundle.zip"))
+    args = __main__.parse_bundle_arguments(
+        ["tests/wsdl_files/soap_items.wsdl", "--output", output]
+    )
+    __main__.create_bundle(args)
+
+    assert bundle.is_bundle(output)
+    assert "with 1 documents" in capsys.readouterr().out
+
+
+def test_codegen(tmpdir, capsys):
+    output = str(tmpdir.join("stockquote.py"))
+    args = __main__.parse_codegen_arguments(
+        ["tests/wsdl_files/soap.wsdl", "--output", output]
+    )
+    __main__.create_module(args)
+
+    with open(output) as fh:
+        assert "def serialize_GetLastTradePrice(" in fh.read()
+    assert "Created %s" % output in capsys.readouterr().out
@@ -0,0 +1,185 @@
+import threading
+
+import pytest
+
+from tests.utils import DummyTransport
+from zeep import AsyncClient, Client, ClientPool, Settings, pool
+
+WSDL = "http://tests.python-zeep.org/items.wsdl"
+
+
+class CountingTransport(DummyTransport):
+    def __init__(self):
+        super().__init__()
+        self.loaded = []
+
+    def load(self, url):
+        self.loaded.append(url)
+        return super().load(url)
+
+
+@pytest.fixture
+def transport():
+    transport = CountingTransport()
+    with open("tests/wsdl_files/soap_items.wsdl", "rb") as fh:
+        transport.bind(WSDL, fh.read())
+    return transport
+
+
+def test_client(transport):
+    client_pool = ClientPool(transport=transport)
+    client_1 = client_pool.client(WSDL)
+    client_2 = client_pool.client(WSDL)
+
+    assert client_1 is not client_2
+    assert client_1.wsdl is client_2.wsdl
+    assert client_2.transport is transport
+    assert transport.loaded == [WSDL]
+    assert len(client_pool) == 1
+    assert client_2.service.GetItems
+
+
+def test_client_settings(transport):
+    settings = Settings(strict=False)
+    client_pool = ClientPool(transport=transport)
+    client_1 = client_pool.client(WSDL)
+    client_2 = client_pool.client(WSDL, settings=settings)
+    client_3 = client_pool.client(WSDL, settings=settings)
+    client_4 = client_pool.client(WSDL)
+
+    # The document is parsed with the settings object of the clients
+    assert client_2.wsdl is client_3.wsdl
+    assert client_2.wsdl is not client_1.wsdl
+    assert client_4.wsdl is client_1.wsdl
+    assert client_2.wsdl.settings is settings
+    assert client_1.wsdl.settings is client_1.settings
+    assert len(client_pool) == 2
+
+    with client_1.settings(strict=False):
+        assert not client_4.wsdl.types.settings.strict
+    assert client_4.wsdl.types.settings.strict
+
+
+def test_client_transport(transport):
+    other = CountingTransport()
+    other.bind(WSDL, transport.load(WSDL))
+    transport.loaded.clear()
+
+    client_pool = ClientPool()
+    client_1 = client_pool.client(WSDL, transport=transport)
+    client_2 = client_pool.client(WSDL, transport=other)
+    client_3 = client_pool.client(WSDL, transport=transport)
+
+    # Documents loaded via one transport are not used for another transport
+    assert client_1.wsdl is client_3.wsdl
+    assert client_2.wsdl is not client_1.wsdl
+    assert transport.loaded == [WSDL]
+    assert other.loaded == [WSDL]
+
+
+def test_client_class(transport):
+    client_pool = ClientPool(transport=transport)
+    client = client_pool.client(WSDL, client_class=AsyncClient)
+    assert isinstance(client, AsyncClient)
+    assert client.wsdl is client_pool.get_document(WSDL)
+
+
+def test_maxsize(transport):
+    transport.bind("http://tests.python-zeep.org/other.wsdl", transport.load(WSDL))
+    client_pool = ClientPool(maxsize=1, transport=transport)
+
+    document = client_pool.get_document(WSDL)
+    client_pool.get_document("http://tests.python-zeep.org/other.wsdl")
+    assert len(client_pool) == 1
+
+    assert client_pool.get_document(WSDL) is not document
+
+
+def test_ttl(transport, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pool.time, "monotonic", lambda: now[0])
+    client_pool = ClientPool(ttl=60, transport=transport)
+
+    document = client_pool.get_document(WSDL)
+    now[0] += 59
+    assert client_pool.get_document(WSDL) is document
+
+    now[0] += 1
+    assert client_pool.get_document(WSDL) is not document
+
+
+def test_remove_and_clear(transport):
+    client_pool = ClientPool(transport=transport)
+    document = client_pool.get_document(WSDL)
+
+    client_pool.remove(WSDL)
+    assert len(client_pool) == 0
+    assert client_pool.get_document(WSDL) is not document
+
+    client_pool.clear()
+    assert len(client_pool) == 0
+
+
+def test_single_flight(transport):
+    started = threading.Event()
+    release = threading.Event()
+    original_load = transport.load
+
+    def load(url):
+        started.set()
+        release.wait(5)
+        return original_load(url)
+
+    transport.load = load
+    client_pool = ClientPool(transport=transport)
+
+    results = []
+
+    def get_document():
+        results.append(client_pool.get_document(WSDL))
+
+    threads = [threading.Thread(target=get_document) for i in range(10)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 10
+    assert all(result is results[0] for result in results)
+    assert transport.loaded == [WSDL]
+
+
+def test_load_error(transport):
+    client_pool = ClientPool(transport=transport)
+    with pytest.raises(KeyError):
+        client_pool.get_document("http://tests.python-zeep.org/missing.wsdl")
+    assert len(client_pool) == 0
+
+    with pytest.raises(TypeError):
+        client_pool.get_document(None)
+
+
+def test_client_shared(transport):
+    client_pool = ClientPool()
+    client_1 = Client.shared(WSDL, pool=client_pool, transport=transport)
+    client_2 = Client.shared(WSDL, pool=client_pool, transport=transport)
+    assert client_1.wsdl is client_2.wsdl
+    assert type(client_1) is Client
+
+
+def test_client_operations(transport):
+    client_pool = ClientPool(transport=transport)
+    client_1 = Client.shared(WSDL, pool=client_pool, operations=["GetItems"])
+    client_2 = Client.shared(WSDL, pool=client_pool, operations=["GetItems"])
+    client_3 = Client.shared(WSDL, pool=client_pool)
+
+    assert client_1.wsdl is client_2.wsdl
+    assert client_1.wsdl is not client_3.wsdl
+    assert len(client_pool) == 2
+
+    operations = client_1.service._binding._operations
+    assert list(operations) == ["GetItems"]
+    assert "GetCount" in client_3.service._binding._operations
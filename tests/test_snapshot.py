@@ -0,0 +1,219 @@
+import os
+import pickle
+
+import pytest
+import requests_mock
+
+from tests.utils import DummyTransport
+from zeep import Client, snapshot
+from zeep.cache import InMemoryCache
+from zeep.exceptions import SnapshotError
+from zeep.utils import get_version
+
+RESPONSE = """
+<?xml version="1.0"?>
+<soapenv:Envelope
+    xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:tns="http://tests.python-zeep.org/items">
+  <soapenv:Body>
+    <tns:GetItemsResponse>
+      <tns:GetItemsResult>
+        <tns:Total>1</tns:Total>
+        <tns:Items>
+          <tns:Item><tns:Key>a</tns:Key><tns:Value>1</tns:Value></tns:Item>
+        </tns:Items>
+      </tns:GetItemsResult>
+    </tns:GetItemsResponse>
+  </soapenv:Body>
+</soapenv:Envelope>
+""".strip()
+
+
+@pytest.fixture
+def transport():
+    transport = DummyTransport()
+    with open("tests/wsdl_files/soap_items.wsdl", "rb") as fh:
+        transport.bind("http://tests.python-zeep.org/items.wsdl", fh.read())
+    return transport
+
+
+@pytest.mark.requests
+def test_dump_load(tmpdir, transport):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, path)
+
+    result = snapshot.load(path, transport)
+    assert result is not document
+    assert result.transport is transport
+    assert result.types._transport is transport
+    assert result.location == "http://tests.python-zeep.org/items.wsdl"
+
+    client = Client(result)
+    item_type = client.get_type("{http://tests.python-zeep.org/items}Item")
+    item = item_type(Key="a", Value=1)
+    assert isinstance(item, item_type._value_class)
+
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/items", text=RESPONSE)
+        result = client.service.GetItems(Filter="all")
+    assert result.Total == 1
+    assert result.Items.Item[0].Key == "a"
+
+
+@pytest.mark.requests
+def test_dump_load_warmed_up(tmpdir, transport):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    document.warmup()
+    snapshot.dump(document, path)
+
+    client = Client(snapshot.load(path, transport))
+    item_type = client.get_type("{http://tests.python-zeep.org/items}Item")
+    assert item_type.__dict__["_parse_plan"] is not None
+
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/items", text=RESPONSE)
+        result = client.service.GetItems(Filter="all")
+    assert result.Items.Item[0].Value == 1
+
+
+def test_load_changed_source(tmpdir, transport):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, path)
+
+    transport.bind("http://tests.python-zeep.org/items.wsdl", b"<changed/>")
+    with pytest.raises(SnapshotError):
+        snapshot.load(path, transport, verify=True)
+
+    # Remote documents are only checked when they are in the cache
+    assert snapshot.load(path, transport)
+
+    # Skip the verification of the source documents
+    assert snapshot.load(path, transport, verify=False)
+
+
+def test_load_changed_cached_source(tmpdir, transport):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, path)
+
+    transport.cache = InMemoryCache()
+    with open("tests/wsdl_files/soap_items.wsdl", "rb") as fh:
+        transport.cache.add("http://tests.python-zeep.org/items.wsdl", fh.read())
+    assert snapshot.load(path, transport)
+
+    transport.cache.add("http://tests.python-zeep.org/items.wsdl", b"<changed/>")
+    with pytest.raises(SnapshotError):
+        snapshot.load(path, transport)
+
+
+def test_load_does_not_load_sources(tmpdir, transport):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, path)
+
+    transport.load = pytest.fail
+    assert snapshot.load(path, transport)
+
+
+def test_load_changed_local_source(tmpdir):
+    wsdl = tmpdir.join("items.wsdl")
+    with open("tests/wsdl_files/soap_items.wsdl", "rb") as fh:
+        wsdl.write(fh.read(), mode="wb")
+    path = str(tmpdir.join("items.snapshot"))
+    snapshot.dump(snapshot.build(str(wsdl)), path)
+    assert snapshot.load(path)
+
+    # Only the modification time is changed
+    os.utime(str(wsdl), ns=(0, 0))
+    assert snapshot.load(path)
+
+    wsdl.write(b"<changed/>", mode="wb")
+    with pytest.raises(SnapshotError):
+        snapshot.load(path)
+
+
+def test_load_other_version(tmpdir, transport, monkeypatch):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, path)
+
+    monkeypatch.setattr(snapshot, "get_version", lambda: "0.0.1")
+    with pytest.raises(SnapshotError):
+        snapshot.load(path, transport)
+
+
+def test_load_other_location(tmpdir, transport):
+    path = str(tmpdir.join("items.snapshot"))
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, path)
+
+    with pytest.raises(SnapshotError):
+        snapshot.load(path, transport, location="http://tests.python-zeep.org/x")
+
+
+def test_load_invalid_file(tmpdir, transport):
+    path = tmpdir.join("items.snapshot")
+    path.write(b"foobar")
+
+    with pytest.raises(SnapshotError):
+        snapshot.load(str(path), transport)
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        {"format": snapshot.SNAPSHOT_FORMAT, "version": get_version()},
+        ["not", "a", "dict"],
+    ],
+)
+def test_load_corrupt_file(tmpdir, transport, header):
+    path = tmpdir.join("items.snapshot")
+    path.write(snapshot.MAGIC + pickle.dumps(header), mode="wb")
+
+    with pytest.raises(SnapshotError):
+        snapshot.load(str(path), transport)
+
+
+def test_load_unknown_class(tmpdir, transport):
+    path = tmpdir.join("items.snapshot")
+    document = snapshot.build("http://tests.python-zeep.org/items.wsdl", transport)
+    snapshot.dump(document, str(path))
+
+    # A class which is removed in a newer version of zeep
+    content = path.read(mode="rb").replace(b"zeep.wsdl.wsdl", b"zeep.wsdl.gone")
+    path.write(content, mode="wb")
+    with pytest.raises(SnapshotError):
+        snapshot.load(str(path), transport)
+
+
+def test_dump_requires_build(tmpdir, transport):
+    document = Client(
+        "http://tests.python-zeep.org/items.wsdl", transport=transport
+    ).wsdl
+    with pytest.raises(SnapshotError):
+        snapshot.dump(document, str(tmpdir.join("items.snapshot")))
+
+
+def test_load_or_create(tmpdir, transport):
+    path = tmpdir.join("items.snapshot")
+    location = "http://tests.python-zeep.org/items.wsdl"
+
+    document = snapshot.load_or_create(str(path), location, transport)
+    assert path.exists()
+
+    result = snapshot.load_or_create(str(path), location, transport)
+    assert result is not document
+    assert result.bindings.keys() == document.bindings.keys()
+
+    # The snapshot is recreated when it is invalid
+    path.write(b"foobar")
+    assert snapshot.load_or_create(str(path), location, transport)
+    assert snapshot.load(str(path), transport)
+
+    # or when it is corrupt
+    path.write(snapshot.MAGIC + pickle.dumps({}) + b"foobar", mode="wb")
+    assert snapshot.load_or_create(str(path), location, transport)
+    assert snapshot.load(str(path), transport)
@@ -0,0 +1,180 @@
+import pytest
+import requests_mock
+
+from zeep import AsyncClient, Client, exceptions
+from zeep.wsdl.messages.streaming import StreamDeserializer
+
+RESPONSE = """
+<?xml version="1.0"?>
+<soapenv:Envelope
+    xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:tns="http://tests.python-zeep.org/items">
+  <soapenv:Body>
+    <tns:GetItemsResponse>
+      <tns:GetItemsResult>
+        <tns:Total>3</tns:Total>
+        <tns:Items>
+          <tns:Item><tns:Key>a</tns:Key><tns:Value>1</tns:Value></tns:Item>
+          <tns:Item><tns:Key>b</tns:Key><tns:Value>2</tns:Value></tns:Item>
+          <!-- comment -->
+          <tns:Item><tns:Key>c</tns:Key><tns:Value>3</tns:Value></tns:Item>
+        </tns:Items>
+      </tns:GetItemsResult>
+    </tns:GetItemsResponse>
+  </soapenv:Body>
+</soapenv:Envelope>
+""".strip()
+
+
+FAULT_RESPONSE = """
+<?xml version="1.0"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+  <soapenv:Body>
+    <soapenv:Fault>
+      <faultcode>soapenv:Server</faultcode>
+      <faultstring>Too many items</faultstring>
+    </soapenv:Fault>
+  </soapenv:Body>
+</soapenv:Envelope>
+""".strip()
+
+
+@pytest.fixture
+def client():
+    return Client("tests/wsdl_files/soap_items.wsdl")
+
+
+@pytest.mark.requests
+def test_stream(client):
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/items", text=RESPONSE)
+        items = client.service.GetItems.stream(Filter="all")
+
+        # The request is only sent when iterating
+        assert not m.called
+
+        result = [(item.Key, item.Value) for item in items]
+        assert result == [("a", 1), ("b", 2), ("c", 3)]
+        assert m.request_history[0].body.startswith(
+            b"<?xml version='1.0' encoding='utf-8'?>"
+        )
+
+
+@pytest.mark.requests
+def test_stream_fault(client):
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/items", text=FAULT_RESPONSE)
+
+        with pytest.raises(exceptions.Fault) as exc:
+            list(client.service.GetItems.stream(Filter="all"))
+        assert exc.value.message == "Too many items"
+
+
+@pytest.mark.requests
+def test_stream_fault_http_status(client):
+    with requests_mock.mock() as m:
+        m.post(
+            "http://tests.python-zeep.org/items",
+            text=FAULT_RESPONSE,
+            status_code=500,
+        )
+
+        with pytest.raises(exceptions.Fault):
+            list(client.service.GetItems.stream(Filter="all"))
+
+
+@pytest.mark.requests
+def test_stream_invalid_xml(client):
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/items", text=RESPONSE[:-20])
+
+        with pytest.raises(exceptions.TransportError):
+            list(client.service.GetItems.stream(Filter="all"))
+
+
+@pytest.mark.requests
+def test_stream_plugin_fallback(client):
+    class Plugin:
+        def __init__(self):
+            self.called = False
+
+        def ingress(self, envelope, http_headers, operation):
+            self.called = True
+            return envelope, http_headers
+
+        def egress(self, envelope, http_headers, operation, binding_options):
+            return envelope, http_headers
+
+    plugin = Plugin()
+    client.plugins.append(plugin)
+
+    with requests_mock.mock() as m:
+        m.post("http://tests.python-zeep.org/items", text=RESPONSE)
+        result = [item.Key for item in client.service.GetItems.stream(Filter="x")]
+
+    assert plugin.called
+    assert result == ["a", "b", "c"]
+
+
+def test_stream_no_repeating_element(client):
+    operation = client.service._binding.get("GetCount")
+    with pytest.raises(ValueError):
+        StreamDeserializer(operation.output, client.settings)
+
+
+def test_deserializer_chunks(client):
+    operation = client.service._binding.get("GetItems")
+    deserializer = StreamDeserializer(operation.output, client.settings)
+
+    data = RESPONSE.encode("utf-8")
+    result = []
+    for i in range(0, len(data), 16):
+        result.extend(deserializer.feed(data[i : i + 16]))
+    result.extend(deserializer.close())
+
+    assert [item.Key for item in result] == ["a", "b", "c"]
+    assert not deserializer.is_fault
+
+    # Processed items are removed from the tree
+    items = deserializer.root.find(".//{http://tests.python-zeep.org/items}Items")
+    assert len(items) <= 1
+
+
+def test_deserializer_invalid_root(client):
+    operation = client.service._binding.get("GetItems")
+    deserializer = StreamDeserializer(operation.output, client.settings)
+
+    with pytest.raises(exceptions.XMLSyntaxError):
+        deserializer.feed(b"<foo><bar/></foo>")
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_stream_async(httpx_mock):
+    client = AsyncClient("tests/wsdl_files/soap_items.wsdl")
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/items", content=RESPONSE.encode("utf-8")
+    )
+
+    result = []
+    async for item in client.service.GetItems.stream(Filter="all"):
+        result.append((item.Key, item.Value))
+    assert result == [("a", 1), ("b", 2), ("c", 3)]
+    await client.transport.aclose()
+
+
+@pytest.mark.requests
+@pytest.mark.asyncio
+async def test_stream_async_fault(httpx_mock):
+    client = AsyncClient("tests/wsdl_files/soap_items.wsdl")
+    httpx_mock.add_response(
+        url="http://tests.python-zeep.org/items",
+        content=FAULT_RESPONSE.encode("utf-8"),
+        status_code=500,
+    )
+
+    with pytest.raises(exceptions.Fault) as exc:
+        async for item in client.service.GetItems.stream(Filter="all"):
+            pass
+    assert exc.value.message == "Too many items"
+    await client.transport.aclose()
@@ -1,6 +1,8 @@
+import datetime
 import os
 from unittest.mock import mock_open, patch
 
+import freezegun
 import pytest
 import requests_mock
 from pretend import stub
@@ -73,3 +75,80 @@ def test_settings_set_context_timeout():
             assert transport.operation_timeout == 90
         assert transport.operation_timeout == 120
     assert transport.operation_timeout is None
+
+
+@pytest.mark.parametrize(
+    "create_cache",
+    [
+        lambda tmpdir: cache.InMemoryCache(timeout=60),
+        lambda tmpdir: cache.LRUCache(timeout=60),
+        lambda tmpdir: cache.SqliteCache(
+            path=tmpdir.join("sqlite.cache.db").strpath, timeout=60
+        ),
+        lambda tmpdir: cache.FileSystemCache(path=tmpdir.strpath, timeout=60),
+    ],
+)
+def test_load_revalidate(tmpdir, create_cache):
+    url = "http://tests.python-zeep.org/revalidate.xml"
+    transport = transports.Transport(cache=create_cache(tmpdir))
+
+    with requests_mock.mock() as m:
+        m.get(url, text="x", headers={"ETag": '"v1"', "Last-Modified": "yesterday"})
+        assert transport.load(url) == b"x"
+
+        # Served from the cache
+        assert transport.load(url) == b"x"
+        assert m.call_count == 1
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    with freezegun.freeze_time(now + datetime.timedelta(seconds=120)):
+        with requests_mock.mock() as m:
+            m.get(url, status_code=304)
+            assert transport.load(url) == b"x"
+            assert m.call_count == 1
+            assert m.last_request.headers["If-None-Match"] == '"v1"'
+            assert m.last_request.headers["If-Modified-Since"] == "yesterday"
+
+            # The entry is valid again
+            assert transport.load(url) == b"x"
+            assert m.call_count == 1
+
+    with freezegun.freeze_time(now + datetime.timedelta(seconds=240)):
+        with requests_mock.mock() as m:
+            m.get(url, text="y", headers={"ETag": '"v2"'})
+            assert transport.load(url) == b"y"
+
+        with requests_mock.mock() as m:
+            assert transport.load(url) == b"y"
+
+
+def test_load_custom_load_remote_data():
+    class CustomTransport(transports.Transport):
+        def _load_remote_data(self, url):
+            return b"custom:" + url.encode("utf-8")
+
+    url = "http://tests.python-zeep.org/custom.xml"
+    transport = CustomTransport(cache=cache.InMemoryCache())
+
+    with requests_mock.mock() as m:
+        assert transport.load(url) == b"custom:" + url.encode("utf-8")
+        assert not m.called
+
+    # The result of the hook is cached
+    assert transport.cache.get(url) == b"custom:" + url.encode("utf-8")
+
+
+def test_load_expired_without_validators():
+    url = "http://tests.python-zeep.org/no-validators.xml"
+    transport = transports.Transport(cache=cache.LRUCache(timeout=60))
+
+    with requests_mock.mock() as m:
+        m.get(url, text="x")
+        assert transport.load(url) == b"x"
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    with freezegun.freeze_time(now + datetime.timedelta(seconds=120)):
+        with requests_mock.mock() as m:
+            m.get(url, text="y")
+            assert transport.load(url) == b"y"
+            assert "If-None-Match" not in m.last_request.headers
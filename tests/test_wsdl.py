@@ -1,3 +1,4 @@
+import threading
 from io import StringIO
 
 import pytest
@@ -1312,3 +1313,184 @@ def test_import_no_location():
     document = wsdl.Document(
         wsdl_content, transport, "https://tests.python-zeep.org/content.wsdl"
     )
+
+
+PREFETCH_WSDL = """
+    <wsdl:definitions
+        xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+        xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+        targetNamespace="http://tests.python-zeep.org/prefetch">
+      <wsdl:types>
+        <xsd:schema targetNamespace="http://tests.python-zeep.org/prefetch">
+          <xsd:import namespace="http://tests.python-zeep.org/a"
+                      schemaLocation="a.xsd"/>
+          <xsd:import namespace="http://tests.python-zeep.org/b"
+                      schemaLocation="b.xsd"/>
+        </xsd:schema>
+      </wsdl:types>
+    </wsdl:definitions>
+""".strip()
+
+
+def _prefetch_schema(name):
+    return """
+        <xsd:schema
+            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+            targetNamespace="http://tests.python-zeep.org/%s">
+          <xsd:element name="item" type="xsd:string"/>
+        </xsd:schema>
+    """ % name
+
+
+def test_prefetch_documents():
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+
+    class BarrierTransport(DummyTransport):
+        def load(self, url):
+            calls.append(url)
+            if url.endswith(".xsd"):
+                # Blocks until both schemas are requested at the same time
+                barrier.wait()
+            return super().load(url)
+
+    transport = BarrierTransport()
+    transport.bind("http://tests.python-zeep.org/prefetch.wsdl", PREFETCH_WSDL)
+    transport.bind("http://tests.python-zeep.org/a.xsd", _prefetch_schema("a"))
+    transport.bind("http://tests.python-zeep.org/b.xsd", _prefetch_schema("b"))
+
+    document = wsdl.Document(
+        "http://tests.python-zeep.org/prefetch.wsdl",
+        transport,
+        settings=Settings(prefetch_workers=8),
+    )
+    assert document.types.get_element("{http://tests.python-zeep.org/a}item")
+    assert document.types.get_element("{http://tests.python-zeep.org/b}item")
+
+    # Every document is only retrieved once
+    assert sorted(calls) == [
+        "http://tests.python-zeep.org/a.xsd",
+        "http://tests.python-zeep.org/b.xsd",
+        "http://tests.python-zeep.org/prefetch.wsdl",
+    ]
+    assert not document.types._prefetched
+
+
+def test_prefetch_documents_disabled():
+    calls = []
+
+    class RecordingTransport(DummyTransport):
+        def load(self, url):
+            calls.append((url, threading.current_thread()))
+            return super().load(url)
+
+    transport = RecordingTransport()
+    transport.bind("http://tests.python-zeep.org/prefetch.wsdl", PREFETCH_WSDL)
+    transport.bind("http://tests.python-zeep.org/a.xsd", _prefetch_schema("a"))
+    transport.bind("http://tests.python-zeep.org/b.xsd", _prefetch_schema("b"))
+
+    # Prefetching is disabled by default
+    document = wsdl.Document("http://tests.python-zeep.org/prefetch.wsdl", transport)
+    assert document.types.get_element("{http://tests.python-zeep.org/b}item")
+    assert calls == [
+        ("http://tests.python-zeep.org/prefetch.wsdl", threading.current_thread()),
+        ("http://tests.python-zeep.org/a.xsd", threading.current_thread()),
+        ("http://tests.python-zeep.org/b.xsd", threading.current_thread()),
+    ]
+
+
+def test_prefetch_documents_error():
+    transport = DummyTransport()
+    transport.bind("http://tests.python-zeep.org/prefetch.wsdl", PREFETCH_WSDL)
+    transport.bind("http://tests.python-zeep.org/a.xsd", _prefetch_schema("a"))
+
+    # The error is raised while processing the wsdl, not during the prefetch
+    with pytest.raises(KeyError):
+        wsdl.Document("http://tests.python-zeep.org/prefetch.wsdl", transport)
+
+
+def test_warmup():
+    document = wsdl.Document("tests/wsdl_files/soap_items.wsdl", Transport())
+    item_type = document.types.get_type("{http://tests.python-zeep.org/items}Item")
+    response = document.types.get_element(
+        "{http://tests.python-zeep.org/items}GetItemsResponse"
+    )
+    assert "_value_class" not in vars(item_type)
+
+    document.warmup()
+
+    for component in (item_type, response.type):
+        for name in ("elements", "elements_nested", "attributes", "_value_class"):
+            assert name in vars(component)
+    assert "elements" in vars(item_type._element)
+
+    binding = document.bindings["{http://tests.python-zeep.org/items}ItemsBinding"]
+    operation = binding.get("GetItems")
+    assert "_value_class" in vars(operation.input.body.type)
+
+
+def test_warmup_operations():
+    document = wsdl.Document("tests/wsdl_files/soap_items.wsdl", Transport())
+    item_type = document.types.get_type("{http://tests.python-zeep.org/items}Item")
+    response = document.types.get_element(
+        "{http://tests.python-zeep.org/items}GetCountResponse"
+    )
+
+    document.warmup(["ItemsPort/GetCount"])
+
+    assert "_value_class" in vars(response.type)
+    assert "_value_class" not in vars(item_type)
+    assert document.types.documents.has_schema_document_for_ns(
+        "http://schemas.xmlsoap.org/soap/encoding/"
+    )
+
+    with pytest.raises(ValueError):
+        document.warmup(["GetPrice"])
+
+
+def test_warmup_operations_lazy_resolve():
+    document = wsdl.Document(
+        "tests/wsdl_files/soap_items.wsdl",
+        Transport(),
+        settings=Settings(lazy_resolve=True),
+    )
+    document.warmup(["GetCount"])
+
+    # Only the components of the operation are resolved
+    schema_document = document.types.documents.get_by_namespace(
+        "http://tests.python-zeep.org/items", fail_silently=True
+    )[0]
+    assert not schema_document._resolved
+    assert ("element", "{http://tests.python-zeep.org/items}GetCountResponse") in (
+        schema_document._resolved_components
+    )
+    assert ("type", "{http://tests.python-zeep.org/items}Item") not in (
+        schema_document._resolved_components
+    )
+
+    response = document.types.get_element(
+        "{http://tests.python-zeep.org/items}GetCountResponse"
+    )
+    assert "_value_class" in vars(response.type)
+
+
+def test_freeze(monkeypatch):
+    calls = []
+    monkeypatch.setattr("gc.freeze", lambda: calls.append(True))
+
+    document = wsdl.Document("tests/wsdl_files/soap_items.wsdl", Transport())
+    document.freeze()
+
+    item_type = document.types.get_type("{http://tests.python-zeep.org/items}Item")
+    assert "_value_class" in vars(item_type)
+    assert calls == [True]
+
+
+def test_freeze_without_gc_freeze(monkeypatch):
+    monkeypatch.delattr("gc.freeze")
+
+    document = wsdl.Document("tests/wsdl_files/soap_items.wsdl", Transport())
+    document.freeze()
+
+    item_type = document.types.get_type("{http://tests.python-zeep.org/items}Item")
+    assert "_value_class" in vars(item_type)
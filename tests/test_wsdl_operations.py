@@ -0,0 +1,163 @@
+import io
+
+import pytest
+from lxml import etree
+
+from tests.utils import render_node
+from zeep import Client, Settings
+from zeep.transports import Transport
+from zeep.wsdl import Document
+
+NAMESPACE = "http://example.com/stockquote.xsd"
+
+WSDL = """
+<?xml version="1.0"?>
+<wsdl:definitions
+    xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+    xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+    xmlns:tns="http://tests.python-zeep.org/"
+    targetNamespace="http://tests.python-zeep.org/">
+  <wsdl:types>
+    <xsd:schema targetNamespace="http://tests.python-zeep.org/"
+                elementFormDefault="qualified">
+      <xsd:complexType name="Animal">
+        <xsd:sequence>
+          <xsd:element name="name" type="xsd:string"/>
+        </xsd:sequence>
+      </xsd:complexType>
+      <xsd:complexType name="Dog">
+        <xsd:complexContent>
+          <xsd:extension base="tns:Animal">
+            <xsd:sequence>
+              <xsd:element name="breed" type="xsd:string"/>
+            </xsd:sequence>
+          </xsd:extension>
+        </xsd:complexContent>
+      </xsd:complexType>
+      <xsd:complexType name="Order">
+        <xsd:sequence>
+          <xsd:element name="id" type="xsd:int"/>
+        </xsd:sequence>
+      </xsd:complexType>
+      <xsd:element name="GetAnimal" type="tns:Animal"/>
+      <xsd:element name="GetOrder" type="tns:Order"/>
+    </xsd:schema>
+  </wsdl:types>
+  <wsdl:message name="GetAnimal">
+    <wsdl:part name="body" element="tns:GetAnimal"/>
+  </wsdl:message>
+  <wsdl:message name="GetOrder">
+    <wsdl:part name="body" element="tns:GetOrder"/>
+  </wsdl:message>
+  <wsdl:portType name="PortType">
+    <wsdl:operation name="GetAnimal">
+      <wsdl:input message="tns:GetAnimal"/>
+      <wsdl:output message="tns:GetAnimal"/>
+    </wsdl:operation>
+    <wsdl:operation name="GetOrder">
+      <wsdl:input message="tns:GetOrder"/>
+      <wsdl:output message="tns:GetOrder"/>
+    </wsdl:operation>
+  </wsdl:portType>
+  <wsdl:binding name="Binding" type="tns:PortType">
+    <soap:binding style="document"
+                  transport="http://schemas.xmlsoap.org/soap/http"/>
+    <wsdl:operation name="GetAnimal">
+      <soap:operation soapAction=""/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+      <wsdl:output><soap:body use="literal"/></wsdl:output>
+    </wsdl:operation>
+    <wsdl:operation name="GetOrder">
+      <soap:operation soapAction=""/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+      <wsdl:output><soap:body use="literal"/></wsdl:output>
+    </wsdl:operation>
+  </wsdl:binding>
+  <wsdl:service name="Service">
+    <wsdl:port name="Port" binding="tns:Binding">
+      <soap:address location="http://tests.python-zeep.org/animals"/>
+    </wsdl:port>
+  </wsdl:service>
+  <wsdl:service name="OtherService">
+    <wsdl:port name="OtherPort" binding="tns:Binding">
+      <soap:address location="http://tests.python-zeep.org/other"/>
+    </wsdl:port>
+  </wsdl:service>
+</wsdl:definitions>
+""".strip()
+
+
+def _get_components(client):
+    document = client.wsdl.types.documents.get_by_namespace(
+        "http://tests.python-zeep.org/", False
+    )[0]
+    return sorted(document._types), sorted(document._elements)
+
+
+@pytest.mark.parametrize("lazy_resolve", [False, True])
+def test_prune(lazy_resolve):
+    settings = Settings(operations=["GetAnimal"], lazy_resolve=lazy_resolve)
+    client = Client(io.StringIO(WSDL), settings=settings)
+
+    assert list(client.service._binding.all()) == ["GetAnimal"]
+    assert list(client.wsdl.messages) == ["{http://tests.python-zeep.org/}GetAnimal"]
+    port_type = client.wsdl.port_types["{http://tests.python-zeep.org/}PortType"]
+    assert list(port_type.operations) == ["GetAnimal"]
+
+    # The Dog type is kept since it can be used via xsi:type
+    assert _get_components(client) == (
+        ["{http://tests.python-zeep.org/}Animal", "{http://tests.python-zeep.org/}Dog"],
+        ["{http://tests.python-zeep.org/}GetAnimal"],
+    )
+
+    dog = client.get_type("ns0:Dog")(name="Rex", breed="Beagle")
+    node = render_node(client.get_element("ns0:GetAnimal"), dog)
+    assert node[0].get("{http://www.w3.org/2001/XMLSchema-instance}type") == (
+        "ns0:Dog"
+    )
+
+
+def test_prune_client_argument():
+    client = Client(io.StringIO(WSDL), operations=["GetOrder"])
+    assert list(client.service._binding.all()) == ["GetOrder"]
+    assert _get_components(client) == (
+        ["{http://tests.python-zeep.org/}Order"],
+        ["{http://tests.python-zeep.org/}GetOrder"],
+    )
+
+    node = client.create_message(client.service, "GetOrder", id=1)
+    assert etree.QName(node[0][0]).localname == "GetOrder"
+
+
+def test_prune_service_port():
+    client = Client(io.StringIO(WSDL), operations=["OtherService/OtherPort/GetOrder"])
+    assert list(client.wsdl.services) == ["OtherService"]
+    assert client.service._binding_options["address"] == (
+        "http://tests.python-zeep.org/other"
+    )
+
+    client = Client(io.StringIO(WSDL), operations=["Port/GetAnimal"])
+    assert list(client.wsdl.services) == ["Service"]
+
+
+def test_prune_unknown_operation():
+    with pytest.raises(ValueError) as exc:
+        Client(io.StringIO(WSDL), operations=["GetAnimal", "OtherPort/GetFoo"])
+    assert "'OtherPort/GetFoo'" in str(exc.value)
+
+    with pytest.raises(ValueError):
+        Client(io.StringIO(WSDL), operations=["a/b/c/d"])
+
+
+def test_prune_faults():
+    client = Client("tests/wsdl_files/soap.wsdl", operations=["GetLastTradePrice"])
+    document = client.wsdl.types.documents.get_by_namespace(NAMESPACE, False)[0]
+    assert "{%s}Fault1" % NAMESPACE in document._elements
+    assert "{%s}Fault2" % NAMESPACE in document._elements
+
+
+def test_operations_with_document():
+    document = Document("tests/wsdl_files/soap.wsdl", Transport())
+    with pytest.raises(ValueError):
+        Client(document, operations=["GetLastTradePrice"])
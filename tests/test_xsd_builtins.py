@@ -154,6 +154,12 @@ class TestDuration:
         value = "\r  \nP0Y1347M0D\t "
         assert instance.pythonvalue(value) == expected
 
+    def test_accepted_types(self):
+        expected = [isodate.duration.Duration, datetime.timedelta, str]
+        assert builtins.Duration.accepted_types == expected
+        assert builtins.Duration().accepted_types == expected
+        assert builtins.Duration.__dict__["accepted_types"] == expected
+
 
 class TestDateTime:
     def test_xmlvalue(self):
@@ -1,8 +1,11 @@
+import copy
+
 import pytest
 from lxml import etree
 
 from tests.utils import assert_nodes_equal, load_xml, render_node
 from zeep import exceptions, xsd
+from zeep.xsd.utils import IndexedXmlElements
 
 
 def test_xml_xml_single_node():
@@ -422,3 +425,95 @@ def test_ignore_sequence_order():
 
     response = elm.parse(node[0], schema)
     assert response.Baz.id == 3
+
+
+def test_ignore_sequence_order_repeated_elements():
+    schema_doc = load_xml(
+        b"""
+        <?xml version="1.0" encoding="utf-8"?>
+        <xsd:schema xmlns:tns="http://tests.python-zeep.org/attr"
+          xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+          elementFormDefault="qualified"
+          targetNamespace="http://tests.python-zeep.org/attr">
+          <xsd:element name="Response">
+            <xsd:complexType>
+              <xsd:sequence>
+                <xsd:element name="Foo" type="xsd:string" maxOccurs="unbounded"/>
+                <xsd:element name="Bar" type="xsd:string" maxOccurs="unbounded"/>
+                <xsd:element name="Baz" type="xsd:string" minOccurs="0"/>
+              </xsd:sequence>
+            </xsd:complexType>
+          </xsd:element>
+        </xsd:schema>
+    """
+    )
+
+    response_doc = load_xml(
+        b"""
+        <Response xmlns="http://tests.python-zeep.org/attr">
+          <Bar>bar-1</Bar>
+          <Foo>foo-1</Foo>
+          <!-- comment -->
+          <Baz>baz</Baz>
+          <Bar>bar-2</Bar>
+          <Foo>foo-2</Foo>
+          <Other>other</Other>
+        </Response>
+    """
+    )
+
+    schema = xsd.Schema(schema_doc)
+    schema.settings.xsd_ignore_sequence_order = True
+    schema.settings.strict = False
+    elm = schema.get_element("{http://tests.python-zeep.org/attr}Response")
+
+    response = elm.parse(response_doc, schema)
+    assert response.Foo == ["foo-1", "foo-2"]
+    assert response.Bar == ["bar-1", "bar-2"]
+    assert response.Baz == "baz"
+    assert [etree.QName(node).localname for node in response._raw_elements] == [
+        "Other"
+    ]
+
+
+def test_indexed_xml_elements():
+    elements = [
+        etree.Element("{http://tests.python-zeep.org/}%s" % name) for name in "abab"
+    ]
+    xmlelements = IndexedXmlElements(elements)
+
+    assert xmlelements.take("b") is elements[1]
+    assert xmlelements.take("c") is None
+    assert xmlelements.popleft() is elements[0]
+    assert xmlelements.take("a") is elements[2]
+    assert list(xmlelements) == [elements[3]]
+
+    del xmlelements[0]
+    assert not xmlelements
+    assert xmlelements.take("b") is None
+
+
+def test_indexed_xml_elements_take_out_of_order():
+    elements = [
+        etree.Element("{http://tests.python-zeep.org/}%s" % name) for name in "abcab"
+    ]
+    xmlelements = IndexedXmlElements(elements)
+
+    assert xmlelements.take("c") is elements[2]
+    assert xmlelements.take("b") is elements[1]
+    assert len(xmlelements) == 3
+    assert list(xmlelements) == [elements[0], elements[3], elements[4]]
+    assert xmlelements[1] is elements[3]
+    assert xmlelements[-1] is elements[4]
+
+    trial = copy.copy(xmlelements)
+    assert trial.take("a") is elements[0]
+    assert trial.take("a") is elements[3]
+    assert list(trial) == [elements[4]]
+    assert list(xmlelements) == [elements[0], elements[3], elements[4]]
+
+    del xmlelements[1]
+    assert xmlelements.popleft() is elements[0]
+    assert xmlelements.take("a") is None
+    assert xmlelements.pop() is elements[4]
+    assert not xmlelements
@@ -0,0 +1,85 @@
+from tests.utils import load_xml
+from zeep import xsd
+from zeep.xsd import graph
+
+
+def test_walk():
+    schema = xsd.Schema(
+        load_xml(
+            """
+        <schema xmlns="http://www.w3.org/2001/XMLSchema"
+                xmlns:tns="http://tests.python-zeep.org/"
+                targetNamespace="http://tests.python-zeep.org/"
+                elementFormDefault="qualified">
+          <complexType name="Address">
+            <sequence>
+              <element name="street" type="string"/>
+              <element name="next" type="tns:Address" minOccurs="0"/>
+            </sequence>
+            <attribute name="id" type="int"/>
+          </complexType>
+          <element name="container">
+            <complexType>
+              <choice>
+                <element name="address" type="tns:Address"/>
+                <element name="name" type="string"/>
+              </choice>
+            </complexType>
+          </element>
+          <complexType name="Unused">
+            <sequence>
+              <element name="value" type="string"/>
+            </sequence>
+          </complexType>
+        </schema>
+    """
+        )
+    )
+    container = schema.get_element("{http://tests.python-zeep.org/}container")
+    address_type = schema.get_type("{http://tests.python-zeep.org/}Address")
+    unused_type = schema.get_type("{http://tests.python-zeep.org/}Unused")
+
+    result = list(graph.walk(container))
+    assert result[0] is container
+    assert address_type in result
+    assert unused_type not in result
+
+    # Every component is returned once, also for recursive types
+    assert len({id(component) for component in result}) == len(result)
+
+    qnames = {
+        component.qname.text
+        for component in result
+        if isinstance(component, xsd.Element) and component.qname
+    }
+    assert qnames == {
+        "{http://tests.python-zeep.org/}container",
+        "{http://tests.python-zeep.org/}address",
+        "{http://tests.python-zeep.org/}name",
+        "{http://tests.python-zeep.org/}street",
+        "{http://tests.python-zeep.org/}next",
+        "id",
+    }
+
+
+def test_warmup():
+    schema = xsd.Schema(
+        load_xml(
+            """
+        <schema xmlns="http://www.w3.org/2001/XMLSchema"
+                targetNamespace="http://tests.python-zeep.org/">
+          <complexType name="Address">
+            <sequence>
+              <element name="street" type="string"/>
+            </sequence>
+          </complexType>
+        </schema>
+    """
+        )
+    )
+    address_type = schema.get_type("{http://tests.python-zeep.org/}Address")
+    graph.warmup(address_type)
+
+    for name in ("elements", "elements_nested", "attributes", "_value_class"):
+        assert name in vars(address_type)
+    assert "_array_class" not in vars(address_type)
@@ -1558,3 +1558,148 @@ def test_unit_choice_parse_xmlelements_max_2():
     result = element.type._element.parse_xmlelements(data, schema, name="items")
     assert result == {"items": [{"item_1": "item-1"}, {"item_2": "item-2"}]}
     assert len(data) == 1
+
+
+def test_unit_choice_dispatch_tables():
+    schema = xsd.Schema(
+        load_xml(
+            """
+        <?xml version="1.0"?>
+        <xsd:schema
+                xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+                xmlns:tns="http://tests.python-zeep.org/"
+                elementFormDefault="qualified"
+                targetNamespace="http://tests.python-zeep.org/">
+          <xsd:element name="container">
+            <xsd:complexType>
+              <xsd:choice maxOccurs="unbounded">
+                <xsd:element name="item_1" type="xsd:string" />
+                <xsd:sequence>
+                  <xsd:element name="item_2" type="xsd:string" minOccurs="0"/>
+                  <xsd:element name="item_3" type="xsd:string" />
+                  <xsd:element name="item_4" type="xsd:string" />
+                </xsd:sequence>
+                <xsd:any processContents="lax"/>
+              </xsd:choice>
+            </xsd:complexType>
+          </xsd:element>
+        </xsd:schema>
+    """
+        )
+    )
+    choice = schema.get_element("ns0:container").type._element
+    item_1, sequence, any_ = [option[1] for option in choice._options]
+
+    table, wildcards = choice._dispatch_tables[True]
+    assert [option[1] for option in wildcards] == [any_]
+    assert [option[1] for option in table["item_1"]] == [item_1, any_]
+    assert [option[1] for option in table["item_2"]] == [sequence, any_]
+    assert [option[1] for option in table["item_3"]] == [sequence, any_]
+    assert "item_4" not in table
+
+    # In non-strict mode missing required elements of a sequence are skipped
+    table, wildcards = choice._dispatch_tables[False]
+    assert [option[1] for option in table["item_4"]] == [sequence, any_]
+
+
+def test_unit_choice_parse_xmlelements_unbounded():
+    schema = xsd.Schema(
+        load_xml(
+            """
+        <?xml version="1.0"?>
+        <xsd:schema
+                xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+                xmlns:tns="http://tests.python-zeep.org/"
+                elementFormDefault="qualified"
+                targetNamespace="http://tests.python-zeep.org/">
+          <xsd:element name="container">
+            <xsd:complexType>
+              <xsd:choice maxOccurs="unbounded">
+                <xsd:element name="item_1" type="xsd:string" />
+                <xsd:element name="item_2" type="xsd:string" />
+                <xsd:sequence>
+                  <xsd:element name="item_3" type="xsd:string" />
+                  <xsd:element name="item_4" type="xsd:string" />
+                </xsd:sequence>
+              </xsd:choice>
+            </xsd:complexType>
+          </xsd:element>
+        </xsd:schema>
+    """
+        )
+    )
+    element = schema.get_element("ns0:container")
+
+    def create_elm(name, text):
+        elm = etree.Element(name)
+        elm.text = text
+        return elm
+
+    elements = []
+    expected = []
+    for i in range(1000):
+        elements.append(create_elm("item_%d" % (i % 3 + 1), str(i)))
+        if i % 3 == 2:
+            elements.append(create_elm("item_4", str(i)))
+            expected.append({"item_3": str(i), "item_4": str(i)})
+        else:
+            expected.append({"item_%d" % (i % 3 + 1): str(i)})
+    elements.append(create_elm("unknown", "x"))
+    data = deque(elements)
+
+    result = element.type._element.parse_xmlelements(data, schema, name="items")
+    assert result == {"items": expected}
+    assert len(data) == 1
+
+
+def test_unit_choice_parse_xmlelements_ambiguous():
+    schema = xsd.Schema(
+        load_xml(
+            """
+        <?xml version="1.0"?>
+        <xsd:schema
+                xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+                xmlns:tns="http://tests.python-zeep.org/"
+                elementFormDefault="qualified"
+                targetNamespace="http://tests.python-zeep.org/">
+          <xsd:element name="container">
+            <xsd:complexType>
+              <xsd:choice maxOccurs="unbounded">
+                <xsd:sequence>
+                  <xsd:element name="item_1" type="xsd:string" />
+                </xsd:sequence>
+                <xsd:sequence>
+                  <xsd:element name="item_1" type="xsd:string" />
+                  <xsd:element name="item_2" type="xsd:string"
+                               maxOccurs="unbounded"/>
+                </xsd:sequence>
+              </xsd:choice>
+            </xsd:complexType>
+          </xsd:element>
+        </xsd:schema>
+    """
+        )
+    )
+    element = schema.get_element("ns0:container")
+
+    def create_elm(name, text):
+        elm = etree.Element(name)
+        elm.text = text
+        return elm
+
+    # The second option consumes more elements than the window on which
+    # options are initially trial parsed
+    data = deque(
+        [create_elm("item_1", "a")]
+        + [create_elm("item_2", str(i)) for i in range(40)]
+        + [create_elm("item_1", "b")]
+    )
+
+    result = element.type._element.parse_xmlelements(data, schema, name="items")
+    assert result == {
+        "items": [
+            {"item_1": "a", "item_2": [str(i) for i in range(40)]},
+            {"item_1": "b"},
+        ]
+    }
+    assert len(data) == 0
@@ -0,0 +1,172 @@
+from decimal import Decimal
+
+import pytest
+from lxml import etree
+
+from tests.utils import load_xml
+from zeep import exceptions, xsd
+from zeep.helpers import serialize_object
+from zeep.settings import Settings
+
+SCHEMA = """
+<?xml version="1.0"?>
+<schema xmlns="http://www.w3.org/2001/XMLSchema"
+        xmlns:tns="http://tests.python-zeep.org/"
+        targetNamespace="http://tests.python-zeep.org/"
+        elementFormDefault="qualified">
+  <complexType name="Item">
+    <sequence>
+      <element name="name" type="string"/>
+      <element name="price" type="decimal" minOccurs="0"/>
+    </sequence>
+  </complexType>
+  <element name="container">
+    <complexType>
+      <sequence>
+        <element name="id" type="int"/>
+        <element name="item" type="tns:Item" minOccurs="0" maxOccurs="unbounded"/>
+        <element name="tag" type="string" minOccurs="0" maxOccurs="unbounded"/>
+        <element name="active" type="boolean" minOccurs="0"/>
+      </sequence>
+      <attribute name="version" type="int"/>
+    </complexType>
+  </element>
+  <element name="choice">
+    <complexType>
+      <choice>
+        <element name="a" type="string"/>
+        <element name="b" type="string"/>
+      </choice>
+    </complexType>
+  </element>
+</schema>
+"""
+
+CONTAINER = """
+<ns0:container xmlns:ns0="http://tests.python-zeep.org/" version="2">
+  <ns0:id>1</ns0:id>
+  <ns0:item>
+    <ns0:name>foo</ns0:name>
+    <ns0:price>1.50</ns0:price>
+  </ns0:item>
+  <ns0:item>
+    <ns0:name>bar</ns0:name>
+  </ns0:item>
+  <ns0:active>true</ns0:active>
+</ns0:container>
+"""
+
+
+def get_schema(**kwargs):
+    return xsd.Schema(load_xml(SCHEMA), settings=Settings(**kwargs))
+
+
+def parse(schema, xml, plan=True):
+    element = schema.get_element("{http://tests.python-zeep.org/}container")
+    if not plan:
+        element.type.__dict__["_parse_plan"] = None
+    return element.parse(load_xml(xml), schema)
+
+
+def test_compile():
+    schema = get_schema()
+    container = schema.get_element("{http://tests.python-zeep.org/}container")
+    choice = schema.get_element("{http://tests.python-zeep.org/}choice")
+
+    plan = container.type._parse_plan
+    assert [step[0] for step in plan.steps] == ["id", "item", "tag", "active"]
+    assert plan.lists == ["item", "tag"]
+    assert choice.type._parse_plan is None
+
+
+def test_parse():
+    schema = get_schema()
+    result = parse(schema, CONTAINER)
+    expected = parse(get_schema(), CONTAINER, plan=False)
+
+    assert serialize_object(result) == serialize_object(expected)
+    assert result.id == 1
+    assert result.version == 2
+    assert result.item[0].price == Decimal("1.50")
+    assert result.item[1].price is None
+    assert result.tag == []
+    assert result.active is True
+
+    item_type = schema.get_type("{http://tests.python-zeep.org/}Item")
+    assert type(result.item[0]) is item_type._value_class
+
+
+def test_parse_empty_lists_are_not_shared():
+    schema = get_schema()
+    xml = """
+        <ns0:container xmlns:ns0="http://tests.python-zeep.org/">
+          <ns0:id>1</ns0:id>
+        </ns0:container>
+    """
+    first = parse(schema, xml)
+    second = parse(schema, xml)
+    assert first.item == second.item == []
+    assert first.item is not second.item
+
+
+def test_parse_unexpected_element():
+    xml = """
+        <ns0:container xmlns:ns0="http://tests.python-zeep.org/">
+          <ns0:id>1</ns0:id>
+          <ns0:unknown>foo</ns0:unknown>
+        </ns0:container>
+    """
+    with pytest.raises(exceptions.XMLParseError) as exc:
+        parse(get_schema(), xml)
+    assert exc.value.message == (
+        "Unexpected element '{http://tests.python-zeep.org/}unknown'"
+    )
+
+    result = parse(get_schema(strict=False), xml)
+    assert result.id == 1
+    assert [etree.QName(elm).localname for elm in result._raw_elements] == [
+        "unknown"
+    ]
+
+
+def test_parse_missing_element():
+    xml = """
+        <ns0:container xmlns:ns0="http://tests.python-zeep.org/">
+          <ns0:active>true</ns0:active>
+        </ns0:container>
+    """
+    with pytest.raises(exceptions.XMLParseError) as exc:
+        parse(get_schema(), xml)
+    assert exc.value.message == (
+        "Unexpected element '{http://tests.python-zeep.org/}active', "
+        "expected '{http://tests.python-zeep.org/}id'"
+    )
+
+    result = parse(get_schema(strict=False), xml)
+    assert result.id is None
+    assert result.active is True
+
+
+def test_parse_unqualified_elements():
+    xml = """
+        <ns0:container xmlns:ns0="http://tests.python-zeep.org/">
+          <id>1</id>
+          <tag>foo</tag>
+          <tag>bar</tag>
+        </ns0:container>
+    """
+    result = parse(get_schema(), xml)
+    assert result.id == 1
+    assert result.tag == ["foo", "bar"]
+
+
+def test_parse_ignore_sequence_order_uses_generic_parser():
+    xml = """
+        <ns0:container xmlns:ns0="http://tests.python-zeep.org/">
+          <ns0:active>true</ns0:active>
+          <ns0:id>1</ns0:id>
+        </ns0:container>
+    """
+    result = parse(get_schema(xsd_ignore_sequence_order=True), xml)
+    assert result.id == 1
+    assert result.active is True
@@ -0,0 +1,218 @@
+import pytest
+from lxml import etree
+
+from tests.utils import DummyTransport
+from zeep import xsd
+from zeep.settings import Settings
+from zeep.xsd.registry import registry
+
+SCHEMA_A = """
+<?xml version="1.0"?>
+<xs:schema
+    xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    xmlns:tns="http://tests.python-zeep.org/a"
+    xmlns:common="http://tests.python-zeep.org/common"
+    targetNamespace="http://tests.python-zeep.org/a"
+    elementFormDefault="qualified">
+
+  <xs:import
+      schemaLocation="http://tests.python-zeep.org/common.xsd"
+      namespace="http://tests.python-zeep.org/common"/>
+
+  <xs:element name="container" type="common:address"/>
+</xs:schema>
+""".strip()
+
+SCHEMA_COMMON = """
+<?xml version="1.0"?>
+<xs:schema
+    xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    xmlns:tns="http://tests.python-zeep.org/common"
+    targetNamespace="http://tests.python-zeep.org/common"
+    elementFormDefault="qualified">
+
+  <xs:include schemaLocation="http://tests.python-zeep.org/common-inc.xsd"/>
+
+  <xs:complexType name="address">
+    <xs:sequence>
+      <xs:element name="street" type="xs:string"/>
+      <xs:element name="country" type="tns:country"/>
+    </xs:sequence>
+  </xs:complexType>
+</xs:schema>
+""".strip()
+
+SCHEMA_COMMON_INCLUDE = """
+<?xml version="1.0"?>
+<xs:schema
+    xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    targetNamespace="http://tests.python-zeep.org/common"
+    elementFormDefault="qualified">
+
+  <xs:simpleType name="country">
+    <xs:restriction base="xs:string"/>
+  </xs:simpleType>
+</xs:schema>
+""".strip()
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    registry.clear()
+    yield
+    registry.clear()
+
+
+@pytest.fixture
+def transport():
+    transport = DummyTransport()
+    transport.bind("http://tests.python-zeep.org/common.xsd", SCHEMA_COMMON)
+    transport.bind(
+        "http://tests.python-zeep.org/common-inc.xsd", SCHEMA_COMMON_INCLUDE
+    )
+    return transport
+
+
+def _create_schema(transport, enabled=True):
+    settings = Settings(xsd_shared_documents=enabled)
+    return xsd.Schema(
+        etree.fromstring(SCHEMA_A), transport=transport, settings=settings
+    )
+
+
+def _get_document(schema, namespace):
+    return next(iter(schema.documents.get_by_namespace(namespace, False)))
+
+
+def test_shared_documents(transport):
+    schema_1 = _create_schema(transport)
+    schema_2 = _create_schema(transport)
+    assert len(registry) == 1
+
+    namespace = "http://tests.python-zeep.org/common"
+    assert _get_document(schema_1, namespace) is _get_document(schema_2, namespace)
+    assert _get_document(
+        schema_1, "http://tests.python-zeep.org/a"
+    ) is not _get_document(schema_2, "http://tests.python-zeep.org/a")
+
+    address_type = schema_1.get_type("{%s}address" % namespace)
+    assert schema_2.get_type("{%s}address" % namespace) is address_type
+
+    container = schema_2.get_element("{http://tests.python-zeep.org/a}container")
+    assert container.type is address_type
+    value = container(street="Main street", country="NL")
+    assert value.country == "NL"
+
+
+def test_shared_documents_disabled(transport):
+    schema_1 = _create_schema(transport, enabled=False)
+    schema_2 = _create_schema(transport, enabled=False)
+    assert len(registry) == 0
+
+    namespace = "http://tests.python-zeep.org/common"
+    assert _get_document(schema_1, namespace) is not _get_document(
+        schema_2, namespace
+    )
+
+
+def test_shared_documents_changed_include(transport, monkeypatch):
+    monkeypatch.setattr(registry, "verify_interval", 0)
+    schema_1 = _create_schema(transport)
+
+    transport.bind(
+        "http://tests.python-zeep.org/common-inc.xsd",
+        SCHEMA_COMMON_INCLUDE.replace("xs:string", "xs:token"),
+    )
+    schema_2 = _create_schema(transport)
+
+    namespace = "http://tests.python-zeep.org/common"
+    assert _get_document(schema_1, namespace) is not _get_document(
+        schema_2, namespace
+    )
+    country_type = schema_2.get_type("{%s}country" % namespace)
+    assert country_type.name == "country"
+    assert len(registry) == 1
+
+
+def test_shared_documents_changed_content(transport):
+    schema_1 = _create_schema(transport)
+
+    transport.bind(
+        "http://tests.python-zeep.org/common.xsd",
+        SCHEMA_COMMON.replace('name="street"', 'name="road"'),
+    )
+    schema_2 = _create_schema(transport)
+
+    namespace = "http://tests.python-zeep.org/common"
+    assert _get_document(schema_1, namespace) is not _get_document(
+        schema_2, namespace
+    )
+    assert len(registry) == 2
+
+
+def test_shared_documents_verify_interval(transport, monkeypatch):
+    schema_1 = _create_schema(transport)
+    namespace = "http://tests.python-zeep.org/common"
+
+    # The included document is not loaded again within the verify_interval
+    loaded = []
+    load = transport.load
+
+    def recording_load(url):
+        loaded.append(url)
+        return load(url)
+
+    monkeypatch.setattr(transport, "load", recording_load)
+    schema_2 = _create_schema(transport)
+    assert loaded == ["http://tests.python-zeep.org/common.xsd"]
+    assert _get_document(schema_1, namespace) is _get_document(schema_2, namespace)
+
+    monkeypatch.setattr(registry, "verify_interval", None)
+    schema_3 = _create_schema(transport)
+    assert _get_document(schema_1, namespace) is _get_document(schema_3, namespace)
+
+    # Once the interval is passed the included document is verified again
+    loaded.clear()
+    monkeypatch.setattr(registry, "verify_interval", 0)
+    schema_4 = _create_schema(transport)
+    assert loaded == [
+        "http://tests.python-zeep.org/common.xsd",
+        "http://tests.python-zeep.org/common-inc.xsd",
+    ]
+    assert _get_document(schema_1, namespace) is _get_document(schema_4, namespace)
+
+
+def test_shared_documents_not_self_contained():
+    # The imported document refers to a type of the importing document
+    # without importing it, so it can't be used in other schemas.
+    transport = DummyTransport()
+    transport.bind(
+        "http://tests.python-zeep.org/common.xsd",
+        """
+        <?xml version="1.0"?>
+        <xs:schema
+            xmlns:xs="http://www.w3.org/2001/XMLSchema"
+            xmlns:a="http://tests.python-zeep.org/a"
+            targetNamespace="http://tests.python-zeep.org/common"
+            elementFormDefault="qualified">
+          <xs:complexType name="address">
+            <xs:sequence>
+              <xs:element name="street" type="a:street"/>
+            </xs:sequence>
+          </xs:complexType>
+        </xs:schema>
+        """.strip(),
+    )
+    node = etree.fromstring(
+        SCHEMA_A.replace(
+            '<xs:element name="container"',
+            '<xs:simpleType name="street">'
+            '<xs:restriction base="xs:string"/></xs:simpleType>'
+            '<xs:element name="container"',
+        )
+    )
+    schema = xsd.Schema(
+        node, transport=transport, settings=Settings(xsd_shared_documents=True)
+    )
+    assert schema.get_element("{http://tests.python-zeep.org/a}container")
+    assert len(registry) == 0